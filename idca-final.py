@@ -7,18 +7,23 @@ Türkçe karakter desteği ve tablo veri girişi ile
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
-import pandas as pd
+from tkinter import font as tkfont
 import numpy as np
 import json
 import os
+import hashlib
+import heapq
 from datetime import datetime
 import warnings
 import sys
 import locale
+import multiprocessing
+import queue
+import threading
+import copy
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 # Türkçe karakter encoding ayarları
 if sys.platform.startswith('win'):
@@ -28,40 +33,63 @@ else:
 
 warnings.filterwarnings('ignore')
 
-# Matplotlib Türkçe karakter desteği - GÜNCELLENDİ
-plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma', 'sans-serif']
-plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma']
-plt.rcParams['axes.unicode_minus'] = False
-plt.rcParams['pdf.fonttype'] = 42
-plt.rcParams['ps.fonttype'] = 42
 
-# Matplotlib backend ayarı
-import matplotlib
-matplotlib.use('TkAgg')
+@lru_cache(maxsize=None)
+def _configure_matplotlib():
+    """matplotlib'i ilk kullanımda yükle ve ayarla (bir kez çalışır)
+    
+    matplotlib'in yüklenmesi (yazı tipi önbelleği vb.) pencerenin
+    açılmasını geciktirmesin diye modül düzeyinde içe aktarılmaz.
+    """
+    import matplotlib
+    
+    # Matplotlib backend ayarı
+    matplotlib.use('TkAgg')
+    
+    # Matplotlib Türkçe karakter desteği - GÜNCELLENDİ
+    matplotlib.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma', 'sans-serif']
+    matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma']
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    matplotlib.rcParams['pdf.fonttype'] = 42
+    matplotlib.rcParams['ps.fonttype'] = 42
+
+
+# Numba opsiyonel - çok büyük tablolarda sınıflandırmayı hızlandırır
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Pillow opsiyonel - tabloların matplotlib'siz hızlı çizimi için
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
 
 class TableEntry(ttk.Frame):
-    """Tablo şeklinde veri girişi için özel widget"""
-    def __init__(self, parent, columns, rows=10, **kwargs):
+    """Tablo şeklinde veri girişi için özel widget
+    
+    column_widgets: {sütun: fabrika(parent)} - bu sütunlarda Entry yerine
+    fabrikanın oluşturduğu widget (örn. Combobox) kullanılır.
+    """
+    def __init__(self, parent, columns, rows=10, column_widgets=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.columns = columns
         self.rows = rows
+        self.column_widgets = column_widgets or {}
         self.entries = []
         
         # Başlıklar
         for j, col in enumerate(columns):
-            label = ttk.Label(self, text=col, font=('Arial', 10, 'bold'),
+            label = ttk.Label(self, text=col, font='IDCA.Bold',
                             background='#2c3e50', foreground='white')
             label.grid(row=0, column=j, sticky='ew', padx=1, pady=1)
         
         # Giriş hücreleri
         for i in range(1, rows + 1):
-            row_entries = []
-            for j in range(len(columns)):
-                entry = ttk.Entry(self, font=('Arial', 10))
-                entry.grid(row=i, column=j, sticky='ew', padx=1, pady=1)
-                row_entries.append(entry)
-            self.entries.append(row_entries)
+            self.entries.append(self._create_row(i))
         
         # Grid ağırlıkları
         for j in range(len(columns)):
@@ -76,6 +104,22 @@ class TableEntry(ttk.Frame):
                 data.append(row_data)
         return data
     
+    def iter_data(self, key_column=0, max_blank=2):
+        """Anahtar sütunu dolu satırları sırayla üret
+        
+        Tablolar yukarıdan aşağı doldurulduğu için anahtar sütunu art arda
+        max_blank satır boş kalınca kalan satırlar okunmaz.
+        """
+        blank = 0
+        for row in self.entries:
+            if not row[key_column].get().strip():
+                blank += 1
+                if blank >= max_blank:
+                    return
+                continue
+            blank = 0
+            yield [entry.get().strip() for entry in row]
+    
     def set_data(self, data):
         """Tabloya veri yükle"""
         for i, row_data in enumerate(data):
@@ -91,15 +135,72 @@ class TableEntry(ttk.Frame):
             for entry in row:
                 entry.delete(0, tk.END)
     
-    def add_row(self):
-        """Yeni satır ekle"""
+    def _create_row(self, row_num):
+        """Bir satırın hücrelerini oluştur"""
         row_entries = []
-        row_num = len(self.entries) + 1
         for j in range(len(self.columns)):
-            entry = ttk.Entry(self, font=('Arial', 10))
+            factory = self.column_widgets.get(j)
+            entry = factory(self) if factory else ttk.Entry(self, font='IDCA.Body')
             entry.grid(row=row_num, column=j, sticky='ew', padx=1, pady=1)
             row_entries.append(entry)
-        self.entries.append(row_entries)
+        return row_entries
+    
+    def add_row(self):
+        """Yeni satır ekle"""
+        self.entries.append(self._create_row(len(self.entries) + 1))
+
+# Tuş vuruşlarından sonra hesaplamaların bekleme süresi (ms)
+CALC_DELAY_MS = 120
+
+# Bellekte tutulan en fazla önizleme figure sayısı
+PREVIEW_CACHE_SIZE = 8
+
+# Önizleme çözünürlüğü - dışa aktarma DPI'ı Ayarlar sekmesinden okunur
+PREVIEW_DPI = 80
+
+# Görseller: dosya adı, VisualRenderer metodu ve kullandığı veri bölümleri
+VISUAL_SPECS = (
+    ('Figure_1_Test_Uygunluk', 'generate_figure1', ('test_results', 'general')),
+    ('Figure_2_Test_Durumu', 'generate_figure2', ('test_results', 'mitre_tactics', 'general')),
+    ('Table_1_Sonuc_Degerlendirme', 'generate_table1', ('test_results', 'general')),
+    ('Table_2_MITRE_Kapsama', 'generate_table2', ('mitre_tactics', 'general')),
+    ('Table_3_Tetiklenen_Kurallar', 'generate_table3', ('triggered_rules', 'general')),
+    ('Table_4_Algilanamayan_Teknikler', 'generate_table4', ('undetected_techniques',)),
+    ('Table_5_Oneriler', 'generate_table5', ('recommendations', 'general'))
+)
+
+# Tablo satırının temel yüksekliği (inç): ax.table'ın 10 puntoluk metin için
+# kullandığı yükseklik; tablolar bunu satır ölçeğiyle çarpar
+TABLE_ROW_UNIT = 10 / 72 * 1.2
+
+# Tema listesi (modül seviyesinde bir kez oluşturulur)
+THEMES = {
+    'Varsayılan': {
+        'primary': '#0F172A', 'secondary': '#1E293B', 'accent': '#00D9FF',
+        'accent_secondary': '#7C3AED', 'success': '#10B981', 'warning': '#F59E0B',
+        'danger': '#EF4444', 'dark': '#020617', 'light': '#F8FAFC', 'gray': '#64748B'
+    },
+    'Profesyonel': {
+        'primary': '#1a1a2e', 'secondary': '#16213e', 'accent': '#0f3460',
+        'accent_secondary': '#533483', 'success': '#53c653', 'warning': '#e94560',
+        'danger': '#ff1744', 'dark': '#0f0f0f', 'light': '#eaeaea', 'gray': '#7a7a7a'
+    },
+    'Modern': {
+        'primary': '#2d3436', 'secondary': '#636e72', 'accent': '#00b894',
+        'accent_secondary': '#6c5ce7', 'success': '#55efc4', 'warning': '#fdcb6e',
+        'danger': '#ff7675', 'dark': '#2d3436', 'light': '#dfe6e9', 'gray': '#b2bec3'
+    },
+    'Klasik': {
+        'primary': '#2c3e50', 'secondary': '#34495e', 'accent': '#3498db',
+        'accent_secondary': '#9b59b6', 'success': '#2ecc71', 'warning': '#f39c12',
+        'danger': '#e74c3c', 'dark': '#1a1a1a', 'light': '#ecf0f1', 'gray': '#95a5a6'
+    },
+    'Açık': {
+        'primary': '#ffffff', 'secondary': '#f5f5f5', 'accent': '#2196F3',
+        'accent_secondary': '#673AB7', 'success': '#4CAF50', 'warning': '#FF9800',
+        'danger': '#F44336', 'dark': '#ffffff', 'light': '#212121', 'gray': '#757575'
+    }
+}
 
 class IDCAFixedFinal:
     def __init__(self, root):
@@ -115,55 +216,30 @@ class IDCAFixedFinal:
         y = (screen_height - window_height) // 2
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
-        # Türkçe karakter için encoding
-        self.root.option_add('*Font', 'Arial 10')
+        # Widget'ların paylaştığı adlandırılmış yazı tipleri
+        self.create_fonts()
         
         # Tema renkleri ve şeffaf arkaplan seçeneği
         self.transparent_bg = tk.BooleanVar(value=True)  # Varsayılan şeffaf
+        self.use_pil_tables = tk.BooleanVar(value=False)
         self.current_theme = 'Varsayılan'
         
         # Varsayılan tema
-        self.colors = {
-            'primary': '#0F172A',
-            'secondary': '#1E293B',
-            'accent': '#00D9FF',
-            'accent_secondary': '#7C3AED',
-            'success': '#10B981',
-            'warning': '#F59E0B',
-            'danger': '#EF4444',
-            'dark': '#020617',
-            'light': '#F8FAFC',
-            'gray': '#64748B'
-        }
+        self.colors = THEMES['Varsayılan'].copy()
+        self.themes = THEMES
+        self.theme_names = list(THEMES)
         
-        # Tema listesi
-        self.themes = {
-            'Varsayılan': {
-                'primary': '#0F172A', 'secondary': '#1E293B', 'accent': '#00D9FF',
-                'accent_secondary': '#7C3AED', 'success': '#10B981', 'warning': '#F59E0B',
-                'danger': '#EF4444', 'dark': '#020617', 'light': '#F8FAFC', 'gray': '#64748B'
-            },
-            'Profesyonel': {
-                'primary': '#1a1a2e', 'secondary': '#16213e', 'accent': '#0f3460',
-                'accent_secondary': '#533483', 'success': '#53c653', 'warning': '#e94560',
-                'danger': '#ff1744', 'dark': '#0f0f0f', 'light': '#eaeaea', 'gray': '#7a7a7a'
-            },
-            'Modern': {
-                'primary': '#2d3436', 'secondary': '#636e72', 'accent': '#00b894',
-                'accent_secondary': '#6c5ce7', 'success': '#55efc4', 'warning': '#fdcb6e',
-                'danger': '#ff7675', 'dark': '#2d3436', 'light': '#dfe6e9', 'gray': '#b2bec3'
-            },
-            'Klasik': {
-                'primary': '#2c3e50', 'secondary': '#34495e', 'accent': '#3498db',
-                'accent_secondary': '#9b59b6', 'success': '#2ecc71', 'warning': '#f39c12',
-                'danger': '#e74c3c', 'dark': '#1a1a1a', 'light': '#ecf0f1', 'gray': '#95a5a6'
-            },
-            'Açık': {
-                'primary': '#ffffff', 'secondary': '#f5f5f5', 'accent': '#2196F3',
-                'accent_secondary': '#673AB7', 'success': '#4CAF50', 'warning': '#FF9800',
-                'danger': '#F44336', 'dark': '#ffffff', 'light': '#212121', 'gray': '#757575'
-            }
-        }
+        # Ertelenmiş hesaplamaların after id'leri
+        self._stats_after_id = None
+        self._mitre_after_id = None
+        
+        # Sayı alanları Tk'nın validatecommand'ı ile doğrulanır
+        self._vc_count = (self.root.register(_is_count_text), '%P')
+        self._vc_percent = (self.root.register(_is_percent_text), '%P')
+        
+        # Son gösterilen değerler - değişmeyen hücreler yeniden yazılmaz
+        self._last_test_values = None
+        self._last_mitre = {}
         
         # Veri yapısı
         self.init_data()
@@ -185,11 +261,32 @@ class IDCAFixedFinal:
             'recommendations': []
         }
     
+    def create_fonts(self):
+        """Adlandırılmış yazı tiplerini bir kez oluştur
+        
+        Widget'lar yazı tipini adıyla kullanır; Tk her widget için
+        (aile, boyut, stil) demetini yeniden ayrıştırmaz.
+        """
+        specs = {
+            'IDCA.Small': dict(size=9),
+            'IDCA.Body': dict(size=10),
+            'IDCA.Bold': dict(size=10, weight='bold'),
+            'IDCA.Italic': dict(size=10, slant='italic'),
+            'IDCA.Hint': dict(size=8, slant='italic'),
+            'IDCA.Large': dict(size=11),
+            'IDCA.Title': dict(size=12),
+            'IDCA.Header': dict(size=12, weight='bold')
+        }
+        # Font nesneleri silinirse Tk tarafındaki yazı tipi de silinir
+        self.fonts = {name: tkfont.Font(root=self.root, name=name, family='Arial', **spec)
+                      for name, spec in specs.items()}
+    
     def create_gui(self):
         """Ana GUI oluştur"""
         # Stil ayarları
         style = ttk.Style()
         style.theme_use('clam')
+        style.configure('.', font='IDCA.Body')
         
         # Ana container
         main_frame = ttk.Frame(self.root)
@@ -224,24 +321,20 @@ class IDCAFixedFinal:
         toolbar = ttk.Frame(parent)
         toolbar.pack(fill=tk.X, pady=(0, 5))
         
-        # Butonlar
-        buttons = [
-            ("📖 Kılavuz", self.show_guide),
-            ("📁 Yükle", self.load_json),
-            ("💾 Kaydet", self.save_json),
-            ("📊 Örnek Veri", self.load_sample_data),
-            ("🎨 GÖRSELLER OLUŞTUR", self.generate_all),
-            ("🔄 Yenile", self.refresh_preview),
-            ("🗑️ Temizle", self.clear_all)
-        ]
+        # Butonlar (metin, komut, stil) - ana buton vurgulu stille oluşturulur
+        buttons = (
+            ("📖 Kılavuz", self.show_guide, None),
+            ("📁 Yükle", self.load_json, None),
+            ("💾 Kaydet", self.save_json, None),
+            ("📊 Örnek Veri", self.load_sample_data, None),
+            ("🎨 GÖRSELLER OLUŞTUR", self.generate_all, 'Success.TButton'),
+            ("🔄 Yenile", self.refresh_preview, None),
+            ("🗑️ Temizle", self.clear_all, None)
+        )
         
-        for text, command in buttons:
-            btn = ttk.Button(toolbar, text=text, command=command)
-            btn.pack(side=tk.LEFT, padx=2)
-            
-            # Ana buton vurgulama
-            if "GÖRSELLER" in text:
-                btn.configure(style='Success.TButton')
+        for text, command, style in buttons:
+            ttk.Button(toolbar, text=text, command=command,
+                       **({'style': style} if style else {})).pack(side=tk.LEFT, padx=2)
     
     def create_data_panel(self, parent):
         """Sol panel - Veri girişi sekmeli yapı"""
@@ -249,28 +342,63 @@ class IDCAFixedFinal:
         self.notebook = ttk.Notebook(parent)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Sekmeler
-        self.tab_general = self.create_general_tab()
-        self.tab_test = self.create_test_tab()
-        self.tab_mitre = self.create_mitre_tab()
-        self.tab_rules = self.create_rules_tab()
-        self.tab_recommendations = self.create_recommendations_tab()
-        self.tab_settings = self.create_settings_tab()
+        # Sekmeler - içerikleri ilk açıldıklarında oluşturulur
+        self._tab_builders = {}
+        self.tab_general = self._add_tab("1. Genel Bilgiler", self.create_general_tab)
+        self.tab_test = self._add_tab("2. Test Sonuçları", self.create_test_tab)
+        self.tab_mitre = self._add_tab("3. MITRE ATT&CK", self.create_mitre_tab)
+        self.tab_rules = self._add_tab("4. Kurallar", self.create_rules_tab)
+        self.tab_recommendations = self._add_tab("5. Öneriler", self.create_recommendations_tab)
+        self.tab_settings = self._add_tab("⚙️ Ayarlar", self.create_settings_tab)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._ensure_tab(0)
     
-    def create_general_tab(self):
-        """Genel bilgiler sekmesi"""
+    def _add_tab(self, text, builder):
+        """Boş sekme ekle; içeriği oluşturacak fonksiyonu kaydet"""
         tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="1. Genel Bilgiler")
-        
+        self.notebook.add(tab, text=text)
+        self._tab_builders[self.notebook.index(tab)] = (builder, tab)
+        return tab
+    
+    def _ensure_tab(self, index):
+        """Sekme içeriği henüz oluşturulmadıysa oluştur"""
+        entry = self._tab_builders.pop(index, None)
+        if entry is not None:
+            builder, tab = entry
+            builder(tab)
+    
+    def _build_all_tabs(self):
+        """Tüm sekmeleri oluştur (form verisine erişmeden önce çağrılır)"""
+        for index in list(self._tab_builders):
+            self._ensure_tab(index)
+    
+    def _on_tab_changed(self, event=None):
+        self._ensure_tab(self.notebook.index(self.notebook.select()))
+    
+    def create_general_tab(self, tab):
+        """Genel bilgiler sekmesi"""
         # Scrollable frame
         canvas = tk.Canvas(tab, bg='white')
         scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Oluşturma sırasında art arda gelen <Configure> olayları tek
+        # scrollregion güncellemesine birleşir; bbox değişmediyse yazılmaz
+        scroll_state = {'after_id': None, 'bbox': None}
+        
+        def update_scrollregion():
+            scroll_state['after_id'] = None
+            bbox = canvas.bbox("all")
+            if bbox != scroll_state['bbox']:
+                scroll_state['bbox'] = bbox
+                canvas.configure(scrollregion=bbox)
+        
+        def on_configure(event):
+            if scroll_state['after_id'] is None:
+                scroll_state['after_id'] = canvas.after_idle(update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", on_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -281,7 +409,7 @@ class IDCAFixedFinal:
         
         # Bilgi
         info = ttk.Label(frame, text="ℹ️ Türkçe karakterler desteklenmektedir. Tüm alanları doldurun.",
-                        foreground='blue', font=('Arial', 9))
+                        foreground='blue', font='IDCA.Small')
         info.grid(row=0, column=0, columnspan=3, pady=(0, 10), sticky='w')
         
         # Form alanları
@@ -296,14 +424,14 @@ class IDCAFixedFinal:
         
         self.general_entries = {}
         for i, (label, key, hint) in enumerate(fields, 1):
-            ttk.Label(frame, text=label, font=('Arial', 10)).grid(
+            ttk.Label(frame, text=label, font='IDCA.Body').grid(
                 row=i, column=0, sticky='w', pady=5)
             
-            entry = ttk.Entry(frame, width=35, font=('Arial', 10))
+            entry = ttk.Entry(frame, width=35, font='IDCA.Body')
             entry.grid(row=i, column=1, pady=5, padx=10, sticky='ew')
             
             ttk.Label(frame, text=hint, foreground='gray',
-                     font=('Arial', 8, 'italic')).grid(
+                     font='IDCA.Hint').grid(
                 row=i, column=2, sticky='w', padx=5)
             
             self.general_entries[key] = entry
@@ -312,14 +440,9 @@ class IDCAFixedFinal:
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        return tab
     
-    def create_test_tab(self):
+    def create_test_tab(self, tab):
         """Test sonuçları sekmesi"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="2. Test Sonuçları")
-        
         # Ana frame
         main_frame = ttk.Frame(tab)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -333,7 +456,7 @@ class IDCAFixedFinal:
 • Tetiklenen: Başarıyla alarm üretenler
 • Diğer değerler otomatik hesaplanır"""
         
-        ttk.Label(info_frame, text=info_text, font=('Arial', 9)).pack()
+        ttk.Label(info_frame, text=info_text, font='IDCA.Small').pack()
         
         # Veri girişi
         entry_frame = ttk.LabelFrame(main_frame, text="Test Verileri", padding=15)
@@ -347,12 +470,13 @@ class IDCAFixedFinal:
         
         self.test_entries = {}
         for i, (label, key) in enumerate(fields):
-            ttk.Label(entry_frame, text=label, font=('Arial', 10, 'bold')).grid(
+            ttk.Label(entry_frame, text=label, font='IDCA.Bold').grid(
                 row=i, column=0, sticky='w', pady=8)
             
-            entry = ttk.Entry(entry_frame, width=15, font=('Arial', 11))
+            entry = ttk.Entry(entry_frame, width=15, font='IDCA.Large',
+                              validate='key', validatecommand=self._vc_count)
             entry.grid(row=i, column=1, pady=8, padx=10)
-            entry.bind('<KeyRelease>', self.calculate_stats)
+            entry.bind('<KeyRelease>', self._schedule_stats)
             
             self.test_entries[key] = entry
         
@@ -372,22 +496,17 @@ class IDCAFixedFinal:
             row = i // 2
             col = (i % 2) * 2
             
-            ttk.Label(calc_frame, text=label, font=('Arial', 10)).grid(
+            ttk.Label(calc_frame, text=label, font='IDCA.Body').grid(
                 row=row, column=col, sticky='w', pady=5, padx=5)
             
             value_label = ttk.Label(calc_frame, text="0",
-                                   font=('Arial', 12, 'bold'), foreground='blue')
+                                   font='IDCA.Header', foreground='blue')
             value_label.grid(row=row, column=col+1, pady=5, padx=10)
             
             self.calc_labels[key] = value_label
-        
-        return tab
     
-    def create_mitre_tab(self):
+    def create_mitre_tab(self, tab):
         """MITRE ATT&CK sekmesi - TABLO GİRİŞİ"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="3. MITRE ATT&CK")
-        
         # Ana frame
         main_frame = ttk.Frame(tab)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -395,7 +514,7 @@ class IDCAFixedFinal:
         # Bilgi
         info = ttk.Label(main_frame, 
                         text="Her satıra bir taktik girin. Test ve tetiklenen sayılarını yazın.",
-                        font=('Arial', 9), foreground='blue')
+                        font='IDCA.Small', foreground='blue')
         info.pack(pady=5)
         
         # Tablo frame
@@ -404,7 +523,10 @@ class IDCAFixedFinal:
         
         # Tablo widget
         columns = ['Taktik Adı', 'Test Edilen', 'Tetiklenen', 'Başarı %']
-        self.mitre_table = TableEntry(table_frame, columns, rows=12)
+        count_entry = lambda parent: ttk.Entry(parent, font='IDCA.Body', validate='key',
+                                               validatecommand=self._vc_count)
+        self.mitre_table = TableEntry(table_frame, columns, rows=12,
+                                      column_widgets={1: count_entry, 2: count_entry})
         self.mitre_table.pack(fill=tk.BOTH, expand=True)
         
         # Varsayılan taktikler
@@ -429,27 +551,25 @@ class IDCAFixedFinal:
                 self.mitre_table.entries[i][0].insert(0, row[0])
                 self.mitre_table.entries[i][0].config(state='readonly')
         
-        # Otomatik hesaplama için binding
+        # Otomatik hesaplama için binding - sayı hücreleri ortak bindtag'i paylaşır
         for row in self.mitre_table.entries:
-            row[1].bind('<KeyRelease>', lambda e: self.calculate_mitre_rates())
-            row[2].bind('<KeyRelease>', lambda e: self.calculate_mitre_rates())
+            for entry in row[1:3]:
+                entry.bindtags(entry.bindtags() + ('MitreNumeric',))
+        self.root.bind_class('MitreNumeric', '<KeyRelease>', self._schedule_mitre_rates)
         
         # Butonlar
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=10)
         
+        # Buton tüm satırları yeniden yazar; elle düzenlenmiş oranlar da düzelir
         ttk.Button(button_frame, text="Başarı Oranlarını Hesapla",
-                  command=self.calculate_mitre_rates).pack(side=tk.LEFT, padx=5)
+                  command=lambda: (self._last_mitre.clear(),
+                                   self.calculate_mitre_rates())).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Tabloyu Temizle",
                   command=self.clear_mitre_table).pack(side=tk.LEFT, padx=5)
-        
-        return tab
     
-    def create_rules_tab(self):
+    def create_rules_tab(self, tab):
         """Kurallar sekmesi - TABLO GİRİŞİ"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="4. Kurallar")
-        
         # İki panel için notebook
         rules_notebook = ttk.Notebook(tab)
         rules_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -459,11 +579,14 @@ class IDCAFixedFinal:
         rules_notebook.add(triggered_tab, text="✅ Tetiklenen Kurallar")
         
         ttk.Label(triggered_tab, text="Başarıyla tetiklenen kurallar (Table 3)",
-                 font=('Arial', 9), foreground='green').pack(pady=5)
+                 font='IDCA.Small', foreground='green').pack(pady=5)
         
         # Tablo
         columns = ['Kural Adı', 'MITRE ID', 'Taktik', 'Güven %']
-        self.triggered_table = TableEntry(triggered_tab, columns, rows=15)
+        self.triggered_table = TableEntry(triggered_tab, columns, rows=15, column_widgets={
+            3: lambda parent: ttk.Entry(parent, font='IDCA.Body', validate='key',
+                                        validatecommand=self._vc_percent)
+        })
         self.triggered_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # Algılanamayan teknikler
@@ -471,69 +594,48 @@ class IDCAFixedFinal:
         rules_notebook.add(undetected_tab, text="❌ Algılanamayan")
         
         ttk.Label(undetected_tab, text="Tespit edilemeyen teknikler (Table 4)",
-                 font=('Arial', 9), foreground='red').pack(pady=5)
+                 font='IDCA.Small', foreground='red').pack(pady=5)
         
-        # Tablo
+        # Tablo - Kritiklik sütunu doğrudan combobox olarak oluşturulur
         columns = ['MITRE ID', 'Teknik Adı', 'Taktik', 'Kritiklik']
-        self.undetected_table = TableEntry(undetected_tab, columns, rows=15)
+        self.undetected_table = TableEntry(undetected_tab, columns, rows=15, column_widgets={
+            3: lambda parent: ttk.Combobox(parent,
+                                           values=['Kritik', 'Yüksek', 'Orta', 'Düşük'],
+                                           width=10, font='IDCA.Body')
+        })
         self.undetected_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Kritiklik için dropdown ekle
-        for row in self.undetected_table.entries:
-            # Kritiklik sütununu combobox yap
-            combo = ttk.Combobox(self.undetected_table, 
-                                values=['Kritik', 'Yüksek', 'Orta', 'Düşük'],
-                                width=10, font=('Arial', 10))
-            combo.grid(row=self.undetected_table.entries.index(row)+1, 
-                      column=3, sticky='ew', padx=1, pady=1)
-            row[3].destroy()
-            row[3] = combo
-        
-        return tab
     
-    def create_recommendations_tab(self):
+    def create_recommendations_tab(self, tab):
         """Öneriler sekmesi - TABLO GİRİŞİ"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="5. Öneriler")
-        
         # Ana frame
         main_frame = ttk.Frame(tab)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         ttk.Label(main_frame, text="Öneri listesi (Table 5)",
-                 font=('Arial', 9), foreground='blue').pack(pady=5)
+                 font='IDCA.Small', foreground='blue').pack(pady=5)
         
-        # Tablo
+        # Tablo - Kategori sütunu doğrudan combobox olarak oluşturulur
         columns = ['Öncelik', 'Kategori', 'Öneri Metni']
-        self.recommendations_table = TableEntry(main_frame, columns, rows=10)
+        self.recommendations_table = TableEntry(main_frame, columns, rows=10, column_widgets={
+            1: lambda parent: ttk.Combobox(parent,
+                                           values=['Log Kaynakları', 'Kural Optimizasyonu',
+                                                   'Yeni Kurallar', 'UEBA/SIEM', 'Test Döngüsü',
+                                                   'Eğitim', 'Otomasyon', 'Diğer'],
+                                           width=15, font='IDCA.Body')
+        })
         self.recommendations_table.pack(fill=tk.BOTH, expand=True)
         
         # Öncelik otomatik doldur
         for i, row in enumerate(self.recommendations_table.entries):
             row[0].insert(0, f"P{i+1}")
             row[0].config(state='readonly')
-            
-            # Kategori için dropdown
-            combo = ttk.Combobox(self.recommendations_table,
-                                values=['Log Kaynakları', 'Kural Optimizasyonu', 
-                                       'Yeni Kurallar', 'UEBA/SIEM', 'Test Döngüsü',
-                                       'Eğitim', 'Otomasyon', 'Diğer'],
-                                width=15, font=('Arial', 10))
-            combo.grid(row=i+1, column=1, sticky='ew', padx=1, pady=1)
-            row[1].destroy()
-            row[1] = combo
         
         # Satır ekleme butonu
         ttk.Button(main_frame, text="➕ Yeni Satır Ekle",
                   command=self.add_recommendation_row).pack(pady=10)
-        
-        return tab
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, tab):
         """Ayarlar sekmesi"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="⚙️ Ayarlar")
-        
         # Görsel ayarları
         visual_frame = ttk.LabelFrame(tab, text="Görsel Ayarları", padding=15)
         visual_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -558,7 +660,12 @@ class IDCAFixedFinal:
         # Şeffaf arkaplan seçeneği
         ttk.Checkbutton(visual_frame, text="Şeffaf Arkaplan (Word için önerilen)",
                        variable=self.transparent_bg,
-                       command=self.update_preview).grid(row=3, column=0, columnspan=2, pady=10)
+                       command=self.schedule_preview).grid(row=3, column=0, columnspan=2, pady=10)
+        
+        # Pillow ile tablo çizimi (kuruluysa)
+        ttk.Checkbutton(visual_frame, text="Tabloları Pillow ile çiz (daha hızlı)",
+                       variable=self.use_pil_tables,
+                       state='normal' if Image is not None else 'disabled').grid(row=4, column=0, columnspan=2, pady=5)
         
         # Tema ayarları
         theme_frame = ttk.LabelFrame(tab, text="Tema Seçimi", padding=15)
@@ -567,7 +674,7 @@ class IDCAFixedFinal:
         # Tema listesi
         ttk.Label(theme_frame, text="Hazır Temalar:").grid(row=0, column=0, sticky='w', pady=5)
         
-        self.theme_combo = ttk.Combobox(theme_frame, values=list(self.themes.keys()), width=20)
+        self.theme_combo = ttk.Combobox(theme_frame, values=self.theme_names, width=20)
         self.theme_combo.set(self.current_theme)
         self.theme_combo.grid(row=0, column=1, padx=10, pady=5)
         self.theme_combo.bind('<<ComboboxSelected>>', lambda e: self.apply_theme())
@@ -606,15 +713,14 @@ class IDCAFixedFinal:
         
         ttk.Button(save_frame, text="📁 Seç",
                   command=self.select_folder).grid(row=0, column=2)
-        
-        return tab
     
     def apply_theme(self):
         """Seçili temayı uygula"""
         selected_theme = self.theme_combo.get()
-        if selected_theme in self.themes:
+        theme = THEMES.get(selected_theme)
+        if theme:
             self.current_theme = selected_theme
-            self.colors = self.themes[selected_theme].copy()
+            self.colors.update(theme)
             
             # Renk önizlemelerini güncelle
             for key, label in self.color_labels.items():
@@ -622,9 +728,9 @@ class IDCAFixedFinal:
                     label.config(bg=self.colors[key])
             
             # Önizlemeyi güncelle
-            self.update_preview()
+            self.schedule_preview()
             
-            self.status_label.config(text=f"✅ {selected_theme} teması uygulandı", foreground='green')
+            self.set_status(f"✅ {selected_theme} teması uygulandı", 'green')
     
     def create_preview_panel(self, parent):
         """Sağ panel - Önizleme"""
@@ -632,7 +738,7 @@ class IDCAFixedFinal:
         header = ttk.Frame(parent)
         header.pack(fill=tk.X, padx=5, pady=5)
         
-        ttk.Label(header, text="Önizleme", font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
+        ttk.Label(header, text="Önizleme", font='IDCA.Header').pack(side=tk.LEFT)
         
         # Görsel seçimi
         self.preview_combo = ttk.Combobox(header, values=[
@@ -646,87 +752,152 @@ class IDCAFixedFinal:
         ], width=20)
         self.preview_combo.pack(side=tk.LEFT, padx=10)
         self.preview_combo.current(0)
-        self.preview_combo.bind('<<ComboboxSelected>>', lambda e: self.update_preview())
+        self.preview_combo.bind('<<ComboboxSelected>>', lambda e: self.schedule_preview())
         
         ttk.Button(header, text="🔄", command=self.update_preview, width=3).pack(side=tk.LEFT)
         
         # Önizleme alanı
         self.preview_frame = ttk.LabelFrame(parent, text="", padding=5)
         self.preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Önizleme figürleri arka plan iş parçacığında hazırlanır
+        self._preview_requests = queue.Queue()
+        self._preview_results = queue.Queue()
+        self._preview_serial = 0
+        self._preview_polling = False
+        
+        # Blit ile güncellenebilen önizleme (Figure 2 çubukları)
+        self._preview_key = None
+        self._preview_blit = None
+        
+        # Aynı olay döngüsü turundaki önizleme istekleri tek çizime birleşir
+        self._preview_idle_id = None
+        
+        # (görsel, tema, arkaplan, veri özeti) -> [figure, çubuklar, draw_event id]
+        self._preview_cache = OrderedDict()
+        
+        # Canvas ve hata etiketi bir kez oluşturulur, sonra yeniden kullanılır
+        self._preview_canvas = None
+        self._preview_error = ttk.Label(self.preview_frame, font='IDCA.Body')
+        threading.Thread(target=self._preview_worker, daemon=True).start()
     
     def create_status_bar(self, parent):
         """Durum çubuğu"""
         status_frame = ttk.Frame(parent)
         status_frame.pack(fill=tk.X, side=tk.BOTTOM, pady=(5, 0))
         
-        self.status_label = ttk.Label(status_frame, text="Hazır", font=('Arial', 9))
+        self.status_label = ttk.Label(status_frame, text="Hazır", font='IDCA.Small')
         self.status_label.pack(side=tk.LEFT, padx=10)
         
-        self.data_status = ttk.Label(status_frame, text="", font=('Arial', 9))
+        self.data_status = ttk.Label(status_frame, text="", font='IDCA.Small')
         self.data_status.pack(side=tk.RIGHT, padx=10)
+        
+        # Durum mesajları boşta kalındığında tek seferde yazılır
+        self._pending_status = None
+        self._status_idle_id = None
+    
+    def set_status(self, text, foreground=None):
+        """Durum mesajını ayarla - aynı turdaki mesajlardan sadece sonuncusu yazılır"""
+        self._pending_status = (text, foreground)
+        if self._status_idle_id is None:
+            self._status_idle_id = self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        self._status_idle_id = None
+        text, foreground = self._pending_status
+        if foreground is None:
+            self.status_label.config(text=text)
+        else:
+            self.status_label.config(text=text, foreground=foreground)
+    
+    def _schedule_stats(self, event=None):
+        """calculate_stats'ı yazma duraklayana kadar ertele"""
+        if self._stats_after_id:
+            self.root.after_cancel(self._stats_after_id)
+        self._stats_after_id = self.root.after(CALC_DELAY_MS, self.calculate_stats)
+    
+    def _schedule_mitre_rates(self, event=None):
+        """calculate_mitre_rates'i yazma duraklayana kadar ertele"""
+        if self._mitre_after_id:
+            self.root.after_cancel(self._mitre_after_id)
+        self._mitre_after_id = self.root.after(CALC_DELAY_MS, self.calculate_mitre_rates)
     
     def calculate_stats(self, event=None):
         """Test istatistiklerini hesapla"""
-        try:
-            total = int(self.test_entries['total_rules'].get() or 0)
-            tested = int(self.test_entries['tested_rules'].get() or 0)
-            triggered = int(self.test_entries['triggered_rules'].get() or 0)
-            
-            # Validasyon
-            if tested > total:
-                self.status_label.config(text="⚠️ Test edilen > Toplam olamaz!", foreground='red')
-                return
-            if triggered > tested:
-                self.status_label.config(text="⚠️ Tetiklenen > Test edilen olamaz!", foreground='red')
-                return
-            
-            # Hesaplamalar
-            not_tested = total - tested
-            failed = tested - triggered
-            success_rate = (triggered / tested * 100) if tested > 0 else 0
-            coverage_rate = (tested / total * 100) if total > 0 else 0
-            
-            # Güncelle
-            self.calc_labels['not_tested'].config(text=str(not_tested))
-            self.calc_labels['failed'].config(text=str(failed))
-            self.calc_labels['success_rate'].config(text=f"%{success_rate:.1f}")
-            self.calc_labels['coverage_rate'].config(text=f"%{coverage_rate:.1f}")
-            
-            # Renk
-            color = 'green' if success_rate >= 70 else 'orange' if success_rate >= 50 else 'red'
-            self.calc_labels['success_rate'].config(foreground=color)
-            
-            self.status_label.config(text="✅ Hesaplandı", foreground='green')
-            
-        except ValueError:
-            pass
+        self._stats_after_id = None
+        total = _to_int(self.test_entries['total_rules'].get())
+        tested = _to_int(self.test_entries['tested_rules'].get())
+        triggered = _to_int(self.test_entries['triggered_rules'].get())
+        
+        # Yazım sırasında geçici olarak sayı olmayan değerler atlanır
+        if total is None or tested is None or triggered is None:
+            return
+        
+        # Değerler son hesaplamayla aynıysa etiketler zaten güncel
+        values = (total, tested, triggered)
+        if values == self._last_test_values:
+            return
+        self._last_test_values = None
+        
+        # Validasyon
+        if tested > total:
+            self.set_status("⚠️ Test edilen > Toplam olamaz!", 'red')
+            return
+        if triggered > tested:
+            self.set_status("⚠️ Tetiklenen > Test edilen olamaz!", 'red')
+            return
+        
+        # Hesaplamalar
+        not_tested = total - tested
+        failed = tested - triggered
+        success_rate = (triggered / tested * 100) if tested > 0 else 0
+        coverage_rate = (tested / total * 100) if total > 0 else 0
+        
+        # Güncelle
+        self.calc_labels['not_tested'].config(text=str(not_tested))
+        self.calc_labels['failed'].config(text=str(failed))
+        self.calc_labels['success_rate'].config(text=f"%{success_rate:.1f}")
+        self.calc_labels['coverage_rate'].config(text=f"%{coverage_rate:.1f}")
+        
+        # Renk
+        color = 'green' if success_rate >= 70 else 'orange' if success_rate >= 50 else 'red'
+        self.calc_labels['success_rate'].config(foreground=color)
+        
+        self.set_status("✅ Hesaplandı", 'green')
+        self._last_test_values = values
     
     def calculate_mitre_rates(self):
         """MITRE başarı oranlarını hesapla"""
-        for row in self.mitre_table.entries:
-            try:
-                test = int(row[1].get() or 0)
-                triggered = int(row[2].get() or 0)
-                
-                if test > 0:
-                    rate = (triggered / test) * 100
-                    row[3].delete(0, tk.END)
-                    row[3].insert(0, f"{rate:.1f}")
-                    
-                    # Renk kodlaması
-                    if rate >= 70:
-                        row[3].config(foreground='green')
-                    elif rate >= 40:
-                        row[3].config(foreground='orange')
-                    else:
-                        row[3].config(foreground='red')
-            except:
-                pass
+        self._mitre_after_id = None
+        rows = self.mitre_table.entries
+        tests = np.fromiter((_safe_int(row[1].get()) for row in rows),
+                            dtype=np.int64, count=len(rows))
+        triggered = np.fromiter((_safe_int(row[2].get()) for row in rows),
+                                dtype=np.int64, count=len(rows))
+        
+        # Tüm satırların oranı tek seferde; testi olmayan satırlar 0 kalır
+        has_test = tests > 0
+        rates = np.divide(triggered * 100.0, tests,
+                          out=np.zeros(len(rows), dtype=np.float64), where=has_test)
         
-        self.status_label.config(text="✅ MITRE oranları hesaplandı", foreground='green')
+        # Renk kodlaması
+        colors = np.select([rates >= 70, rates >= 40], ['green', 'orange'], default='red')
+        
+        # Sadece test/tetiklenen değeri değişen satırlar yeniden yazılır
+        values = zip(tests.tolist(), triggered.tolist())
+        for i, (row, ok, rate, color, value) in enumerate(
+                zip(rows, has_test.tolist(), rates.tolist(), colors.tolist(), values)):
+            if ok and self._last_mitre.get(i) != value:
+                row[3].delete(0, tk.END)
+                row[3].insert(0, f"{rate:.1f}")
+                row[3].config(foreground=color)
+                self._last_mitre[i] = value
+        
+        self.set_status("✅ MITRE oranları hesaplandı", 'green')
     
     def clear_mitre_table(self):
         """MITRE tablosunu temizle (sadece sayıları)"""
+        self._last_mitre.clear()
         for row in self.mitre_table.entries:
             row[1].delete(0, tk.END)
             row[2].delete(0, tk.END)
@@ -760,7 +931,7 @@ Başlamak için:
 2. Ayarlar sekmesinden tema seçin
 3. 'GÖRSELLER OLUŞTUR' butonuna tıklayın
         """
-        self.status_label.config(text="Hoş geldiniz! Kılavuz için '📖 Kılavuz' butonuna tıklayın.")
+        self.set_status("Hoş geldiniz! Kılavuz için '📖 Kılavuz' butonuna tıklayın.")
     
     def show_guide(self):
         """Kullanım kılavuzu"""
@@ -768,7 +939,7 @@ Başlamak için:
         guide_window.title("📖 Kullanım Kılavuzu")
         guide_window.geometry("800x600")
         
-        text = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font=('Arial', 10))
+        text = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font='IDCA.Body')
         text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         guide_text = """
@@ -850,16 +1021,15 @@ Başarılı raporlamalar! 🚀
     
     def collect_data(self):
         """Tüm verileri topla"""
+        self._build_all_tabs()
+        
         # Genel bilgiler
         for key, entry in self.general_entries.items():
             self.data['general'][key] = entry.get()
         
         # Test sonuçları
         for key, entry in self.test_entries.items():
-            try:
-                self.data['test_results'][key] = int(entry.get() or 0)
-            except:
-                self.data['test_results'][key] = 0
+            self.data['test_results'][key] = _safe_int(entry.get())
         
         # Hesaplanmış değerler
         total = self.data['test_results'].get('total_rules', 0)
@@ -887,8 +1057,8 @@ Başarılı raporlamalar! 🚀
         
         # Tetiklenen kurallar - TABLODAN
         self.data['triggered_rules'] = []
-        for row in self.triggered_table.get_data():
-            if len(row) >= 4 and row[0]:
+        for row in self.triggered_table.iter_data(key_column=0):
+            if len(row) >= 4:
                 self.data['triggered_rules'].append({
                     'name': row[0],
                     'mitre': row[1],
@@ -898,8 +1068,8 @@ Başarılı raporlamalar! 🚀
         
         # Algılanamayan teknikler - TABLODAN
         self.data['undetected_techniques'] = []
-        for row in self.undetected_table.get_data():
-            if len(row) >= 4 and row[0]:
+        for row in self.undetected_table.iter_data(key_column=0):
+            if len(row) >= 4:
                 self.data['undetected_techniques'].append({
                     'id': row[0],
                     'name': row[1],
@@ -909,8 +1079,8 @@ Başarılı raporlamalar! 🚀
         
         # Öneriler - TABLODAN
         self.data['recommendations'] = []
-        for row in self.recommendations_table.get_data():
-            if len(row) >= 3 and row[2]:
+        for row in self.recommendations_table.iter_data(key_column=2):
+            if len(row) >= 3:
                 self.data['recommendations'].append({
                     'priority': row[0],
                     'category': row[1],
@@ -933,7 +1103,7 @@ Başarılı raporlamalar! 🚀
                     json.dump(self.data, f, ensure_ascii=False, indent=2)
                 
                 messagebox.showinfo("Başarılı", "Veriler kaydedildi!")
-                self.status_label.config(text="✅ Kaydedildi", foreground='green')
+                self.set_status("✅ Kaydedildi", 'green')
             except Exception as e:
                 messagebox.showerror("Hata", f"Kayıt hatası: {str(e)}")
     
@@ -950,12 +1120,14 @@ Başarılı raporlamalar! 🚀
                 
                 self.populate_forms()
                 messagebox.showinfo("Başarılı", "Veriler yüklendi!")
-                self.status_label.config(text="✅ Yüklendi", foreground='green')
+                self.set_status("✅ Yüklendi", 'green')
             except Exception as e:
                 messagebox.showerror("Hata", f"Yükleme hatası: {str(e)}")
     
     def populate_forms(self):
         """Yüklenen veriyi formlara doldur"""
+        self._build_all_tabs()
+        
         # Genel bilgiler
         for key, value in self.data.get('general', {}).items():
             if key in self.general_entries:
@@ -982,6 +1154,7 @@ Başarılı raporlamalar! 🚀
                 mitre_data.append([tactic, '', '', ''])
         
         self.mitre_table.set_data(mitre_data)
+        self._last_mitre.clear()
         
         # Diğer tablolar
         triggered_data = [[r['name'], r['mitre'], r['tactic'], r['confidence']] 
@@ -1042,11 +1215,13 @@ Başarılı raporlamalar! 🚀
         self.populate_forms()
         
         messagebox.showinfo("Başarılı", "Örnek veriler yüklendi!")
-        self.status_label.config(text="✅ Örnek veri yüklendi", foreground='green')
+        self.set_status("✅ Örnek veri yüklendi", 'green')
     
     def clear_all(self):
         """Tüm verileri temizle"""
         if messagebox.askyesno("Onay", "Tüm veriler silinecek. Emin misiniz?"):
+            self._build_all_tabs()
+            
             # Formları temizle
             for entry in self.general_entries.values():
                 entry.delete(0, tk.END)
@@ -1056,6 +1231,7 @@ Başarılı raporlamalar! 🚀
             
             for label in self.calc_labels.values():
                 label.config(text="0")
+            self._last_test_values = None
             
             # Tabloları temizle
             self.clear_mitre_table()
@@ -1065,7 +1241,7 @@ Başarılı raporlamalar! 🚀
             
             self.init_data()
             
-            self.status_label.config(text="✅ Temizlendi", foreground='orange')
+            self.set_status("✅ Temizlendi", 'orange')
     
     def select_folder(self):
         """Kayıt klasörü seç"""
@@ -1073,109 +1249,284 @@ Başarılı raporlamalar! 🚀
         if folder:
             self.save_path.set(folder)
     
+    def schedule_preview(self):
+        """Önizlemeyi boşta kalındığında bir kez güncelle
+        
+        Tema, arkaplan ve görsel seçimi aynı anda değişse bile tek bir
+        önizleme çizimi yapılır.
+        """
+        if self._preview_idle_id is None:
+            self._preview_idle_id = self.root.after_idle(self._run_scheduled_preview)
+    
+    def _run_scheduled_preview(self):
+        self._preview_idle_id = None
+        self.update_preview()
+    
     def update_preview(self):
-        """Önizlemeyi güncelle - TEMA DESTEKLİ"""
-        # Önizleme alanını temizle
-        for widget in self.preview_frame.winfo_children():
-            widget.destroy()
+        """Önizlemeyi güncelle - TEMA DESTEKLİ
         
-        try:
-            self.collect_data()
-            
-            # Figure oluştur
-            fig = plt.figure(figsize=(5, 4), dpi=80)
-            
-            # Şeffaf arkaplan kontrolü
-            if self.transparent_bg.get():
-                fig.patch.set_facecolor('none')
-                fig.patch.set_alpha(0)
-            else:
-                fig.patch.set_facecolor(self.colors['dark'])
-            
-            selected = self.preview_combo.get()
-            
-            if 'Figure 1' in selected:
-                self.preview_figure1(fig)
-            elif 'Figure 2' in selected:
-                self.preview_figure2(fig)
-            else:
-                self.preview_table(fig, selected)
+        Figure arka plandaki iş parçacığında oluşturulur; Tk tarafında
+        sadece hazır figure canvas'a yerleştirilir.
+        """
+        self.collect_data()
+        
+        selected = self.preview_combo.get()
+        key = (selected, self.current_theme, self.transparent_bg.get())
+        
+        # Aynı görselde sadece veriler değiştiyse figure yeniden kurulmaz
+        if not self._preview_polling and self._blit_preview(key):
+            return
+        
+        # Bu veriyle daha önce oluşturulmuş figure varsa doğrudan göster
+        digest = hashlib.blake2b(json.dumps(self.data, sort_keys=True, default=str)
+                                 .encode('utf-8')).hexdigest()
+        cache_key = (key, digest)
+        if not self._preview_polling and cache_key in self._preview_cache:
+            self._preview_cache.move_to_end(cache_key)
+            self._show_preview(key, self._preview_cache[cache_key])
+            return
+        
+        # İş parçacığına Tk nesnesi değil, verinin kopyası gönderilir
+        self._preview_serial += 1
+        self._preview_requests.put((self._preview_serial, cache_key, copy.deepcopy(self.data),
+                                    dict(self.colors)))
+        
+        if not self._preview_polling:
+            self._preview_polling = True
+            self.root.after(50, self._poll_preview)
+    
+    def _preview_worker(self):
+        """Önizleme isteklerini işle - biriken isteklerden sadece en yenisi çizilir"""
+        while True:
+            request = self._preview_requests.get()
             
-            # Canvas'a ekle
-            canvas = FigureCanvasTkAgg(fig, master=self.preview_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # matplotlib ilk önizlemede bu iş parçacığında yüklenir
+            _configure_matplotlib()
+            while True:
+                try:
+                    request = self._preview_requests.get_nowait()
+                except queue.Empty:
+                    break
             
-        except Exception as e:
-            error_label = ttk.Label(self.preview_frame,
-                                   text=f"Önizleme hatası:\n{str(e)}",
-                                   font=('Arial', 10))
-            error_label.pack(expand=True)
+            serial, cache_key, data, colors = request
+            selected, _, transparent = cache_key[0]
+            try:
+                fig, bars = self.build_preview_figure(selected, data, colors, transparent)
+                self._preview_results.put((serial, cache_key, fig, bars, None))
+            except Exception as e:
+                self._preview_results.put((serial, cache_key, None, None, e))
+    
+    def _poll_preview(self):
+        """Hazır önizlemeyi ana iş parçacığında göster"""
+        latest = None
+        while True:
+            try:
+                result = self._preview_results.get_nowait()
+            except queue.Empty:
+                break
+            if result[0] == self._preview_serial:
+                latest = result
+        
+        # En son istek henüz hazır değil - beklemeye devam
+        if latest is None:
+            self.root.after(50, self._poll_preview)
+            return
+        self._preview_polling = False
+        
+        _, cache_key, fig, bars, error = latest
+        if error is not None:
+            self._show_preview(cache_key[0], None, error)
+            return
+        
+        # Son kullanılan önizlemeler saklanır, en eskisi atılır
+        entry = [fig, bars, None]
+        self._preview_cache[cache_key] = entry
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        
+        self._show_preview(cache_key[0], entry)
+    
+    def _show_preview(self, key, entry, error=None):
+        """Önizleme figure'ını (veya hatayı) önizleme alanına yerleştir
+        
+        Widget'lar yok edilip yeniden oluşturulmaz; mevcut canvas'a
+        sadece yeni figure bağlanır.
+        """
+        self._preview_key = None
+        self._preview_blit = None
+        if error is not None:
+            if self._preview_canvas is not None:
+                self._preview_canvas.get_tk_widget().pack_forget()
+            self._preview_error.config(text=f"Önizleme hatası:\n{str(error)}")
+            self._preview_error.pack(expand=True)
+            return
+        self._preview_error.pack_forget()
+        
+        # Canvas'a ekle
+        fig, bars, draw_cid = entry
+        canvas = self._preview_canvas
+        if canvas is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            canvas = self._preview_canvas = FigureCanvasTkAgg(fig, master=self.preview_frame)
+        elif canvas.figure is not fig:
+            # Figure mevcut widget boyutuna getirilip canvas'a bağlanır
+            widget = canvas.get_tk_widget()
+            fig.set_size_inches(widget.winfo_width() / fig.dpi,
+                                widget.winfo_height() / fig.dpi, forward=False)
+            fig.set_canvas(canvas)
+            canvas.figure = fig
+        if bars is not None:
+            self._preview_key = key
+            self._preview_blit = {'canvas': canvas, 'ax': bars[0].axes,
+                                  'bars': bars, 'background': None}
+            # Callback'ler figure üzerinde tutulur; figure başına bir kez bağlanır
+            if draw_cid is None:
+                entry[2] = canvas.mpl_connect('draw_event', self._on_preview_draw)
+        canvas.draw_idle()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    
+    def _on_preview_draw(self, event):
+        """Tam çizimden sonra arka planı sakla ve animasyonlu çubukları çiz"""
+        blit = self._preview_blit
+        if blit is None or event.canvas is not blit['canvas']:
+            return
+        blit['background'] = blit['canvas'].copy_from_bbox(blit['ax'].bbox)
+        for bar in blit['bars']:
+            blit['ax'].draw_artist(bar)
+    
+    def _blit_preview(self, key):
+        """Figure 2 önizlemesinde sadece çubuk yüksekliklerini güncelle
+        
+        Saklanan eksen arka planı geri yüklenir ve yalnızca çubuklar
+        yeniden çizilir. Eksen ölçeği değişmesi gerekiyorsa False döner.
+        """
+        blit = self._preview_blit
+        if blit is None or key != self._preview_key or blit['background'] is None:
+            return False
+        
+        values = [self.data['test_results'].get('triggered_rules', 30),
+                  self.data['test_results'].get('failed', 20)]
+        ax = blit['ax']
+        if min(values) < 0 or max(values) > ax.get_ylim()[1]:
+            return False
+        
+        canvas = blit['canvas']
+        canvas.restore_region(blit['background'])
+        for bar, value in zip(blit['bars'], values):
+            bar.set_height(value)
+            ax.draw_artist(bar)
+        canvas.blit(ax.bbox)
+        
+        # Figure değişti; eski veri özetiyle önbellekte kalmamalı
+        for cache_key, entry in list(self._preview_cache.items()):
+            if entry[1] is blit['bars']:
+                del self._preview_cache[cache_key]
+        return True
+    
+    def build_preview_figure(self, selected, data, colors, transparent):
+        """Önizleme figure'ını oluştur (Tk'ya dokunmaz, iş parçacığında çalışır)
+        
+        (figure, çubuklar) döner; çubuklar blit ile güncellenebilen
+        Figure 2 çubuklarıdır, diğer görsellerde None.
+        """
+        from matplotlib.figure import Figure
+        
+        # pyplot iş parçacığı güvenli olmadığı için doğrudan Figure kullanılır
+        fig = Figure(figsize=(5, 4), dpi=PREVIEW_DPI)
+        
+        # Şeffaf arkaplan kontrolü
+        if transparent:
+            fig.patch.set_facecolor('none')
+            fig.patch.set_alpha(0)
+        else:
+            fig.patch.set_facecolor(colors['dark'])
+        
+        # Blit ile güncellenebilen çubuklar (sadece Figure 2)
+        bars = None
+        if 'Figure 1' in selected:
+            self.preview_figure1(fig, data, colors, transparent)
+        elif 'Figure 2' in selected:
+            bars = self.preview_figure2(fig, data, colors, transparent)
+        else:
+            self.preview_table(fig, selected, colors, transparent)
+        
+        # Önizlemede kenar yumuşatma gereksiz; rcParams global olduğu için
+        # rc_context yerine sadece bu figure'ın nesnelerinde kapatılır
+        for artist in fig.findobj(lambda a: hasattr(a, 'set_antialiased')):
+            artist.set_antialiased(False)
+        return fig, bars
     
-    def preview_figure1(self, fig):
+    def preview_figure1(self, fig, data, colors, transparent):
         """Figure 1 önizleme - TEMA DESTEKLİ"""
+        import matplotlib.patches as mpatches
+        
         ax = fig.add_subplot(111)
         
         # Şeffaf arkaplan kontrolü
-        if self.transparent_bg.get():
+        if transparent:
             ax.set_facecolor('none')
             ax.patch.set_alpha(0)
         else:
-            ax.set_facecolor(self.colors['primary'])
+            ax.set_facecolor(colors['primary'])
         
-        total = self.data['test_results'].get('total_rules', 100)
-        tested = self.data['test_results'].get('tested_rules', 50)
+        total = data['test_results'].get('total_rules', 100)
+        tested = data['test_results'].get('tested_rules', 50)
         not_tested = total - tested if total > tested else 0
         
         sizes = [tested, not_tested]
         labels = ['Test\nEdilmiş', 'Test\nEdilmemiş']
-        colors = [self.colors['accent_secondary'], self.colors['gray']]
+        pie_colors = [colors['accent_secondary'], colors['gray']]
         
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, 
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=pie_colors, 
                                           autopct='%1.1f%%', startangle=90,
-                                          textprops={'color': self.colors['light']})
+                                          textprops={'color': colors['light']})
         
         # Merkez daire
-        centre_circle = plt.Circle((0, 0), 0.70, 
-                                  fc='none' if self.transparent_bg.get() else self.colors['primary'],
-                                  linewidth=2, edgecolor=self.colors['accent'])
+        centre_circle = mpatches.Circle((0, 0), 0.70, 
+                                  fc='none' if transparent else colors['primary'],
+                                  linewidth=2, edgecolor=colors['accent'])
         ax.add_artist(centre_circle)
         
-        ax.set_title('Test Uygunluk', fontsize=11, color=self.colors['light'], pad=10)
+        ax.set_title('Test Uygunluk', fontsize=11, color=colors['light'], pad=10)
     
-    def preview_figure2(self, fig):
+    def preview_figure2(self, fig, data, colors, transparent):
         """Figure 2 önizleme - TEMA DESTEKLİ"""
         ax = fig.add_subplot(111)
         
         # Şeffaf arkaplan kontrolü
-        if self.transparent_bg.get():
+        if transparent:
             ax.set_facecolor('none')
             ax.patch.set_alpha(0)
         else:
-            ax.set_facecolor(self.colors['primary'])
+            ax.set_facecolor(colors['primary'])
         
-        triggered = self.data['test_results'].get('triggered_rules', 30)
-        failed = self.data['test_results'].get('failed', 20)
+        triggered = data['test_results'].get('triggered_rules', 30)
+        failed = data['test_results'].get('failed', 20)
         
+        # Çubuklar animated: tam çizimde atlanır, blit ile ayrıca çizilir
         bars = ax.bar(['Tetiklenen', 'Başarısız'], [triggered, failed],
-                     color=[self.colors['success'], self.colors['danger']],
-                     edgecolor=self.colors['accent'], linewidth=2)
+                     color=[colors['success'], colors['danger']],
+                     edgecolor=colors['accent'], linewidth=2, animated=True)
         
-        ax.set_title('Test Durumu', fontsize=11, color=self.colors['light'])
-        ax.tick_params(colors=self.colors['gray'])
-        ax.set_ylabel('Sayı', color=self.colors['light'])
+        # Sabit eksen ölçeği - küçük değişikliklerde blit yeterli olsun
+        ax.set_ylim(0, max(triggered, failed, 1) * 1.25)
+        
+        ax.set_title('Test Durumu', fontsize=11, color=colors['light'])
+        ax.tick_params(colors=colors['gray'])
+        ax.set_ylabel('Sayı', color=colors['light'])
         
         # Grid
-        ax.grid(True, alpha=0.3, color=self.colors['gray'])
+        ax.grid(True, alpha=0.3, color=colors['gray'])
+        return bars
     
-    def preview_table(self, fig, selected):
+    def preview_table(self, fig, selected, colors, transparent):
         """Tablo önizleme - TEMA DESTEKLİ"""
         ax = fig.add_subplot(111)
         ax.axis('tight')
         ax.axis('off')
         
         # Şeffaf arkaplan
-        if self.transparent_bg.get():
+        if transparent:
             ax.set_facecolor('none')
         
         # Örnek tablo
@@ -1185,9 +1536,9 @@ Başarılı raporlamalar! 🚀
         
         # Renk şeması
         cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 3)  # Başlık
-        cell_colors.append([self.colors['secondary']] * 3)
-        cell_colors.append([self.colors['secondary']] * 3)
+        cell_colors.append([colors['accent_secondary']] * 3)  # Başlık
+        cell_colors.append([colors['secondary']] * 3)
+        cell_colors.append([colors['secondary']] * 3)
         
         table = ax.table(cellText=table_data, cellLoc='center', loc='center',
                         cellColours=cell_colors)
@@ -1200,12 +1551,12 @@ Başarılı raporlamalar! 🚀
             cell = table[(0, i)]
             cell.set_text_props(weight='bold', color='white')
         
-        ax.set_title(selected, fontsize=11, color=self.colors['light'])
+        ax.set_title(selected, fontsize=11, color=colors['light'])
     
     def refresh_preview(self):
         """Önizlemeyi yenile - Tema değişikliklerini uygula"""
         self.update_preview()
-        self.status_label.config(text="✅ Önizleme yenilendi", foreground='green')
+        self.set_status("✅ Önizleme yenilendi", 'green')
     
     def generate_all(self):
         """Tüm görselleri oluştur - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
@@ -1220,10 +1571,18 @@ Başarılı raporlamalar! 🚀
             messagebox.showwarning("Uyarı", "Lütfen test sonuçlarını girin!")
             return
         
+        # Görsel boyutları tüm görseller için bir kez okunur
+        try:
+            dims = (float(self.visual_settings['fig_width'].get()),
+                    float(self.visual_settings['fig_height'].get()),
+                    int(self.visual_settings['fig_dpi'].get()))
+        except ValueError:
+            messagebox.showerror("Hata", "Görsel boyutu ve DPI sayısal olmalı!")
+            return
+        
         # Kayıt klasörü
         save_dir = self.save_path.get()
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
+        os.makedirs(save_dir, exist_ok=True)
         
         # Progress penceresi
         progress = tk.Toplevel(self.root)
@@ -1234,60 +1593,110 @@ Başarılı raporlamalar! 🚀
         # Tema ve arkaplan bilgisi
         theme_info = ttk.Label(progress, 
                               text=f"Tema: {self.current_theme} | Arkaplan: {'Şeffaf' if self.transparent_bg.get() else 'Renkli'}",
-                              font=('Arial', 10, 'italic'), foreground='blue')
+                              font='IDCA.Italic', foreground='blue')
         theme_info.pack(pady=10)
         
-        label = ttk.Label(progress, text="Başlıyor...", font=('Arial', 12))
+        label = ttk.Label(progress, text="Başlıyor...", font='IDCA.Title')
         label.pack(pady=10)
         
         pbar = ttk.Progressbar(progress, length=400, mode='determinate')
         pbar.pack(pady=20)
         
-        details = ttk.Label(progress, text="", font=('Arial', 9), foreground='gray')
+        details = ttk.Label(progress, text="", font='IDCA.Small', foreground='gray')
         details.pack(pady=5)
         
-        # Görseller
-        visuals = [
-            ('Figure_1_Test_Uygunluk', self.generate_figure1),
-            ('Figure_2_Test_Durumu', self.generate_figure2),
-            ('Table_1_Sonuc_Degerlendirme', self.generate_table1),
-            ('Table_2_MITRE_Kapsama', self.generate_table2),
-            ('Table_3_Tetiklenen_Kurallar', self.generate_table3),
-            ('Table_4_Algilanamayan_Teknikler', self.generate_table4),
-            ('Table_5_Oneriler', self.generate_table5)
-        ]
-        
-        pbar['maximum'] = len(visuals)
-        success = 0
+        # Alt işlemlere gönderilecek durum (sadece picklable veriler)
+        state = {
+            'data': self.data,
+            'colors': dict(self.colors),
+            'transparent': self.transparent_bg.get(),
+            'use_pil_tables': self.use_pil_tables.get() and Image is not None,
+            'dims': dims
+        }
         
-        for i, (name, func) in enumerate(visuals):
-            label.config(text=f"Oluşturuluyor: {name}")
-            details.config(text=f"({i+1}/{len(visuals)}) {name}.png")
-            pbar['value'] = i
-            progress.update()
+        # Verisi değişmemiş ve dosyası duran görseller yeniden çizilmez
+        pending = []
+        for name, method, keys in VISUAL_SPECS:
+            filepath = os.path.join(save_dir, f"{name}.png")
+            fingerprint = visual_fingerprint(state, method, keys)
+            if is_visual_current(filepath, fingerprint):
+                continue
+            pending.append((name, method, filepath, fingerprint))
+        
+        pbar['maximum'] = len(VISUAL_SPECS)
+        done = success = len(VISUAL_SPECS) - len(pending)
+        pbar['value'] = done
+        label.config(text="Oluşturuluyor...")
+        
+        # Görseller birbirinden bağımsız - paralel oluştur; sonuçlar kuyruk
+        # üzerinden ana döngüye taşınır, arayüz bloklanmaz
+        results = queue.Queue()
+        executor = None
+        futures = []
+        if pending:
+            executor = ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1),
+                                           mp_context=multiprocessing.get_context('spawn'))
+            for name, method, filepath, fingerprint in pending:
+                future = executor.submit(render_visual, state, method, filepath)
+                future.add_done_callback(
+                    lambda f, item=(name, filepath, fingerprint): results.put((item, f)))
+                futures.append(future)
+        
+        def finish():
+            if executor:
+                executor.shutdown(wait=False)
             
-            try:
-                filepath = os.path.join(save_dir, f"{name}.png")
-                func(filepath)
-                success += 1
-            except Exception as e:
-                print(f"Hata {name}: {e}")
-        
-        pbar['value'] = len(visuals)
-        label.config(text=f"✅ Tamamlandı! {success}/{len(visuals)} görsel oluşturuldu")
-        details.config(text=f"Kayıt yeri: {save_dir}")
+            pbar['value'] = len(VISUAL_SPECS)
+            label.config(text=f"✅ Tamamlandı! {success}/{len(VISUAL_SPECS)} görsel oluşturuldu")
+            details.config(text=f"Kayıt yeri: {save_dir}")
+            
+            # Arkaplan bilgisi
+            if state['transparent']:
+                info_label = ttk.Label(progress, 
+                                      text="ℹ️ Görseller şeffaf arkaplanla kaydedildi (Word için ideal)",
+                                      font='IDCA.Small', foreground='green')
+                info_label.pack(pady=5)
+            
+            ttk.Button(progress, text="Klasörü Aç", 
+                      command=lambda: self.open_folder(save_dir)).pack(side=tk.LEFT, padx=50, pady=10)
+            ttk.Button(progress, text="Kapat", 
+                      command=progress.destroy).pack(side=tk.RIGHT, padx=50, pady=10)
         
-        # Arkaplan bilgisi
-        if self.transparent_bg.get():
-            info_label = ttk.Label(progress, 
-                                  text="ℹ️ Görseller şeffaf arkaplanla kaydedildi (Word için ideal)",
-                                  font=('Arial', 9), foreground='green')
-            info_label.pack(pady=5)
+        def poll():
+            nonlocal done, success
+            
+            # Pencere kapatıldıysa kalan işleri bırak
+            if not progress.winfo_exists():
+                for future in futures:
+                    future.cancel()
+                if executor:
+                    executor.shutdown(wait=False)
+                return
+            
+            while True:
+                try:
+                    (name, filepath, fingerprint), future = results.get_nowait()
+                except queue.Empty:
+                    break
+                
+                done += 1
+                try:
+                    future.result()
+                    write_visual_fingerprint(filepath, fingerprint)
+                    success += 1
+                except Exception as e:
+                    print(f"Hata {name}: {e}")
+                
+                label.config(text=f"Oluşturuldu: {name}")
+                details.config(text=f"({done}/{len(VISUAL_SPECS)}) {name}.png")
+                pbar['value'] = done
+            
+            if done < len(VISUAL_SPECS):
+                self.root.after(50, poll)
+            else:
+                finish()
         
-        ttk.Button(progress, text="Klasörü Aç", 
-                  command=lambda: self.open_folder(save_dir)).pack(side=tk.LEFT, padx=50, pady=10)
-        ttk.Button(progress, text="Kapat", 
-                  command=progress.destroy).pack(side=tk.RIGHT, padx=50, pady=10)
+        poll()
     
     def open_folder(self, folder_path):
         """Klasörü aç"""
@@ -1297,321 +1706,516 @@ Başarılı raporlamalar! 🚀
             os.system(f'open "{folder_path}"')
         else:
             os.system(f'xdg-open "{folder_path}"')
+
+
+@lru_cache(maxsize=32)
+def _table_cell_colors(header_color, base_color, n_cols, row_overrides):
+    """Tablo hücre renklerini RGB matrisi olarak oluştur (önbellekli)
     
-    def generate_figure1(self, filepath):
-        """Figure 1 oluştur - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
-        width = float(self.visual_settings['fig_width'].get())
-        height = float(self.visual_settings['fig_height'].get())
-        dpi = int(self.visual_settings['fig_dpi'].get())
+    Renkler (r, g, b) demetleridir; row_overrides her satır için
+    ((sütun, renk), ...) demetidir.
+    """
+    # Tek seferde ayrılan matris, sadece farklı hücreler üzerine yazılır
+    cell_colors = np.empty((len(row_overrides) + 1, n_cols, 3), dtype=np.float32)
+    cell_colors[:] = base_color
+    cell_colors[0] = header_color
+    for row, overrides in enumerate(row_overrides, 1):
+        for col, color in overrides:
+            cell_colors[row, col] = color
+    
+    # Önbellekteki matris paylaşıldığı için değiştirilemez yapılır
+    cell_colors.setflags(write=False)
+    return cell_colors
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _classify_rates_jit(rates):
+        """Derlenmiş sınıflandırma döngüsü (bkz. classify_rates)"""
+        out = np.empty(rates.size, np.uint8)
+        for i in range(rates.size):
+            rate = rates[i]
+            out[i] = 0 if rate < 40 else 1 if rate < 60 else 2
+        return out
+
+
+def classify_rates(rates):
+    """Başarı oranlarını seviyeye çevir: 0=Kritik (<40), 1=Orta (<60), 2=İyi"""
+    rates = np.asarray(rates, dtype=np.float64)
+    if HAS_NUMBA and rates.size > 256:
+        return _classify_rates_jit(rates)
+    return np.select([rates < 40, rates < 60], [0, 1], default=2).astype(np.uint8)
+
+
+@lru_cache(maxsize=16)
+def _pil_font(size, bold=False):
+    """matplotlib ile gelen DejaVu Sans yazı tipini Pillow için yükle"""
+    from matplotlib import font_manager
+    path = font_manager.findfont(font_manager.FontProperties(
+        family='DejaVu Sans', weight='bold' if bold else 'normal'))
+    return ImageFont.truetype(path, size)
+
+
+def _ellipsis(text, limit):
+    """Uzun metni limit karakterde kesip '...' ekle"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _to_int(text):
+    """Giriş metnini istisna kullanmadan tamsayıya çevir
+    
+    Boş metin 0, sayı olmayan metin None döner.
+    """
+    text = (text or '').strip()
+    if not text:
+        return 0
+    return int(text) if text.isdecimal() else None
+
+
+def _is_count_text(text):
+    """Sayı alanı doğrulaması: boş veya sadece rakam"""
+    return text == '' or text.isdecimal()
+
+
+def _is_percent_text(text):
+    """Yüzde alanı doğrulaması: boş veya 0-100 arası (sonda % olabilir)"""
+    text = text.rstrip('%')
+    if not text:
+        return True
+    if not text.replace('.', '', 1).isdecimal():
+        return False
+    return 0 <= float(text) <= 100
+
+
+def _safe_int(text):
+    """Giriş metnini tamsayıya çevir; boş veya geçersizse 0"""
+    value = _to_int(text)
+    return 0 if value is None else value
+
+
+def _to_rgba255(color):
+    """matplotlib rengini Pillow'un beklediği 0-255 RGBA demetine çevir"""
+    import matplotlib.colors as mcolors
+    return tuple(int(round(v * 255)) for v in mcolors.to_rgba(color))
+
+
+def visual_fingerprint(state, method, keys):
+    """Görselin kullandığı veri, tema ve boyutlardan özet değer oluştur"""
+    payload = {
+        'method': method,
+        'data': {key: state['data'][key] for key in keys},
+        'colors': state['colors'],
+        'transparent': state['transparent'],
+        'use_pil_tables': state['use_pil_tables'],
+        'dims': state['dims']
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded).hexdigest()
+
+
+def is_visual_current(filepath, fingerprint):
+    """Görsel dosyası aynı veriyle daha önce oluşturulmuş mu?"""
+    if not os.path.exists(filepath):
+        return False
+    try:
+        with open(filepath + '.blake2b', 'r', encoding='utf-8') as f:
+            return f.read().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def write_visual_fingerprint(filepath, fingerprint):
+    """Özet değeri görselin yanına atomik olarak yaz"""
+    tmp_path = filepath + '.blake2b.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+    os.replace(tmp_path, filepath + '.blake2b')
+
+
+def render_visual(state, method, filepath):
+    """Tek bir görseli oluştur (işlem havuzunda çalışır)"""
+    _configure_matplotlib()
+    renderer = VisualRenderer(state['data'], state['colors'], state['transparent'],
+                              state['use_pil_tables'])
+    getattr(renderer, method)(filepath, state['dims'])
+
+
+class VisualRenderer:
+    """Rapor görsellerini Tk'dan bağımsız olarak oluşturur
+    
+    pyplot yerine doğrudan Figure + Agg canvas kullanılır; böylece
+    GUI backend'i ve pyplot'un global durumu devreye girmez.
+    """
+    
+    # Aynı işlemdeki tüm görsellerin paylaştığı Figure/Agg canvas
+    _shared_figure = None
+    
+    def __init__(self, data, colors, transparent, use_pil_tables=False):
+        import matplotlib.colors as mcolors
+        
+        self.data = data
+        # Hex renkler her Artist için yeniden ayrıştırılmasın diye bir kez RGB'ye çevrilir
+        self.colors = {key: mcolors.to_rgb(value) for key, value in colors.items()}
+        self.transparent = transparent
+        self.use_pil_tables = use_pil_tables
+    
+    def _new_figure(self, width, height):
+        """Arkaplanı temaya göre ayarlanmış boş figure hazırla
         
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
+        Figure ve canvas işlem başına bir kez oluşturulur; sonraki
+        görseller aynı figure'ı temizleyip yeniden boyutlandırarak kullanır.
+        """
+        fig = VisualRenderer._shared_figure
+        if fig is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            fig = VisualRenderer._shared_figure = Figure(dpi=100)
+            FigureCanvasAgg(fig)
+        else:
+            fig.clear()
+        fig.set_size_inches(width, height)
         
-        # Şeffaf arkaplan ayarı
-        if self.transparent_bg.get():
+        if self.transparent:
             fig.patch.set_facecolor('none')
             fig.patch.set_alpha(0)
+        else:
+            fig.patch.set_facecolor(self.colors['dark'])
+            fig.patch.set_alpha(1)
+        return fig
+    
+    def _add_axes(self, fig, *args):
+        """Arkaplanı temaya göre ayarlanmış grafik ekseni ekle"""
+        ax = fig.add_subplot(*args)
+        if self.transparent:
             ax.set_facecolor('none')
             ax.patch.set_alpha(0)
         else:
-            fig.patch.set_facecolor(self.colors['dark'])
             ax.set_facecolor(self.colors['primary'])
+        return ax
+    
+    def _new_table_figure(self, width, height):
+        """Tablo görselleri için eksenleri gizlenmiş figure oluştur"""
+        fig = self._new_figure(width, height)
+        fig.subplots_adjust(left=0.02, right=0.98, top=0.9, bottom=0.08)
+        ax = fig.add_subplot()
+        ax.axis('tight')
+        ax.axis('off')
+        return fig, ax
+    
+    def _draw_table(self, ax, table_data, cell_colors, col_widths, fontsize, row_scale):
+        """Tabloyu tek bir renk görüntüsü ve metin katmanı olarak çiz
+        
+        ax.table her hücre için ayrı Cell/Text nesneleri oluşturur; burada
+        hücre renkleri tek bir imshow ile çizilir, sütun genişlikleri ise
+        renk sütunlarının tekrarlanmasıyla korunur. Satırlar ax.table'daki
+        gibi sabit yüksekliktedir (TABLE_ROW_UNIT * row_scale) ve tablo
+        eksenin ortasına yerleşir.
+        """
+        n_rows = len(table_data)
+        units = np.maximum(1, np.round(np.asarray(col_widths) * 100).astype(int))
+        edges = np.concatenate(([0], np.cumsum(units)))
+        
+        img = np.repeat(cell_colors, units, axis=1)
+        ax.imshow(img, aspect='auto', interpolation='nearest',
+                  extent=(0, edges[-1], n_rows, 0))
+        
+        # Hücre çizgileri
+        ax.vlines(edges, 0, n_rows, colors='black', linewidth=0.5)
+        ax.hlines(np.arange(n_rows + 1), 0, edges[-1], colors='black', linewidth=0.5)
+        
+        # Hücre metinleri - başlık satırı kalın ve beyaz
+        centers = (edges[:-1] + edges[1:]) / 2
+        for r, row in enumerate(table_data):
+            weight, color = ('bold', 'white') if r == 0 else ('normal', 'black')
+            for x, text in zip(centers, row):
+                ax.text(x, r + 0.5, text, ha='center', va='center',
+                        fontsize=fontsize, fontweight=weight, color=color)
+        
+        # Eksene sığan satır sayısı kadar birim açılır; tablo ortada kalır
+        fig = ax.get_figure()
+        axes_height = ax.get_position().height * fig.get_figheight()
+        pad = max(0.0, axes_height / (TABLE_ROW_UNIT * row_scale) - n_rows) / 2
+        
+        ax.set_xlim(0, edges[-1])
+        ax.set_ylim(n_rows + pad, -pad)
+    
+    def _output_table(self, filepath, dims, height, title, table_data, cell_colors,
+                      col_widths, fontsize, row_scale, footers):
+        """Tabloyu seçili çiziciyle (matplotlib veya Pillow) kaydet
         
-        # Veriler
-        total = self.data['test_results']['total_rules']
-        tested = self.data['test_results']['tested_rules']
-        not_tested = self.data['test_results']['not_tested']
-        triggered = self.data['test_results']['triggered_rules']
-        success_rate = self.data['test_results']['success_rate']
+        footers: (y, metin, stil) listesi; y figure koordinatındadır.
+        """
+        width, _, dpi = dims
+        if self.use_pil_tables:
+            self._render_table_pil(filepath, width, dpi, title, table_data, cell_colors,
+                                   col_widths, fontsize, footers)
+            return
         
-        # Pasta grafik
-        sizes = [tested, not_tested]
-        labels = [f'Test Edilmiş\n{tested} kural\n(%{tested/total*100:.1f})',
+        fig, ax = self._new_table_figure(width, height)
+        self._draw_table(ax, table_data, cell_colors, col_widths, fontsize=fontsize,
+                         row_scale=row_scale)
+        ax.set_title(title, fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
+        
+        for y, text, style in footers:
+            fig.text(0.5, y, text, ha='center', **style)
+        
+        self._save_figure(fig, filepath, dpi)
+    
+    def _render_table_pil(self, filepath, width, dpi, title, table_data, cell_colors,
+                          col_widths, fontsize, footers):
+        """Tabloyu matplotlib kullanmadan doğrudan Pillow ile çiz"""
+        scale = dpi / 72  # punto -> piksel
+        img_w = int(width * dpi)
+        margin = int(0.02 * img_w)
+        row_h = int(fontsize * scale * 2)
+        title_size = int(14 * scale)
+        title_h = int(title_size * 2.5)
+        
+        # Alt bilgiler figure'daki gibi yukarıdan aşağı sıralanır
+        footer_lines = [(text, style, int(style['fontsize'] * scale))
+                        for _, text, style in sorted(footers, key=lambda f: -f[0])]
+        footer_h = sum(int(size * 1.8) for _, _, size in footer_lines)
+        img_h = 2 * margin + title_h + row_h * len(table_data) + footer_h
+        
+        background = (0, 0, 0, 0) if self.transparent else _to_rgba255(self.colors['dark'])
+        img = Image.new('RGBA', (img_w, img_h), background)
+        draw = ImageDraw.Draw(img)
+        
+        # Başlık
+        draw.text((img_w / 2, margin + title_h / 2), title, anchor='mm',
+                  font=_pil_font(title_size, True), fill=_to_rgba255(self.colors['light']))
+        
+        # Hücreler
+        weights = np.asarray(col_widths, dtype=float)
+        edges = (np.concatenate(([0], np.cumsum(weights))) / weights.sum()
+                 * (img_w - 2 * margin) + margin).tolist()
+        fills = np.rint(np.asarray(cell_colors) * 255).astype(np.uint8).tolist()
+        header_font = _pil_font(int(fontsize * scale), True)
+        body_font = _pil_font(int(fontsize * scale), False)
+        
+        top = margin + title_h
+        for r, row in enumerate(table_data):
+            y0 = top + r * row_h
+            font, text_fill = (header_font, (255, 255, 255)) if r == 0 else (body_font, (0, 0, 0))
+            for col, text in enumerate(row):
+                x0, x1 = edges[col], edges[col + 1]
+                draw.rectangle([x0, y0, x1, y0 + row_h], fill=tuple(fills[r][col]),
+                               outline=(0, 0, 0), width=1)
+                draw.text(((x0 + x1) / 2, y0 + row_h / 2), text, font=font,
+                          fill=text_fill, anchor='mm')
+        
+        # Alt bilgiler
+        y = top + row_h * len(table_data)
+        for text, style, size in footer_lines:
+            line_h = int(size * 1.8)
+            draw.text((img_w / 2, y + line_h / 2), text, anchor='mm',
+                      font=_pil_font(size, style.get('weight') == 'bold'),
+                      fill=_to_rgba255(style['color']))
+            y += line_h
+        
+        img.save(filepath, 'PNG', compress_level=3, dpi=(dpi, dpi))
+    
+    def _save_figure(self, fig, filepath, dpi):
+        """Figure'ı kaydet
+        
+        Kenar boşlukları her görselde subplots_adjust ile sabitlenir;
+        tight_layout'un ek ölçüm çizimine gerek kalmaz.
+        """
+        # Düz renkli görsellerde düşük sıkıştırma seviyesi boyutu pek
+        # değiştirmez ama PNG kodlamasını belirgin şekilde hızlandırır
+        pil_kwargs = {'optimize': False, 'compress_level': 3}
+        if self.transparent:
+            fig.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight',
+                        pil_kwargs=pil_kwargs)
+        else:
+            fig.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight',
+                        pil_kwargs=pil_kwargs)
+    
+    def generate_figure1(self, filepath, dims):
+        """Figure 1 oluştur - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
+        import matplotlib.patches as mpatches
+        
+        tr = self.data['test_results']
+        gen = self.data['general']
+        c = self.colors
+        
+        width, height, dpi = dims
+        
+        fig = self._new_figure(width, height)
+        fig.subplots_adjust(left=0.05, right=0.95, top=0.88, bottom=0.08)
+        ax = self._add_axes(fig)
+        
+        # Veriler
+        total = tr['total_rules']
+        tested = tr['tested_rules']
+        not_tested = tr['not_tested']
+        triggered = tr['triggered_rules']
+        success_rate = tr['success_rate']
+        
+        # Pasta grafik
+        sizes = [tested, not_tested]
+        labels = [f'Test Edilmiş\n{tested} kural\n(%{tested/total*100:.1f})',
                  f'Test Edilmemiş\n{not_tested} kural\n(%{not_tested/total*100:.1f})']
-        colors = [self.colors['accent_secondary'], self.colors['gray']]
+        colors = [c['accent_secondary'], c['gray']]
         
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors,
-                                          explode=(0.05, 0), startangle=90, shadow=not self.transparent_bg.get(),
-                                          textprops={'fontsize': 11, 'color': self.colors['light']})
+        # autopct verilmediği için pie() yalnızca dilimleri ve etiketleri döndürür
+        wedges, texts = ax.pie(sizes, labels=labels, colors=colors,
+                               explode=(0.05, 0), startangle=90, shadow=not self.transparent,
+                               textprops={'fontsize': 11, 'color': c['light']})
         
         # Merkez daire
-        centre_circle = plt.Circle((0, 0), 0.70, 
-                                  fc='none' if self.transparent_bg.get() else self.colors['primary'],
-                                  linewidth=2, edgecolor=self.colors['accent'])
+        centre_circle = mpatches.Circle((0, 0), 0.70, 
+                                  fc='none' if self.transparent else c['primary'],
+                                  linewidth=2, edgecolor=c['accent'])
         ax.add_artist(centre_circle)
         
         # Merkez metin
         ax.text(0, 0.1, str(total), ha='center', va='center',
-               fontsize=36, fontweight='bold', color=self.colors['accent'])
+               fontsize=36, fontweight='bold', color=c['accent'])
         ax.text(0, -0.15, 'Toplam Kural', ha='center', va='center',
-               fontsize=12, color=self.colors['gray'])
+               fontsize=12, color=c['gray'])
         ax.text(0, -0.3, f'Başarı: %{success_rate:.1f}', ha='center', va='center',
                fontsize=11, fontweight='bold',
-               color=self.colors['success'] if success_rate >= 70 else self.colors['warning'])
+               color=c['success'] if success_rate >= 70 else c['warning'])
         
         # Başlık
         ax.set_title('Figure 1: Analiz Edilen Korelasyonların Test Uygunluk Grafiği',
-                    fontsize=14, fontweight='bold', color=self.colors['light'], pad=20)
+                    fontsize=14, fontweight='bold', color=c['light'], pad=20)
         
         # Alt bilgi
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']} - {self.data['general']['report_date']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
+        fig.text(0.5, 0.02, f"{gen['company_name']} - {gen['report_date']}",
+                ha='center', fontsize=9, color=c['gray'])
         
-        plt.tight_layout()
-        
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, filepath, dpi)
     
-    def generate_figure2(self, filepath):
+    def generate_figure2(self, filepath, dims):
         """Figure 2 oluştur - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
-        width = float(self.visual_settings['fig_width'].get())
-        height = float(self.visual_settings['fig_height'].get())
-        dpi = int(self.visual_settings['fig_dpi'].get())
+        tr = self.data['test_results']
+        gen = self.data['general']
+        c = self.colors
         
-        fig = plt.figure(figsize=(width, height), dpi=100)
+        width, height, dpi = dims
         
-        # Şeffaf arkaplan ayarı
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
+        fig = self._new_figure(width, height)
+        fig.subplots_adjust(left=0.08, right=0.96, top=0.85, bottom=0.1, wspace=0.45)
         
         # Sol grafik
-        ax1 = plt.subplot(1, 2, 1)
-        if self.transparent_bg.get():
-            ax1.set_facecolor('none')
-            ax1.patch.set_alpha(0)
-        else:
-            ax1.set_facecolor(self.colors['primary'])
+        ax1 = self._add_axes(fig, 1, 2, 1)
         
-        triggered = self.data['test_results']['triggered_rules']
-        failed = self.data['test_results']['failed']
+        triggered = tr['triggered_rules']
+        failed = tr['failed']
         
-        bars = ax1.bar(['Tetiklenen', 'Başarısız'], [triggered, failed],
-                      color=[self.colors['success'], self.colors['danger']],
-                      edgecolor=self.colors['accent'], linewidth=2)
+        values = [triggered, failed]
+        ax1.bar(['Tetiklenen', 'Başarısız'], values,
+                color=[c['success'], c['danger']],
+                edgecolor=c['accent'], linewidth=2)
         
-        for bar, val in zip(bars, [triggered, failed]):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max([triggered, failed])*0.02,
-                    str(val), ha='center', fontweight='bold', color=self.colors['light'])
+        # Kategorik çubukların merkezi 0, 1, ... konumundadır
+        offset = max(values) * 0.02
+        for x, val in enumerate(values):
+            ax1.text(x, val + offset, str(val), ha='center', fontweight='bold', color=c['light'])
         
-        ax1.set_title('Test Sonuç Dağılımı', fontsize=12, color=self.colors['light'])
-        ax1.set_ylabel('Kural Sayısı', color=self.colors['light'])
-        ax1.tick_params(colors=self.colors['gray'])
-        ax1.grid(True, alpha=0.3, color=self.colors['gray'], linestyle='--')
+        ax1.set_title('Test Sonuç Dağılımı', fontsize=12, color=c['light'])
+        ax1.set_ylabel('Kural Sayısı', color=c['light'])
+        ax1.tick_params(colors=c['gray'])
+        ax1.grid(True, alpha=0.3, color=c['gray'], linestyle='--')
         
         # Sağ grafik - MITRE
-        ax2 = plt.subplot(1, 2, 2)
-        if self.transparent_bg.get():
-            ax2.set_facecolor('none')
-            ax2.patch.set_alpha(0)
-        else:
-            ax2.set_facecolor(self.colors['primary'])
+        ax2 = self._add_axes(fig, 1, 2, 2)
         
         if self.data['mitre_tactics']:
-            tactics_sorted = sorted(self.data['mitre_tactics'].items(),
-                                  key=lambda x: x[1]['rate'])[:6]
+            tactics_sorted = heapq.nsmallest(6, self.data['mitre_tactics'].items(),
+                                             key=lambda x: x[1]['rate'])
             
             tactics = [t[0] for t in tactics_sorted]
             rates = [t[1]['rate'] for t in tactics_sorted]
             
-            colors_bar = []
-            for r in rates:
-                if r < 40:
-                    colors_bar.append(self.colors['danger'])
-                elif r < 60:
-                    colors_bar.append(self.colors['warning'])
-                else:
-                    colors_bar.append(self.colors['success'])
+            palette = (c['danger'], c['warning'], c['success'])
+            colors_bar = [palette[level] for level in classify_rates(rates)]
             
-            bars2 = ax2.barh(range(len(tactics)), rates, color=colors_bar,
-                           edgecolor=self.colors['accent'], linewidth=1)
+            y_pos = np.arange(len(tactics))
+            ax2.barh(y_pos, rates, color=colors_bar,
+                     edgecolor=c['accent'], linewidth=1)
             
-            for bar, val in zip(bars2, rates):
-                ax2.text(val + 1, bar.get_y() + bar.get_height()/2,
-                        f'%{val:.1f}', va='center', fontweight='bold', color=self.colors['light'])
+            # Yatay çubuklar y_pos'a ortalanır; etiketler doğrudan oraya yazılır
+            for y, val in zip(y_pos, rates):
+                ax2.text(val + 1, y, f'%{val:.1f}', va='center', fontweight='bold', color=c['light'])
             
-            ax2.set_yticks(range(len(tactics)))
-            ax2.set_yticklabels(tactics, fontsize=9, color=self.colors['light'])
+            ax2.set_yticks(y_pos)
+            ax2.set_yticklabels(tactics, fontsize=9, color=c['light'])
             ax2.set_xlim(0, 100)
-            ax2.set_xlabel('Başarı Oranı (%)', color=self.colors['light'])
-            ax2.set_title('En Düşük Performanslı Taktikler', fontsize=12, color=self.colors['light'])
-            ax2.tick_params(colors=self.colors['gray'])
-            ax2.grid(True, axis='x', alpha=0.3, color=self.colors['gray'], linestyle='--')
+            ax2.set_xlabel('Başarı Oranı (%)', color=c['light'])
+            ax2.set_title('En Düşük Performanslı Taktikler', fontsize=12, color=c['light'])
+            ax2.tick_params(colors=c['gray'])
+            ax2.grid(True, axis='x', alpha=0.3, color=c['gray'], linestyle='--')
         
         fig.suptitle('Figure 2: Test Edilen Korelasyonların Durumu',
-                    fontsize=14, fontweight='bold', color=self.colors['light'])
-        
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']} - {self.data['general']['prepared_by']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
+                    fontsize=14, fontweight='bold', color=c['light'])
         
-        plt.tight_layout()
+        fig.text(0.5, 0.02, f"{gen['company_name']} - {gen['prepared_by']}",
+                ha='center', fontsize=9, color=c['gray'])
         
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, filepath, dpi)
     
-    def generate_table1(self, filepath):
+    def generate_table1(self, filepath, dims):
         """Table 1 oluştur - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
-        width = float(self.visual_settings['fig_width'].get())
-        height = 6
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
+        tr = self.data['test_results']
+        gen = self.data['general']
+        c = self.colors
         
-        # Şeffaf arkaplan
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-            ax.set_facecolor('none')
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
-        
-        ax.axis('tight')
-        ax.axis('off')
+        height = 6
         
         # Tablo verileri
-        total = self.data['test_results']['total_rules']
-        tested = self.data['test_results']['tested_rules']
-        success_rate = self.data['test_results']['success_rate']
-        not_tested = self.data['test_results']['not_tested']
+        total = tr['total_rules']
+        tested = tr['tested_rules']
+        success_rate = tr['success_rate']
+        not_tested = tr['not_tested']
+        
+        # Durum kodları: 0=hedefte, 1=uyarı, 2=yetersiz
+        statuses = [
+            0 if total >= 300 else 1 if total >= 200 else 2,
+            0 if tested >= 200 else 1 if tested >= 100 else 2,
+            0 if success_rate >= 70 else 1 if success_rate >= 50 else 2,
+            0 if not_tested < 50 else 1 if not_tested < 100 else 2
+        ]
+        status_icons = ('✅', '⚠️', '❌')
         
         table_data = [
             ['Metrik', 'Değer', 'Hedef', 'Durum', 'Açıklama'],
-            ['Toplam Kural', str(total), '300+', 
-             '✅' if total >= 300 else '⚠️' if total >= 200 else '❌', 
+            ['Toplam Kural', str(total), '300+', status_icons[statuses[0]],
              'Kapsam değerlendirmesi'],
-            ['Test Edilen', str(tested), '200+',
-             '✅' if tested >= 200 else '⚠️' if tested >= 100 else '❌',
+            ['Test Edilen', str(tested), '200+', status_icons[statuses[1]],
              'Test kapsamı'],
-            ['Başarı Oranı', f'%{success_rate:.1f}', '%70+',
-             '✅' if success_rate >= 70 else '⚠️' if success_rate >= 50 else '❌',
+            ['Başarı Oranı', f'%{success_rate:.1f}', '%70+', status_icons[statuses[2]],
              'Tespit yeteneği'],
-            ['Test Edilmeyen', str(not_tested), '<50',
-             '✅' if not_tested < 50 else '⚠️' if not_tested < 100 else '❌',
+            ['Test Edilmeyen', str(not_tested), '<50', status_icons[statuses[3]],
              'Kapsam dışı']
         ]
         
         # Renk şeması
-        cell_colors = []
-        for i, row in enumerate(table_data):
-            if i == 0:
-                cell_colors.append([self.colors['accent_secondary']] * 5)
-            else:
-                row_colors = [self.colors['secondary']] * 5
-                if '✅' in row[3]:
-                    row_colors[3] = self.colors['success']
-                elif '⚠️' in row[3]:
-                    row_colors[3] = self.colors['warning']
-                elif '❌' in row[3]:
-                    row_colors[3] = self.colors['danger']
-                cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors, colWidths=[0.2, 0.12, 0.12, 0.1, 0.36])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(11)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 1: Sonuç Değerlendirme Tablosu',
-                    fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
-        
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']} - {self.data['general']['report_date']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close() Kural', str(total), '300+', 
-             '✅' if total >= 300 else '⚠️' if total >= 200 else '❌', 
-             'Kapsam değerlendirmesi'],
-            ['Test Edilen', str(tested), '200+',
-             '✅' if tested >= 200 else '⚠️' if tested >= 100 else '❌',
-             'Test kapsamı'],
-            ['Başarı Oranı', f'%{success_rate:.1f}', '%70+',
-             '✅' if success_rate >= 70 else '⚠️' if success_rate >= 50 else '❌',
-             'Tespit yeteneği'],
-            ['Test Edilmeyen', str(not_tested), '<50',
-             '✅' if not_tested < 50 else '⚠️' if not_tested < 100 else '❌',
-             'Kapsam dışı']
+        status_colors = (c['success'], c['warning'], c['danger'])
+        cell_colors = _table_cell_colors(
+            c['accent_secondary'], c['secondary'], 5,
+            tuple(((3, status_colors[status]),) for status in statuses))
+        
+        footers = [
+            (0.02, f"{gen['company_name']} - {gen['report_date']}",
+             {'fontsize': 9, 'color': c['gray']})
         ]
         
-        # Renk şeması
-        cell_colors = []
-        for i, row in enumerate(table_data):
-            if i == 0:
-                cell_colors.append([self.colors['accent_secondary']] * 5)
-            else:
-                row_colors = [self.colors['secondary']] * 5
-                if '✅' in row[3]:
-                    row_colors[3] = self.colors['success']
-                elif '⚠️' in row[3]:
-                    row_colors[3] = self.colors['warning']
-                elif '❌' in row[3]:
-                    row_colors[3] = self.colors['danger']
-                cell_colors.append(row_colors)
-        
         # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors, colWidths=[0.2, 0.12, 0.12, 0.1, 0.36])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(11)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 1: Sonuç Değerlendirme Tablosu',
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']} - {self.data['general']['report_date']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        self._output_table(filepath, dims, height, 'Table 1: Sonuç Değerlendirme Tablosu',
+                           table_data, cell_colors, [0.2, 0.12, 0.12, 0.1, 0.36], 11, 2, footers)
     
-    def generate_table2(self, filepath):
+    def generate_table2(self, filepath, dims):
         """Table 2 - MITRE Kapsama - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
         if not self.data['mitre_tactics']:
             return
         
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(8, len(self.data['mitre_tactics']) * 0.6)
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        
-        # Şeffaf arkaplan
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
+        gen = self.data['general']
+        c = self.colors
         
-        ax.axis('tight')
-        ax.axis('off')
+        height = max(8, len(self.data['mitre_tactics']) * 0.6)
         
         # Tablo verileri
         headers = ['Taktik', 'Test Edilen', 'Tetiklenen', 'Başarı %', 'Kritiklik']
@@ -1620,88 +2224,49 @@ Başarılı raporlamalar! 🚀
         sorted_tactics = sorted(self.data['mitre_tactics'].items(),
                               key=lambda x: x[1]['rate'])
         
-        for tactic, values in sorted_tactics:
-            kritiklik = 'Kritik' if values['rate'] < 40 else 'Orta' if values['rate'] < 60 else 'İyi'
+        # Kritiklik sınıflandırması tek seferde (vektörel)
+        rates = np.fromiter((values['rate'] for _, values in sorted_tactics),
+                            dtype=float, count=len(sorted_tactics))
+        levels = classify_rates(rates).tolist()
+        kritiklik_labels = ('Kritik', 'Orta', 'İyi')
+        
+        for (tactic, values), level in zip(sorted_tactics, levels):
             rows.append([
                 tactic,
                 str(values['test']),
                 str(values['triggered']),
                 f"%{values['rate']:.1f}",
-                kritiklik
+                kritiklik_labels[level]
             ])
         
-        table_data = [headers] + rows
+        table_data = [headers, *rows]
         
         # Renk şeması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
-        for row in rows:
-            row_colors = [self.colors['secondary']] * 5
-            rate = float(row[3].strip('%'))
-            if rate < 40:
-                row_colors[3] = self.colors['danger']
-                row_colors[4] = self.colors['danger']
-            elif rate < 60:
-                row_colors[3] = self.colors['warning']
-                row_colors[4] = self.colors['warning']
-            else:
-                row_colors[3] = self.colors['success']
-                row_colors[4] = self.colors['success']
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors, colWidths=[0.28, 0.15, 0.15, 0.15, 0.15])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.8)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 2: MITRE ATT&CK Kapsama Analizi',
-                    fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
+        kritiklik_colors = (c['danger'], c['warning'], c['success'])
+        cell_colors = _table_cell_colors(
+            c['accent_secondary'], c['secondary'], 5,
+            tuple(((3, kritiklik_colors[level]), (4, kritiklik_colors[level])) for level in levels))
         
         # Özet
-        avg_success = np.mean([v['rate'] for v in self.data['mitre_tactics'].values()])
-        fig.text(0.5, 0.05, f'Ortalama Başarı: %{avg_success:.1f}',
-                ha='center', fontsize=10, color=self.colors['light'])
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
-        
-        plt.tight_layout()
+        avg_success = rates.mean()
+        footers = [
+            (0.05, f'Ortalama Başarı: %{avg_success:.1f}', {'fontsize': 10, 'color': c['light']}),
+            (0.02, f"{gen['company_name']}", {'fontsize': 9, 'color': c['gray']})
+        ]
         
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        # Tablo oluştur
+        self._output_table(filepath, dims, height, 'Table 2: MITRE ATT&CK Kapsama Analizi',
+                           table_data, cell_colors, [0.28, 0.15, 0.15, 0.15, 0.15], 10, 1.8, footers)
     
-    def generate_table3(self, filepath):
+    def generate_table3(self, filepath, dims):
         """Table 3 - Tetiklenen Kurallar - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
         if not self.data['triggered_rules']:
             return
         
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['triggered_rules']) * 0.5))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
+        gen = self.data['general']
+        c = self.colors
         
-        # Şeffaf arkaplan
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
-        
-        ax.axis('tight')
-        ax.axis('off')
+        height = max(6, min(12, len(self.data['triggered_rules']) * 0.5))
         
         # Tablo verileri
         headers = ['ID', 'Kural Adı', 'MITRE Teknik', 'Taktik', 'Güven Skoru']
@@ -1710,168 +2275,102 @@ Başarılı raporlamalar! 🚀
         for i, rule in enumerate(self.data['triggered_rules'][:20], 1):
             rows.append([
                 str(i),
-                rule['name'][:40] + '...' if len(rule['name']) > 40 else rule['name'],
+                _ellipsis(rule['name'], 40),
                 rule['mitre'],
                 rule['tactic'],
                 f"%{rule['confidence']}"
             ])
         
-        table_data = [headers] + rows
+        table_data = [headers, *rows]
         
         # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
+        overrides = []
         for row in rows:
-            row_colors = [self.colors['secondary']] * 5
             try:
                 confidence = int(row[4].strip('%'))
                 if confidence >= 90:
-                    row_colors[4] = self.colors['success']
+                    overrides.append(((4, c['success']),))
                 elif confidence >= 80:
-                    row_colors[4] = self.colors['warning']
+                    overrides.append(((4, c['warning']),))
                 else:
-                    row_colors[4] = self.colors['danger']
+                    overrides.append(((4, c['danger']),))
             except:
-                pass
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.08, 0.38, 0.15, 0.2, 0.12])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 1.8)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 3: Tetiklenen Korelasyon Kuralları Listesi',
-                    fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
+                overrides.append(())
         
-        fig.text(0.5, 0.02, f"Toplam {len(self.data['triggered_rules'])} kural - {self.data['general']['company_name']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
+        cell_colors = _table_cell_colors(
+            c['accent_secondary'], c['secondary'], 5, tuple(overrides))
         
-        plt.tight_layout()
+        footers = [
+            (0.02, f"Toplam {len(self.data['triggered_rules'])} kural - {gen['company_name']}",
+             {'fontsize': 9, 'color': c['gray']})
+        ]
         
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        # Tablo oluştur
+        self._output_table(filepath, dims, height, 'Table 3: Tetiklenen Korelasyon Kuralları Listesi',
+                           table_data, cell_colors, [0.08, 0.38, 0.15, 0.2, 0.12], 9, 1.8, footers)
     
-    def generate_table4(self, filepath):
+    def generate_table4(self, filepath, dims):
         """Table 4 - Algılanamayan Teknikler - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
         if not self.data['undetected_techniques']:
             return
         
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['undetected_techniques']) * 0.5))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        
-        # Şeffaf arkaplan
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
+        c = self.colors
         
-        ax.axis('tight')
-        ax.axis('off')
+        height = max(6, min(12, len(self.data['undetected_techniques']) * 0.5))
         
         # Tablo verileri
         headers = ['MITRE ID', 'Teknik Adı', 'Taktik', 'Kritiklik', 'Öncelik']
         rows = []
         
-        # Kritiklik sıralama
+        # Kritiklik seviyesi her teknik için bir kez hesaplanır
         kritiklik_order = {'Kritik': 0, 'Yüksek': 1, 'Orta': 2, 'Düşük': 3}
-        sorted_techniques = sorted(self.data['undetected_techniques'],
-                                 key=lambda x: kritiklik_order.get(x['criticality'], 4))
+        levels = [kritiklik_order.get(t['criticality'], 4)
+                  for t in self.data['undetected_techniques']]
+        ranked = heapq.nsmallest(20, zip(levels, self.data['undetected_techniques']),
+                                 key=lambda x: x[0])
         
-        for i, tech in enumerate(sorted_techniques[:20], 1):
+        for i, (_, tech) in enumerate(ranked, 1):
             rows.append([
                 tech['id'],
-                tech['name'][:35] + '...' if len(tech['name']) > 35 else tech['name'],
+                _ellipsis(tech['name'], 35),
                 tech['tactic'],
                 tech['criticality'],
                 f"P{i}"
             ])
         
-        table_data = [headers] + rows
+        table_data = [headers, *rows]
         
-        # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
-        for row in rows:
-            row_colors = [self.colors['secondary']] * 5
-            if 'Kritik' in row[3]:
-                row_colors[3] = self.colors['danger']
-                row_colors[4] = self.colors['danger']
-            elif 'Yüksek' in row[3]:
-                row_colors[3] = self.colors['warning']
-                row_colors[4] = self.colors['warning']
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.12, 0.35, 0.2, 0.12, 0.1])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 4: Algılanamayan MITRE Teknikleri Listesi',
-                    fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
+        # Renk kodlaması - sadece Kritik ve Yüksek vurgulanır
+        level_overrides = {
+            0: ((3, c['danger']), (4, c['danger'])),
+            1: ((3, c['warning']), (4, c['warning']))
+        }
+        overrides = [level_overrides.get(level, ()) for level, _ in ranked]
         
-        kritik_count = sum(1 for t in self.data['undetected_techniques'] if t['criticality'] == 'Kritik')
-        yuksek_count = sum(1 for t in self.data['undetected_techniques'] if t['criticality'] == 'Yüksek')
+        cell_colors = _table_cell_colors(
+            c['accent_secondary'], c['secondary'], 5, tuple(overrides))
         
-        fig.text(0.5, 0.02, f"⚠️ {kritik_count} Kritik, {yuksek_count} Yüksek seviyeli teknik için acil önlem gerekli",
-                ha='center', fontsize=10, weight='bold', color=self.colors['warning'])
+        kritik_count = levels.count(0)
+        yuksek_count = levels.count(1)
         
-        plt.tight_layout()
+        footers = [
+            (0.02, f"⚠️ {kritik_count} Kritik, {yuksek_count} Yüksek seviyeli teknik için acil önlem gerekli",
+             {'fontsize': 10, 'weight': 'bold', 'color': c['warning']})
+        ]
         
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        # Tablo oluştur
+        self._output_table(filepath, dims, height, 'Table 4: Algılanamayan MITRE Teknikleri Listesi',
+                           table_data, cell_colors, [0.12, 0.35, 0.2, 0.12, 0.1], 9, 2, footers)
     
-    def generate_table5(self, filepath):
+    def generate_table5(self, filepath, dims):
         """Table 5 - Öneriler - TEMA VE ŞEFFAF ARKAPLAN DESTEKLİ"""
         if not self.data['recommendations']:
             return
         
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['recommendations']) * 0.6))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        
-        # Şeffaf arkaplan
-        if self.transparent_bg.get():
-            fig.patch.set_facecolor('none')
-            fig.patch.set_alpha(0)
-        else:
-            fig.patch.set_facecolor(self.colors['dark'])
+        gen = self.data['general']
+        c = self.colors
         
-        ax.axis('tight')
-        ax.axis('off')
+        height = max(6, min(12, len(self.data['recommendations']) * 0.6))
         
         # Tablo verileri
         headers = ['Öncelik', 'Kategori', 'Öneri', 'Beklenen Etki']
@@ -1882,338 +2381,36 @@ Başarılı raporlamalar! 🚀
             rows.append([
                 rec['priority'],
                 rec['category'],
-                rec['text'][:50] + '...' if len(rec['text']) > 50 else rec['text'],
+                _ellipsis(rec['text'], 50),
                 etki
             ])
         
-        table_data = [headers] + rows
-        
-        # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 4)
+        table_data = [headers, *rows]
         
-        for i, row in enumerate(rows):
-            row_colors = [self.colors['secondary']] * 4
+        # Renk kodlaması - önceliğe göre
+        overrides = []
+        for i in range(len(rows)):
             if i < 3:
-                row_colors[0] = self.colors['danger']
-                row_colors[3] = self.colors['success']
+                overrides.append(((0, c['danger']), (3, c['success'])))
             elif i < 7:
-                row_colors[0] = self.colors['warning']
-                row_colors[3] = self.colors['warning']
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.1, 0.2, 0.45, 0.15])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(4):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 5: Yazılması Gereken Korelasyon Kurallarının Öneri Listesi',
-                    fontsize=14, fontweight='bold', pad=20, color=self.colors['light'])
-        
-        fig.text(0.5, 0.03, f'Toplam {len(self.data["recommendations"])} öneri',
-                ha='center', fontsize=9, style='italic', color=self.colors['success'])
-        fig.text(0.5, 0.005, f"{self.data['general']['company_name']} - {self.data['general']['prepared_by']}",
-                ha='center', fontsize=8, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        
-        # Kaydet
-        if self.transparent_bg.get():
-            plt.savefig(filepath, dpi=dpi, transparent=True, bbox_inches='tight')
-        else:
-            plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()size=(width, height), dpi=100)
-        fig.patch.set_facecolor(self.colors['dark'])
-        ax.axis('tight')
-        ax.axis('off')
-        
-        # Tablo verileri
-        headers = ['Taktik', 'Test Edilen', 'Tetiklenen', 'Başarı %', 'Kritiklik']
-        rows = []
-        
-        sorted_tactics = sorted(self.data['mitre_tactics'].items(),
-                              key=lambda x: x[1]['rate'])
-        
-        for tactic, values in sorted_tactics:
-            kritiklik = 'Kritik' if values['rate'] < 40 else 'Orta' if values['rate'] < 60 else 'İyi'
-            rows.append([
-                tactic,
-                str(values['test']),
-                str(values['triggered']),
-                f"%{values['rate']:.1f}",
-                kritiklik
-            ])
-        
-        table_data = [headers] + rows
-        
-        # Renk şeması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
-        for row in rows:
-            row_colors = [self.colors['secondary']] * 5
-            rate = float(row[3].strip('%'))
-            if rate < 40:
-                row_colors[3] = self.colors['danger']
-                row_colors[4] = self.colors['danger']
-            elif rate < 60:
-                row_colors[3] = self.colors['warning']
-                row_colors[4] = self.colors['warning']
+                overrides.append(((0, c['warning']), (3, c['warning'])))
             else:
-                row_colors[3] = self.colors['success']
-                row_colors[4] = self.colors['success']
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors, colWidths=[0.28, 0.15, 0.15, 0.15, 0.15])
+                overrides.append(())
         
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.8)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 2: MITRE ATT&CK Kapsama Analizi',
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        # Özet
-        avg_success = np.mean([v['rate'] for v in self.data['mitre_tactics'].values()])
-        fig.text(0.5, 0.05, f'Ortalama Başarı: %{avg_success:.1f}',
-                ha='center', fontsize=10, color=self.colors['light'])
-        fig.text(0.5, 0.02, f"{self.data['general']['company_name']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
-    
-    def generate_table3(self, filepath):
-        """Table 3 - Tetiklenen Kurallar"""
-        if not self.data['triggered_rules']:
-            return
-        
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['triggered_rules']) * 0.5))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        fig.patch.set_facecolor(self.colors['dark'])
-        ax.axis('tight')
-        ax.axis('off')
-        
-        # Tablo verileri
-        headers = ['ID', 'Kural Adı', 'MITRE Teknik', 'Taktik', 'Güven Skoru']
-        rows = []
-        
-        for i, rule in enumerate(self.data['triggered_rules'][:20], 1):
-            rows.append([
-                str(i),
-                rule['name'][:40] + '...' if len(rule['name']) > 40 else rule['name'],
-                rule['mitre'],
-                rule['tactic'],
-                f"%{rule['confidence']}"
-            ])
-        
-        table_data = [headers] + rows
-        
-        # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
-        for row in rows:
-            row_colors = [self.colors['secondary']] * 5
-            try:
-                confidence = int(row[4].strip('%'))
-                if confidence >= 90:
-                    row_colors[4] = self.colors['success']
-                elif confidence >= 80:
-                    row_colors[4] = self.colors['warning']
-                else:
-                    row_colors[4] = self.colors['danger']
-            except:
-                pass
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.08, 0.38, 0.15, 0.2, 0.12])
+        cell_colors = _table_cell_colors(
+            c['accent_secondary'], c['secondary'], 4, tuple(overrides))
         
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 1.8)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 3: Tetiklenen Korelasyon Kuralları Listesi',
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        fig.text(0.5, 0.02, f"Toplam {len(self.data['triggered_rules'])} kural - {self.data['general']['company_name']}",
-                ha='center', fontsize=9, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
-    
-    def generate_table4(self, filepath):
-        """Table 4 - Algılanamayan Teknikler"""
-        if not self.data['undetected_techniques']:
-            return
-        
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['undetected_techniques']) * 0.5))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        fig.patch.set_facecolor(self.colors['dark'])
-        ax.axis('tight')
-        ax.axis('off')
-        
-        # Tablo verileri
-        headers = ['MITRE ID', 'Teknik Adı', 'Taktik', 'Kritiklik', 'Öncelik']
-        rows = []
-        
-        # Kritiklik sıralama
-        kritiklik_order = {'Kritik': 0, 'Yüksek': 1, 'Orta': 2, 'Düşük': 3}
-        sorted_techniques = sorted(self.data['undetected_techniques'],
-                                 key=lambda x: kritiklik_order.get(x['criticality'], 4))
-        
-        for i, tech in enumerate(sorted_techniques[:20], 1):
-            rows.append([
-                tech['id'],
-                tech['name'][:35] + '...' if len(tech['name']) > 35 else tech['name'],
-                tech['tactic'],
-                tech['criticality'],
-                f"P{i}"
-            ])
-        
-        table_data = [headers] + rows
-        
-        # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 5)
-        
-        for row in rows:
-            row_colors = [self.colors['secondary']] * 5
-            if 'Kritik' in row[3]:
-                row_colors[3] = self.colors['danger']
-                row_colors[4] = self.colors['danger']
-            elif 'Yüksek' in row[3]:
-                row_colors[3] = self.colors['warning']
-                row_colors[4] = self.colors['warning']
-            cell_colors.append(row_colors)
-        
-        # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.12, 0.35, 0.2, 0.12, 0.1])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 4: Algılanamayan MITRE Teknikleri Listesi',
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        kritik_count = sum(1 for t in self.data['undetected_techniques'] if t['criticality'] == 'Kritik')
-        yuksek_count = sum(1 for t in self.data['undetected_techniques'] if t['criticality'] == 'Yüksek')
-        
-        fig.text(0.5, 0.02, f"⚠️ {kritik_count} Kritik, {yuksek_count} Yüksek seviyeli teknik için acil önlem gerekli",
-                ha='center', fontsize=10, weight='bold', color=self.colors['warning'])
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
-    
-    def generate_table5(self, filepath):
-        """Table 5 - Öneriler"""
-        if not self.data['recommendations']:
-            return
-        
-        width = float(self.visual_settings['fig_width'].get())
-        height = max(6, min(12, len(self.data['recommendations']) * 0.6))
-        dpi = int(self.visual_settings['fig_dpi'].get())
-        
-        fig, ax = plt.subplots(figsize=(width, height), dpi=100)
-        fig.patch.set_facecolor(self.colors['dark'])
-        ax.axis('tight')
-        ax.axis('off')
-        
-        # Tablo verileri
-        headers = ['Öncelik', 'Kategori', 'Öneri', 'Beklenen Etki']
-        rows = []
-        
-        for i, rec in enumerate(self.data['recommendations'][:15], 1):
-            etki = 'Yüksek' if i <= 3 else 'Orta' if i <= 7 else 'Normal'
-            rows.append([
-                rec['priority'],
-                rec['category'],
-                rec['text'][:50] + '...' if len(rec['text']) > 50 else rec['text'],
-                etki
-            ])
-        
-        table_data = [headers] + rows
-        
-        # Renk kodlaması
-        cell_colors = []
-        cell_colors.append([self.colors['accent_secondary']] * 4)
-        
-        for i, row in enumerate(rows):
-            row_colors = [self.colors['secondary']] * 4
-            if i < 3:
-                row_colors[0] = self.colors['danger']
-                row_colors[3] = self.colors['success']
-            elif i < 7:
-                row_colors[0] = self.colors['warning']
-                row_colors[3] = self.colors['warning']
-            cell_colors.append(row_colors)
+        footers = [
+            (0.03, f'Toplam {len(self.data["recommendations"])} öneri',
+             {'fontsize': 9, 'style': 'italic', 'color': c['success']}),
+            (0.005, f"{gen['company_name']} - {gen['prepared_by']}",
+             {'fontsize': 8, 'color': c['gray']})
+        ]
         
         # Tablo oluştur
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.1, 0.2, 0.45, 0.15])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 2)
-        
-        # Başlık satırı
-        for i in range(4):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 5: Yazılması Gereken Korelasyon Kurallarının Öneri Listesi',
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        fig.text(0.5, 0.03, f'Toplam {len(self.data["recommendations"])} öneri',
-                ha='center', fontsize=9, style='italic', color=self.colors['success'])
-        fig.text(0.5, 0.005, f"{self.data['general']['company_name']} - {self.data['general']['prepared_by']}",
-                ha='center', fontsize=8, color=self.colors['gray'])
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=dpi, facecolor=self.colors['dark'], bbox_inches='tight')
-        plt.close()
+        self._output_table(filepath, dims, height,
+                           'Table 5: Yazılması Gereken Korelasyon Kurallarının Öneri Listesi',
+                           table_data, cell_colors, [0.1, 0.2, 0.45, 0.15], 9, 2, footers)
 
 def main():
     """Ana fonksiyon"""
@@ -7,6 +7,7 @@ Configuration and constants for IDCA Visualizer
 import os
 import sys
 import locale
+from functools import lru_cache
 from pathlib import Path
 
 # Application info
@@ -26,15 +27,27 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 # Encoding settings
 ENCODING = 'utf-8'
 
-# Set locale for Turkish character support
-try:
-    if sys.platform.startswith('win'):
-        locale.setlocale(locale.LC_ALL, 'Turkish_Turkey.1254')
-    else:
-        locale.setlocale(locale.LC_ALL, 'tr_TR.UTF-8')
-except:
-    # Fallback to default locale
-    pass
+# Turkish locale used for sorting, set up on first use
+TURKISH_LOCALE = 'Turkish_Turkey.1254' if sys.platform.startswith('win') else 'tr_TR.UTF-8'
+
+
+@lru_cache(maxsize=1)
+def ensure_turkish_collation() -> bool:
+    """Switch string collation to Turkish once; False if the locale is missing"""
+    try:
+        locale.setlocale(locale.LC_COLLATE, TURKISH_LOCALE)
+    except locale.Error:
+        # Fallback to default locale
+        return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def collation_key(text: str) -> str:
+    """Case-insensitive, Turkish-aware sort key for display strings"""
+    if ensure_turkish_collation():
+        return locale.strxfrm(text.lower())
+    return text.lower()
 
 # Window settings
 DEFAULT_WINDOW_WIDTH = 1600
@@ -42,6 +55,15 @@ DEFAULT_WINDOW_HEIGHT = 900
 MIN_WINDOW_WIDTH = 1200
 MIN_WINDOW_HEIGHT = 700
 
+# Delay before the data status is recomputed after an edit (ms)
+STATUS_UPDATE_DELAY_MS = 150
+
+# Interval for polling background visual generation (ms)
+VISUAL_POLL_INTERVAL_MS = 50
+
+# Number of validation errors listed in warning dialogs
+MAX_DIALOG_ERRORS = 5
+
 # Figure settings
 DEFAULT_FIG_WIDTH = 12
 DEFAULT_FIG_HEIGHT = 8
@@ -49,6 +71,12 @@ DEFAULT_DPI = 300
 MIN_DPI = 100
 MAX_DPI = 600
 
+# Bottom share of a saved figure kept free for its footer text
+FIGURE_FOOTER_MARGIN = 0.07
+
+# zlib level for saved PNGs; low levels encode much faster for slightly larger files
+PNG_COMPRESS_LEVEL = 1
+
 # Font settings
 DEFAULT_FONT_FAMILY = 'Arial'
 DEFAULT_FONT_SIZE = 10
@@ -89,6 +117,10 @@ MITRE_TACTICS = [
 CRITICALITY_LEVELS = ['Critical', 'High', 'Medium', 'Low']
 CRITICALITY_LEVELS_TR = ['Kritik', 'Yüksek', 'Orta', 'Düşük']
 
+# MITRE success-rate risk buckets (below 40% critical, below 60% medium)
+RISK_THRESHOLDS = (40, 60)
+RISK_LEVELS = ('Critical', 'Medium', 'Low')
+
 # Recommendation categories
 RECOMMENDATION_CATEGORIES = [
     'Log Sources',
@@ -142,6 +174,8 @@ MATPLOTLIB_PARAMS = {
     'pdf.fonttype': 42,
     'ps.fonttype': 42,
     'figure.autolayout': True,
-    'savefig.bbox': 'tight',
+    # Report figures reserve their own margins; a tight bbox would render
+    # every saved figure twice
+    'savefig.bbox': 'standard',
     'savefig.pad_inches': 0.1
 }
\ No newline at end of file
@@ -4,30 +4,168 @@
 Visualization generation for IDCA reports
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.axes import Axes
 import matplotlib.patches as mpatches
+from matplotlib.colors import to_rgba
 from matplotlib.patches import FancyBboxPatch
 import numpy as np
+import copy
+import os
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
-from data.models import IDCAData
+from data.models import IDCAData, MitreTactic
 from themes.theme_manager import ThemeManager
 from core.config import (
     DEFAULT_FIG_WIDTH, DEFAULT_FIG_HEIGHT, DEFAULT_DPI,
-    TABLE_HEADER_HEIGHT, TABLE_ROW_HEIGHT, STATUS_ICONS
+    TABLE_HEADER_HEIGHT, TABLE_ROW_HEIGHT, STATUS_ICONS, FIGURE_FOOTER_MARGIN,
+    RISK_THRESHOLDS, RISK_LEVELS, PNG_COMPRESS_LEVEL, MATPLOTLIB_PARAMS
 )
 
+# Forwarded to Pillow when matplotlib writes the PNG
+PNG_SAVE_OPTIONS = {'compress_level': PNG_COMPRESS_LEVEL, 'optimize': False}
+
+# Layout for report figures: tight, leaving the bottom free for footer text
+REPORT_LAYOUT = {'rect': (0, FIGURE_FOOTER_MARGIN, 1, 1)}
+
+# Theme color for each entry of RISK_LEVELS
+RISK_COLOR_KEYS = ('danger', 'warning', 'success')
+
+# Theme color for criticality levels that are highlighted in Table 4
+CRITICALITY_COLOR_KEYS = {'Critical': 'danger', 'Kritik': 'danger',
+                          'High': 'warning', 'Yüksek': 'warning'}
+
+# Sort rank of each criticality level in Table 4; unknown levels rank last
+CRITICALITY_ORDER = {'Critical': 0, 'Kritik': 0, 'High': 1, 'Yüksek': 1,
+                     'Medium': 2, 'Orta': 2, 'Low': 3, 'Düşük': 3}
+
+# Theme color for the status icons in Table 1
+STATUS_ICON_COLOR_KEYS = {STATUS_ICONS['success']: 'success',
+                          STATUS_ICONS['warning']: 'warning',
+                          STATUS_ICONS['error']: 'danger'}
+
+
+# File name and generator method of every report visualization
+VISUALIZATIONS = (
+    ('Figure_1_Test_Coverage', 'generate_figure1'),
+    ('Figure_2_Test_Status', 'generate_figure2'),
+    ('Table_1_Summary', 'generate_table1'),
+    ('Table_2_MITRE_Coverage', 'generate_table2'),
+    ('Table_3_Triggered_Rules', 'generate_table3'),
+    ('Table_4_Undetected_Techniques', 'generate_table4'),
+    ('Table_5_Recommendations', 'generate_table5')
+)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text at limit characters and mark it with '...'"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@dataclass
+class TacticRanking:
+    """MITRE tactics sorted by success rate, shared by Figure 2 and Table 2"""
+    tactics: List[Tuple[str, MitreTactic]]
+    rates: np.ndarray
+    buckets: np.ndarray  # index into RISK_LEVELS / RISK_COLOR_KEYS per tactic
+    average: float
+    
+    @classmethod
+    def from_data(cls, data: IDCAData) -> 'TacticRanking':
+        tactics = sorted(data.mitre_tactics.items(),
+                         key=lambda x: x[1].success_rate)
+        rates = np.fromiter((tactic.success_rate for _, tactic in tactics),
+                            dtype=float, count=len(tactics))
+        buckets = np.searchsorted(RISK_THRESHOLDS, rates, side='right')
+        return cls(tactics, rates, buckets,
+                   float(rates.mean()) if len(tactics) else 0.0)
+
+
+# One report Figure per thread, cleared and resized for each generate_* call.
+# Thread-local because the GUI renders the visuals from a thread pool.
+_report_figures = threading.local()
+
+
+def _reusable_figure(figsize: Tuple[float, float]) -> Figure:
+    """Return this thread's report figure, cleared and sized to figsize"""
+    fig = getattr(_report_figures, 'figure', None)
+    if fig is None:
+        fig = Figure(figsize=figsize, dpi=100, tight_layout=REPORT_LAYOUT)
+        FigureCanvasAgg(fig)
+        _report_figures.figure = fig
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+        fig.patch.set_alpha(None)
+    return fig
+
+
+def _init_worker():
+    """Process pool initializer: apply the app-wide matplotlib settings
+    
+    Workers started with spawn (Windows, macOS) do not inherit the
+    parent's rcParams, so fonts would differ from the GUI renders.
+    """
+    matplotlib.rcParams.update(MATPLOTLIB_PARAMS)
+
+
+def _generate_in_process(generator: 'VisualizationGenerator', method: str,
+                         data: IDCAData, filepath: Path, **kwargs):
+    """Process pool entry point: render one visualization"""
+    getattr(generator, method)(data, filepath, **kwargs)
+
+
+def _resolve_color(value: str):
+    """Parse a theme color to RGBA once; invalid values are left for the artist
+    to report, as before"""
+    try:
+        return to_rgba(value)
+    except ValueError:
+        return value
+
+
+class _Palette(dict):
+    """Theme colors as RGBA tuples, with ThemeManager.get_color's black fallback"""
+    
+    def __init__(self, colors: Dict[str, str]):
+        super().__init__((key, _resolve_color(value)) for key, value in colors.items())
+    
+    def __missing__(self, key):
+        return (0.0, 0.0, 0.0, 1.0)
+
 
 class VisualizationGenerator:
     """Generates all IDCA report visualizations"""
     
+    # generate_* methods that accept a precomputed TacticRanking
+    TACTIC_RANKING_METHODS = frozenset({'generate_figure2', 'generate_table2'})
+    
     def __init__(self, theme_manager: ThemeManager):
         self.theme_manager = theme_manager
         self.fig_width = DEFAULT_FIG_WIDTH
         self.fig_height = DEFAULT_FIG_HEIGHT
         self.dpi = DEFAULT_DPI
         self.transparent = True
+        self._color_theme = None
+        self._refresh_colors()
+    
+    def _refresh_colors(self):
+        """Resolve the current theme's colors for self._c(key)
+        
+        Called at the start of each figure, so lookups inside the render
+        and table loops are a single dict access. The colors are RGBA tuples,
+        which matplotlib takes without parsing a color string per artist.
+        """
+        theme = self.theme_manager.current_theme
+        if theme is not self._color_theme:
+            self._c = _Palette(theme.colors).__getitem__
+            self._color_theme = theme
     
     def set_dimensions(self, width: float, height: float, dpi: int):
         """Set figure dimensions"""
@@ -39,40 +177,70 @@ class VisualizationGenerator:
         """Set transparency mode"""
         self.transparent = transparent
     
-    def generate_all(self, data: IDCAData, output_dir: Path) -> Dict[str, bool]:
-        """Generate all visualizations"""
-        results = {}
+    def snapshot(self) -> 'VisualizationGenerator':
+        """Copy of this generator pinned to the current theme and settings
         
-        visualizations = [
-            ('Figure_1_Test_Coverage', self.generate_figure1),
-            ('Figure_2_Test_Status', self.generate_figure2),
-            ('Table_1_Summary', self.generate_table1),
-            ('Table_2_MITRE_Coverage', self.generate_table2),
-            ('Table_3_Triggered_Rules', self.generate_table3),
-            ('Table_4_Undetected_Techniques', self.generate_table4),
-            ('Table_5_Recommendations', self.generate_table5)
-        ]
+        Background batches render from the copy, so theme, size or
+        background changes made meanwhile only apply to the next batch.
+        """
+        clone = copy.copy(self)
+        clone.theme_manager = copy.copy(self.theme_manager)
+        return clone
+    
+    @staticmethod
+    def rank_tactics(data: IDCAData) -> TacticRanking:
+        """Sort the tactics once for every method in TACTIC_RANKING_METHODS"""
+        return TacticRanking.from_data(data)
+    
+    def generate_all(self, data: IDCAData, output_dir: Path) -> Dict[str, bool]:
+        """Generate all visualizations
         
-        for filename, generator in visualizations:
-            try:
-                filepath = output_dir / f"{filename}.png"
-                generator(data, filepath)
-                results[filename] = True
-            except Exception as e:
-                print(f"Error generating {filename}: {e}")
-                results[filename] = False
+        The figures are independent and CPU-bound, so each one is rendered
+        in its own worker process from a pickled copy of this generator.
+        """
+        results = {}
+        ranking = {'ranking': self.rank_tactics(data)}
+        
+        workers = min(len(VISUALIZATIONS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(_generate_in_process, self, method, data,
+                                output_dir / f"{filename}.png",
+                                **(ranking if method in self.TACTIC_RANKING_METHODS else {})): filename
+                for filename, method in VISUALIZATIONS
+            }
+            
+            for future, filename in futures.items():
+                try:
+                    future.result()
+                    results[filename] = True
+                except Exception as e:
+                    print(f"Error generating {filename}: {e}")
+                    results[filename] = False
         
         return results
     
-    def _setup_figure(self, figsize: Tuple[float, float] = None) -> Tuple[plt.Figure, plt.Axes]:
-        """Set up a figure with theme colors"""
+    def _setup_figure(self, figsize: Tuple[float, float] = None,
+                      reuse: bool = False) -> Tuple[Figure, Axes]:
+        """Set up a figure with theme colors
+        
+        With reuse=True the thread's shared report figure is recycled; only
+        generate_* may use it, since they are done with it once saved.
+        """
         if figsize is None:
             figsize = (self.fig_width, self.fig_height)
         
         # Apply theme to matplotlib
+        self._refresh_colors()
         self.theme_manager.apply_to_matplotlib(self.transparent)
         
-        fig, ax = plt.subplots(figsize=figsize, dpi=100)
+        # Figures are built without pyplot so they can be rendered off the
+        # Tk thread without touching the global figure manager
+        if reuse:
+            fig = _reusable_figure(figsize)
+        else:
+            fig = Figure(figsize=figsize, dpi=100, tight_layout=REPORT_LAYOUT)
+        ax = fig.add_subplot()
         
         # Set background
         if self.transparent:
@@ -81,14 +249,19 @@ class VisualizationGenerator:
             ax.set_facecolor('none')
             ax.patch.set_alpha(0)
         else:
-            fig.patch.set_facecolor(self.theme_manager.get_color('background'))
-            ax.set_facecolor(self.theme_manager.get_color('surface'))
+            fig.patch.set_facecolor(self._c('background'))
+            ax.set_facecolor(self._c('surface'))
         
         return fig, ax
     
     def generate_figure1(self, data: IDCAData, filepath: Path):
         """Generate Figure 1: Test Coverage Pie Chart"""
-        fig, ax = self._setup_figure()
+        fig = self._build_coverage_figure(data, reuse=True)
+        self._save_figure(fig, filepath)
+    
+    def _build_coverage_figure(self, data: IDCAData, reuse: bool = False) -> Figure:
+        """Draw the test coverage donut for Figure 1 and the API chart"""
+        fig, ax = self._setup_figure(reuse=reuse)
         
         # Data
         total = data.test_results.total_rules
@@ -96,6 +269,15 @@ class VisualizationGenerator:
         not_tested = data.test_results.not_tested
         success_rate = data.test_results.success_rate
         
+        if total == 0:
+            ax.text(0.5, 0.5, 'No data available', 
+                   transform=ax.transAxes, ha='center', va='center',
+                   fontsize=16, color=self._c('text_primary'))
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            ax.axis('off')
+            return fig
+        
         # Pie chart
         sizes = [tested, not_tested]
         labels = [
@@ -103,41 +285,44 @@ class VisualizationGenerator:
             f'Not Tested\n{not_tested} rules\n({not_tested/total*100:.1f}%)'
         ]
         colors = [
-            self.theme_manager.get_color('accent'),
-            self.theme_manager.get_color('gray')
+            self._c('accent'),
+            self._c('gray')
         ]
         
-        wedges, texts, autotexts = ax.pie(
+        # No autopct, so pie() returns only wedges and texts; neither is used
+        ax.pie(
             sizes, labels=labels, colors=colors,
             explode=(0.05, 0), startangle=90,
             shadow=not self.transparent,
             textprops={
                 'fontsize': 11,
-                'color': self.theme_manager.get_color('text_primary')
+                'color': self._c('text_primary')
             }
         )
         
-        # Center circle for donut effect
-        centre_circle = plt.Circle(
+        # Center circle for donut effect - just the outline when transparent,
+        # so no invisible face is filled
+        centre_circle = mpatches.Circle(
             (0, 0), 0.70,
-            fc='none' if self.transparent else self.theme_manager.get_color('surface'),
+            fill=not self.transparent,
+            facecolor=self._c('surface'),
             linewidth=2,
-            edgecolor=self.theme_manager.get_color('accent_secondary')
+            edgecolor=self._c('accent_secondary')
         )
         ax.add_artist(centre_circle)
         
         # Center text
         ax.text(0, 0.1, str(total), ha='center', va='center',
                 fontsize=36, fontweight='bold',
-                color=self.theme_manager.get_color('accent'))
+                color=self._c('accent'))
         ax.text(0, -0.15, 'Total Rules', ha='center', va='center',
-                fontsize=12, color=self.theme_manager.get_color('text_secondary'))
+                fontsize=12, color=self._c('text_secondary'))
         
         # Success rate indicator
         success_color = (
-            self.theme_manager.get_color('success') if success_rate >= 70
-            else self.theme_manager.get_color('warning') if success_rate >= 50
-            else self.theme_manager.get_color('danger')
+            self._c('success') if success_rate >= 70
+            else self._c('warning') if success_rate >= 50
+            else self._c('danger')
         )
         ax.text(0, -0.3, f'Success Rate: {success_rate:.1f}%',
                 ha='center', va='center', fontsize=11, fontweight='bold',
@@ -146,251 +331,177 @@ class VisualizationGenerator:
         # Title
         ax.set_title('Figure 1: Test Coverage Analysis',
                     fontsize=14, fontweight='bold',
-                    color=self.theme_manager.get_color('text_primary'),
+                    color=self._c('text_primary'),
                     pad=20)
         
         # Footer
         fig.text(0.5, 0.02, f"{data.general.company_name} - {data.general.report_date}",
                 ha='center', fontsize=9,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
-        self._save_figure(fig, filepath)
+        return fig
     
-    def generate_figure2(self, data: IDCAData, filepath: Path):
+    def generate_figure2(self, data: IDCAData, filepath: Path,
+                         ranking: Optional[TacticRanking] = None):
         """Generate Figure 2: Test Status Charts"""
-        fig = plt.figure(figsize=(self.fig_width, self.fig_height), dpi=100)
+        fig = _reusable_figure((self.fig_width, self.fig_height))
         
         # Apply theme
+        self._refresh_colors()
         self.theme_manager.apply_to_matplotlib(self.transparent)
         
         if self.transparent:
             fig.patch.set_facecolor('none')
             fig.patch.set_alpha(0)
         else:
-            fig.patch.set_facecolor(self.theme_manager.get_color('background'))
+            fig.patch.set_facecolor(self._c('background'))
         
         # Left subplot - Test Results
-        ax1 = plt.subplot(1, 2, 1)
+        ax1 = fig.add_subplot(1, 2, 1)
         self._setup_axes(ax1)
         
         triggered = data.test_results.triggered_rules
         failed = data.test_results.failed
         
         bars = ax1.bar(['Triggered', 'Failed'], [triggered, failed],
-                       color=[self.theme_manager.get_color('success'),
-                             self.theme_manager.get_color('danger')],
-                       edgecolor=self.theme_manager.get_color('accent'),
+                       color=[self._c('success'),
+                             self._c('danger')],
+                       edgecolor=self._c('accent'),
                        linewidth=2)
         
         # Value labels
-        for bar, val in zip(bars, [triggered, failed]):
-            ax1.text(bar.get_x() + bar.get_width()/2,
-                    bar.get_height() + max([triggered, failed])*0.02,
-                    str(val), ha='center', fontweight='bold',
-                    color=self.theme_manager.get_color('text_primary'))
+        ax1.bar_label(bars, padding=3, fontweight='bold',
+                      color=self._c('text_primary'))
         
         ax1.set_title('Test Results Distribution', fontsize=12,
-                     color=self.theme_manager.get_color('text_primary'))
-        ax1.set_ylabel('Rule Count', color=self.theme_manager.get_color('text_primary'))
+                     color=self._c('text_primary'))
+        ax1.set_ylabel('Rule Count', color=self._c('text_primary'))
         ax1.grid(True, alpha=0.3, linestyle='--')
         
         # Right subplot - MITRE Performance
-        ax2 = plt.subplot(1, 2, 2)
+        ax2 = fig.add_subplot(1, 2, 2)
         self._setup_axes(ax2)
         
         if data.mitre_tactics:
             # Get lowest performing tactics
-            tactics_sorted = sorted(
-                data.mitre_tactics.items(),
-                key=lambda x: x[1].success_rate
-            )[:6]
+            if ranking is None:
+                ranking = TacticRanking.from_data(data)
             
-            tactics = [t[0] for t in tactics_sorted]
-            rates = [t[1].success_rate for t in tactics_sorted]
+            tactics = [t[0] for t in ranking.tactics[:6]]
+            rates = ranking.rates[:6]
             
             # Color based on performance
-            colors_bar = []
-            for r in rates:
-                if r < 40:
-                    colors_bar.append(self.theme_manager.get_color('danger'))
-                elif r < 60:
-                    colors_bar.append(self.theme_manager.get_color('warning'))
-                else:
-                    colors_bar.append(self.theme_manager.get_color('success'))
+            colors_bar = self._risk_colors()[ranking.buckets[:6]]  # N x RGBA
             
             bars2 = ax2.barh(range(len(tactics)), rates, color=colors_bar,
-                            edgecolor=self.theme_manager.get_color('accent'),
+                            edgecolor=self._c('accent'),
                             linewidth=1)
             
             # Value labels
-            for bar, val in zip(bars2, rates):
-                ax2.text(val + 1, bar.get_y() + bar.get_height()/2,
-                        f'{val:.1f}%', va='center', fontweight='bold',
-                        color=self.theme_manager.get_color('text_primary'))
+            ax2.bar_label(bars2, fmt='%.1f%%', padding=3, fontweight='bold',
+                          color=self._c('text_primary'))
             
             ax2.set_yticks(range(len(tactics)))
             ax2.set_yticklabels(tactics, fontsize=9)
             ax2.set_xlim(0, 100)
             ax2.set_xlabel('Success Rate (%)',
-                          color=self.theme_manager.get_color('text_primary'))
+                          color=self._c('text_primary'))
             ax2.set_title('Lowest Performing Tactics', fontsize=12,
-                         color=self.theme_manager.get_color('text_primary'))
+                         color=self._c('text_primary'))
             ax2.grid(True, axis='x', alpha=0.3, linestyle='--')
         
         # Main title
         fig.suptitle('Figure 2: Test Status Overview',
                     fontsize=14, fontweight='bold',
-                    color=self.theme_manager.get_color('text_primary'))
+                    color=self._c('text_primary'))
         
         # Footer
         fig.text(0.5, 0.02, f"{data.general.company_name} - {data.general.prepared_by}",
                 ha='center', fontsize=9,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
     def generate_table1(self, data: IDCAData, filepath: Path):
         """Generate Table 1: Summary Table"""
-        fig, ax = self._setup_figure((self.fig_width, 6))
-        ax.axis('tight')
-        ax.axis('off')
+        fig, ax = self._setup_figure((self.fig_width, 6), reuse=True)
         
         # Table data
         total = data.test_results.total_rules
         tested = data.test_results.tested_rules
         success_rate = data.test_results.success_rate
         not_tested = data.test_results.not_tested
+        ok, warn, err = STATUS_ICONS['success'], STATUS_ICONS['warning'], STATUS_ICONS['error']
         
         table_data = [
             ['Metric', 'Value', 'Target', 'Status', 'Description'],
             ['Total Rules', str(total), '300+',
-             STATUS_ICONS['success'] if total >= 300 else STATUS_ICONS['warning'] if total >= 200 else STATUS_ICONS['error'],
+             ok if total >= 300 else warn if total >= 200 else err,
              'Coverage assessment'],
             ['Tested Rules', str(tested), '200+',
-             STATUS_ICONS['success'] if tested >= 200 else STATUS_ICONS['warning'] if tested >= 100 else STATUS_ICONS['error'],
+             ok if tested >= 200 else warn if tested >= 100 else err,
              'Test coverage'],
             ['Success Rate', f'{success_rate:.1f}%', '70%+',
-             STATUS_ICONS['success'] if success_rate >= 70 else STATUS_ICONS['warning'] if success_rate >= 50 else STATUS_ICONS['error'],
+             ok if success_rate >= 70 else warn if success_rate >= 50 else err,
              'Detection capability'],
             ['Not Tested', str(not_tested), '<50',
-             STATUS_ICONS['success'] if not_tested < 50 else STATUS_ICONS['warning'] if not_tested < 100 else STATUS_ICONS['error'],
+             ok if not_tested < 50 else warn if not_tested < 100 else err,
              'Out of scope']
         ]
         
         # Create color map
-        cell_colors = self._create_table_colors(table_data)
-        
-        # Create table
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.2, 0.12, 0.12, 0.1, 0.36])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(11)
-        table.scale(1.2, TABLE_HEADER_HEIGHT)
+        color_keys = self._create_table_colors(table_data)
         
-        # Style header row
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 1: Assessment Summary',
-                    fontsize=14, fontweight='bold', pad=20,
-                    color=self.theme_manager.get_color('text_primary'))
+        self._render_table(ax, table_data, color_keys, [0.2, 0.12, 0.12, 0.1, 0.36],
+                           fontsize=11, row_scale=TABLE_HEADER_HEIGHT,
+                           title='Table 1: Assessment Summary')
         
         fig.text(0.5, 0.02, f"{data.general.company_name} - {data.general.report_date}",
                 ha='center', fontsize=9,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
-    def generate_table2(self, data: IDCAData, filepath: Path):
+    def generate_table2(self, data: IDCAData, filepath: Path,
+                        ranking: Optional[TacticRanking] = None):
         """Generate Table 2: MITRE Coverage Table"""
         if not data.mitre_tactics:
             return
+        if ranking is None:
+            ranking = TacticRanking.from_data(data)
         
         height = max(8, len(data.mitre_tactics) * 0.6)
-        fig, ax = self._setup_figure((self.fig_width, height))
-        ax.axis('tight')
-        ax.axis('off')
+        fig, ax = self._setup_figure((self.fig_width, height), reuse=True)
         
         # Prepare table data
         headers = ['Tactic', 'Tested', 'Triggered', 'Success %', 'Risk Level']
-        rows = []
-        
-        sorted_tactics = sorted(
-            data.mitre_tactics.items(),
-            key=lambda x: x[1].success_rate
-        )
         
-        for name, tactic in sorted_tactics:
-            risk_level = (
-                'Critical' if tactic.success_rate < 40
-                else 'Medium' if tactic.success_rate < 60
-                else 'Low'
-            )
-            rows.append([
-                name,
-                str(tactic.test_count),
-                str(tactic.triggered_count),
-                f"{tactic.success_rate:.1f}%",
-                risk_level
-            ])
+        buckets = ranking.buckets
+        rows = [
+            [name, str(tactic.test_count), str(tactic.triggered_count),
+             f"{tactic.success_rate:.1f}%", RISK_LEVELS[bucket]]
+            for (name, tactic), bucket in zip(ranking.tactics, buckets)
+        ]
         
         table_data = [headers] + rows
         
         # Create color map
-        cell_colors = []
-        cell_colors.append([self.theme_manager.get_color('accent_secondary')] * 5)
+        color_keys = self._table_color_grid(len(rows), 5)
+        color_keys[1:, 3] = color_keys[1:, 4] = np.array(RISK_COLOR_KEYS, dtype=object)[buckets]
         
-        for row in rows:
-            row_colors = [self.theme_manager.get_color('secondary')] * 5
-            rate = float(row[3].strip('%'))
-            
-            if rate < 40:
-                row_colors[3] = self.theme_manager.get_color('danger')
-                row_colors[4] = self.theme_manager.get_color('danger')
-            elif rate < 60:
-                row_colors[3] = self.theme_manager.get_color('warning')
-                row_colors[4] = self.theme_manager.get_color('warning')
-            else:
-                row_colors[3] = self.theme_manager.get_color('success')
-                row_colors[4] = self.theme_manager.get_color('success')
-            
-            cell_colors.append(row_colors)
-        
-        # Create table
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.28, 0.15, 0.15, 0.15, 0.15])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, TABLE_ROW_HEIGHT)
-        
-        # Style header row
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 2: MITRE ATT&CK Coverage Analysis',
-                    fontsize=14, fontweight='bold', pad=20,
-                    color=self.theme_manager.get_color('text_primary'))
+        self._render_table(ax, table_data, color_keys, [0.28, 0.15, 0.15, 0.15, 0.15],
+                           fontsize=10, row_scale=TABLE_ROW_HEIGHT,
+                           title='Table 2: MITRE ATT&CK Coverage Analysis')
         
         # Summary
-        avg_success = np.mean([t.success_rate for t in data.mitre_tactics.values()])
-        fig.text(0.5, 0.05, f'Average Success Rate: {avg_success:.1f}%',
+        fig.text(0.5, 0.05, f'Average Success Rate: {ranking.average:.1f}%',
                 ha='center', fontsize=10,
-                color=self.theme_manager.get_color('text_primary'))
+                color=self._c('text_primary'))
         
         fig.text(0.5, 0.02, f"{data.general.company_name}",
                 ha='center', fontsize=9,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
     def generate_table3(self, data: IDCAData, filepath: Path):
@@ -399,68 +510,38 @@ class VisualizationGenerator:
             return
         
         height = max(6, min(12, len(data.triggered_rules) * 0.5))
-        fig, ax = self._setup_figure((self.fig_width, height))
-        ax.axis('tight')
-        ax.axis('off')
+        fig, ax = self._setup_figure((self.fig_width, height), reuse=True)
         
         # Prepare table data
         headers = ['ID', 'Rule Name', 'MITRE ID', 'Tactic', 'Confidence']
-        rows = []
-        
-        for i, rule in enumerate(data.triggered_rules[:20], 1):
-            rule_name = (rule.name[:40] + '...' 
-                        if len(rule.name) > 40 else rule.name)
-            rows.append([
-                str(i),
-                rule_name,
-                rule.mitre_id,
-                rule.tactic,
-                f"{rule.confidence}%"
-            ])
+        shown_rules = data.triggered_rules[:20]
+        rows = [
+            [str(i), _truncate(rule.name, 40), rule.mitre_id, rule.tactic,
+             f"{rule.confidence}%"]
+            for i, rule in enumerate(shown_rules, 1)
+        ]
         
         table_data = [headers] + rows
         
-        # Create color map
-        cell_colors = []
-        cell_colors.append([self.theme_manager.get_color('accent_secondary')] * 5)
-        
-        for row in rows:
-            row_colors = [self.theme_manager.get_color('secondary')] * 5
-            confidence = int(row[4].strip('%'))
-            
-            if confidence >= 90:
-                row_colors[4] = self.theme_manager.get_color('success')
-            elif confidence >= 80:
-                row_colors[4] = self.theme_manager.get_color('warning')
-            else:
-                row_colors[4] = self.theme_manager.get_color('danger')
-            
-            cell_colors.append(row_colors)
-        
-        # Create table
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.08, 0.38, 0.15, 0.2, 0.12])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, TABLE_ROW_HEIGHT)
-        
-        # Style header row
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
+        # Create color map - confidence column from the numeric values
+        confidences = np.fromiter((rule.confidence for rule in shown_rules),
+                                  dtype=int, count=len(rows))
+        color_keys = self._table_color_grid(len(rows), 5)
+        color_keys[1:, 4] = np.select(
+            [confidences >= 90, confidences >= 80],
+            ['success', 'warning'],
+            default='danger'
+        )
         
-        ax.set_title('Table 3: Triggered Correlation Rules',
-                    fontsize=14, fontweight='bold', pad=20,
-                    color=self.theme_manager.get_color('text_primary'))
+        self._render_table(ax, table_data, color_keys, [0.08, 0.38, 0.15, 0.2, 0.12],
+                           fontsize=9, row_scale=TABLE_ROW_HEIGHT,
+                           title='Table 3: Triggered Correlation Rules')
         
         fig.text(0.5, 0.02,
                 f"Total: {len(data.triggered_rules)} rules - {data.general.company_name}",
                 ha='center', fontsize=9,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
     def generate_table4(self, data: IDCAData, filepath: Path):
@@ -469,81 +550,46 @@ class VisualizationGenerator:
             return
         
         height = max(6, min(12, len(data.undetected_techniques) * 0.5))
-        fig, ax = self._setup_figure((self.fig_width, height))
-        ax.axis('tight')
-        ax.axis('off')
+        fig, ax = self._setup_figure((self.fig_width, height), reuse=True)
         
         # Prepare table data
         headers = ['MITRE ID', 'Technique Name', 'Tactic', 'Criticality', 'Priority']
-        rows = []
-        
         # Sort by criticality
-        criticality_order = {'Critical': 0, 'Kritik': 0, 'High': 1, 'Yüksek': 1,
-                           'Medium': 2, 'Orta': 2, 'Low': 3, 'Düşük': 3}
+        criticality_rank = CRITICALITY_ORDER.get
         sorted_techniques = sorted(
             data.undetected_techniques,
-            key=lambda x: criticality_order.get(x.criticality, 4)
+            key=lambda x: criticality_rank(x.criticality, 4)
         )
         
-        for i, tech in enumerate(sorted_techniques[:20], 1):
-            tech_name = (tech.name[:35] + '...' 
-                        if len(tech.name) > 35 else tech.name)
-            rows.append([
-                tech.mitre_id,
-                tech_name,
-                tech.tactic,
-                tech.criticality,
-                f"P{i}"
-            ])
+        rows = [
+            [tech.mitre_id, _truncate(tech.name, 35), tech.tactic,
+             tech.criticality, f"P{i}"]
+            for i, tech in enumerate(sorted_techniques[:20], 1)
+        ]
         
         table_data = [headers] + rows
         
-        # Create color map
-        cell_colors = []
-        cell_colors.append([self.theme_manager.get_color('accent_secondary')] * 5)
+        # Create color map - criticality and priority columns share a color
+        criticality_colors = np.array([
+            CRITICALITY_COLOR_KEYS.get(row[3], 'secondary') for row in rows
+        ], dtype=object)
+        color_keys = self._table_color_grid(len(rows), 5)
+        color_keys[1:, 3] = color_keys[1:, 4] = criticality_colors
         
-        for row in rows:
-            row_colors = [self.theme_manager.get_color('secondary')] * 5
-            
-            if row[3] in ['Critical', 'Kritik']:
-                row_colors[3] = self.theme_manager.get_color('danger')
-                row_colors[4] = self.theme_manager.get_color('danger')
-            elif row[3] in ['High', 'Yüksek']:
-                row_colors[3] = self.theme_manager.get_color('warning')
-                row_colors[4] = self.theme_manager.get_color('warning')
-            
-            cell_colors.append(row_colors)
-        
-        # Create table
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.12, 0.35, 0.2, 0.12, 0.1])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, TABLE_ROW_HEIGHT)
-        
-        # Style header row
-        for i in range(5):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
-        
-        ax.set_title('Table 4: Undetected MITRE Techniques',
-                    fontsize=14, fontweight='bold', pad=20,
-                    color=self.theme_manager.get_color('text_primary'))
+        self._render_table(ax, table_data, color_keys, [0.12, 0.35, 0.2, 0.12, 0.1],
+                           fontsize=9, row_scale=TABLE_ROW_HEIGHT,
+                           title='Table 4: Undetected MITRE Techniques')
         
         # Count critical/high
-        critical_count = sum(1 for t in data.undetected_techniques 
-                           if t.criticality in ['Critical', 'Kritik'])
-        high_count = sum(1 for t in data.undetected_techniques 
-                        if t.criticality in ['High', 'Yüksek'])
+        ranks = [criticality_rank(t.criticality) for t in data.undetected_techniques]
+        critical_count = ranks.count(0)
+        high_count = ranks.count(1)
         
         fig.text(0.5, 0.02,
                 f"{STATUS_ICONS['warning']} {critical_count} Critical, {high_count} High priority techniques require immediate attention",
                 ha='center', fontsize=10, weight='bold',
-                color=self.theme_manager.get_color('warning'))
+                color=self._c('warning'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
     def generate_table5(self, data: IDCAData, filepath: Path):
@@ -552,71 +598,37 @@ class VisualizationGenerator:
             return
         
         height = max(6, min(12, len(data.recommendations) * 0.6))
-        fig, ax = self._setup_figure((self.fig_width, height))
-        ax.axis('tight')
-        ax.axis('off')
+        fig, ax = self._setup_figure((self.fig_width, height), reuse=True)
         
         # Prepare table data
         headers = ['Priority', 'Category', 'Recommendation', 'Impact']
-        rows = []
-        
-        for i, rec in enumerate(data.recommendations[:15], 1):
-            impact = 'High' if i <= 3 else 'Medium' if i <= 7 else 'Normal'
-            rec_text = (rec.text[:50] + '...' 
-                       if len(rec.text) > 50 else rec.text)
-            rows.append([
-                rec.priority,
-                rec.category,
-                rec_text,
-                impact
-            ])
+        rows = [
+            [rec.priority, rec.category, _truncate(rec.text, 50),
+             'High' if i <= 3 else 'Medium' if i <= 7 else 'Normal']
+            for i, rec in enumerate(data.recommendations[:15], 1)
+        ]
         
         table_data = [headers] + rows
         
-        # Create color map
-        cell_colors = []
-        cell_colors.append([self.theme_manager.get_color('accent_secondary')] * 4)
-        
-        for i, row in enumerate(rows):
-            row_colors = [self.theme_manager.get_color('secondary')] * 4
-            
-            if i < 3:
-                row_colors[0] = self.theme_manager.get_color('danger')
-                row_colors[3] = self.theme_manager.get_color('success')
-            elif i < 7:
-                row_colors[0] = self.theme_manager.get_color('warning')
-                row_colors[3] = self.theme_manager.get_color('warning')
-            
-            cell_colors.append(row_colors)
-        
-        # Create table
-        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
-                        cellColours=cell_colors,
-                        colWidths=[0.1, 0.2, 0.45, 0.15])
-        
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, TABLE_ROW_HEIGHT)
-        
-        # Style header row
-        for i in range(4):
-            cell = table[(0, i)]
-            cell.set_text_props(weight='bold', color='white')
+        # Create color map - rows 1-3 are high impact, 4-7 medium
+        color_keys = self._table_color_grid(len(rows), 4)
+        color_keys[1:4, 0] = 'danger'
+        color_keys[1:4, 3] = 'success'
+        color_keys[4:8, [0, 3]] = 'warning'
         
-        ax.set_title('Table 5: Recommended Correlation Rules',
-                    fontsize=14, fontweight='bold', pad=20,
-                    color=self.theme_manager.get_color('text_primary'))
+        self._render_table(ax, table_data, color_keys, [0.1, 0.2, 0.45, 0.15],
+                           fontsize=9, row_scale=TABLE_ROW_HEIGHT,
+                           title='Table 5: Recommended Correlation Rules')
         
         fig.text(0.5, 0.03, f'Total: {len(data.recommendations)} recommendations',
                 ha='center', fontsize=9, style='italic',
-                color=self.theme_manager.get_color('success'))
+                color=self._c('success'))
         
         fig.text(0.5, 0.005,
                 f"{data.general.company_name} - {data.general.prepared_by}",
                 ha='center', fontsize=8,
-                color=self.theme_manager.get_color('text_secondary'))
+                color=self._c('text_secondary'))
         
-        plt.tight_layout()
         self._save_figure(fig, filepath)
     
     def _setup_axes(self, ax):
@@ -625,86 +637,81 @@ class VisualizationGenerator:
             ax.set_facecolor('none')
             ax.patch.set_alpha(0)
         else:
-            ax.set_facecolor(self.theme_manager.get_color('surface'))
+            ax.set_facecolor(self._c('surface'))
         
-        ax.tick_params(colors=self.theme_manager.get_color('text_secondary'))
-        ax.spines['bottom'].set_color(self.theme_manager.get_color('border'))
-        ax.spines['top'].set_color(self.theme_manager.get_color('border'))
-        ax.spines['left'].set_color(self.theme_manager.get_color('border'))
-        ax.spines['right'].set_color(self.theme_manager.get_color('border'))
+        ax.tick_params(colors=self._c('text_secondary'))
+        ax.spines['bottom'].set_color(self._c('border'))
+        ax.spines['top'].set_color(self._c('border'))
+        ax.spines['left'].set_color(self._c('border'))
+        ax.spines['right'].set_color(self._c('border'))
     
-    def _create_table_colors(self, table_data: List[List[str]]) -> List[List[str]]:
-        """Create color map for table"""
-        cell_colors = []
+    def _render_table(self, ax, table_data: List[List[str]], color_keys: np.ndarray,
+                      col_widths: List[float], fontsize: int, row_scale: float, title: str):
+        """Draw a themed table with a bold header row and title
         
-        # Header row
-        cell_colors.append([self.theme_manager.get_color('accent_secondary')] * len(table_data[0]))
+        color_keys holds a theme color key per cell; they are resolved to
+        RGBA here, once the grid is final.
+        """
+        ax.axis('off')
+        c = self._c
+        cell_colors = [[c(key) for key in row] for row in color_keys.tolist()]
         
-        # Data rows
-        for row in table_data[1:]:
-            row_colors = [self.theme_manager.get_color('secondary')] * len(row)
-            
-            # Color status column based on icon
-            if len(row) > 3:
-                if STATUS_ICONS['success'] in row[3]:
-                    row_colors[3] = self.theme_manager.get_color('success')
-                elif STATUS_ICONS['warning'] in row[3]:
-                    row_colors[3] = self.theme_manager.get_color('warning')
-                elif STATUS_ICONS['error'] in row[3]:
-                    row_colors[3] = self.theme_manager.get_color('danger')
-            
-            cell_colors.append(row_colors)
+        table = ax.table(cellText=table_data, cellLoc='center', loc='center',
+                        cellColours=cell_colors, colWidths=col_widths)
+        
+        table.auto_set_font_size(False)
+        table.set_fontsize(fontsize)
+        table.scale(1.2, row_scale)
+        
+        # Style header row
+        for i in range(len(table_data[0])):
+            table[(0, i)].set_text_props(weight='bold', color='white')
         
-        return cell_colors
+        ax.set_title(title, fontsize=14, fontweight='bold', pad=20,
+                    color=self._c('text_primary'))
+        return table
     
-    def _save_figure(self, fig: plt.Figure, filepath: Path):
-        """Save figure with proper settings"""
-        if self.transparent:
-            plt.savefig(filepath, dpi=self.dpi, transparent=True,
-                       bbox_inches='tight', pad_inches=0.1)
-        else:
-            plt.savefig(filepath, dpi=self.dpi,
-                       facecolor=self.theme_manager.get_color('background'),
-                       bbox_inches='tight', pad_inches=0.1)
-        plt.close(fig)
+    def _risk_colors(self) -> np.ndarray:
+        """RGBA rows for RISK_COLOR_KEYS, indexable by a bucket array"""
+        return np.array([self._c(key) for key in RISK_COLOR_KEYS])
+    
+    def _table_color_grid(self, n_rows: int, n_cols: int) -> np.ndarray:
+        """Color key grid for a header plus n_rows data rows in the base table colors"""
+        color_keys = np.full((n_rows + 1, n_cols), 'secondary', dtype=object)
+        color_keys[0] = 'accent_secondary'
+        return color_keys
+    
+    def _create_table_colors(self, table_data: List[List[str]]) -> np.ndarray:
+        """Create color key grid for table"""
+        color_keys = self._table_color_grid(len(table_data) - 1, len(table_data[0]))
+        
+        # Color status column based on icon
+        if color_keys.shape[1] > 3:
+            color_keys[1:, 3] = [
+                STATUS_ICON_COLOR_KEYS.get(row[3], 'secondary')
+                for row in table_data[1:]
+            ]
+        
+        return color_keys
+    
+    def _save_figure(self, fig: Figure, filepath: Path):
+        """Save figure with proper settings
+        
+        Renders straight through the figure's Agg canvas instead of
+        savefig(), skipping the canvas switch and the facecolor/dpi
+        save-and-restore that print_figure does. The figure patches already
+        carry the transparent or theme background from setup. No
+        bbox_inches='tight' either: REPORT_LAYOUT keeps the footer inside.
+        """
+        fig.set_dpi(self.dpi)
+        fig.canvas.print_png(filepath, pil_kwargs=PNG_SAVE_OPTIONS)
     
     # API methods that return figures instead of saving them
-    def create_test_coverage_chart(self, data: IDCAData) -> plt.Figure:
+    def create_test_coverage_chart(self, data: IDCAData) -> Figure:
         """Create test coverage pie chart and return figure"""
-        fig, ax = self._setup_figure()
-        
-        # Data
-        total = data.test_results.total_rules
-        tested = data.test_results.tested_rules
-        not_tested = total - tested
-        
-        if total == 0:
-            ax.text(0.5, 0.5, 'No data available', 
-                   transform=ax.transAxes, ha='center', va='center',
-                   fontsize=16, color=self.theme_manager.get_color('text_primary'))
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            return fig
-        
-        # Create pie chart
-        sizes = [tested, not_tested]
-        labels = ['Tested', 'Not Tested']
-        colors = [self.theme_manager.get_color('success'), 
-                 self.theme_manager.get_color('error')]
-        
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors,
-                                          autopct='%1.1f%%', startangle=90,
-                                          textprops={'color': self.theme_manager.get_color('text_primary')})
-        
-        # Title
-        ax.set_title('Test Coverage Overview', fontsize=16, 
-                    color=self.theme_manager.get_color('text_primary'),
-                    pad=20)
-        
-        return fig
+        return self._build_coverage_figure(data)
     
-    def create_mitre_heatmap(self, data: IDCAData) -> plt.Figure:
+    def create_mitre_heatmap(self, data: IDCAData) -> Figure:
         """Create MITRE ATT&CK heatmap and return figure"""
         fig, ax = self._setup_figure(figsize=(12, 8))
         
@@ -720,7 +727,7 @@ class VisualizationGenerator:
         if not mitre_data:
             ax.text(0.5, 0.5, 'No MITRE data available', 
                    transform=ax.transAxes, ha='center', va='center',
-                   fontsize=16, color=self.theme_manager.get_color('text_primary'))
+                   fontsize=16, color=self._c('text_primary'))
             ax.axis('off')
             return fig
         
@@ -731,16 +738,16 @@ class VisualizationGenerator:
         
         # Create bar chart as heatmap
         y_pos = np.arange(len(tactics))
-        bars = ax.barh(y_pos, coverage, color=self.theme_manager.get_color('primary'))
+        bars = ax.barh(y_pos, coverage, color=self._c('primary'))
         
         # Color bars based on coverage
         for i, (bar, cov) in enumerate(zip(bars, coverage)):
             if cov >= 80:
-                bar.set_color(self.theme_manager.get_color('success'))
+                bar.set_color(self._c('success'))
             elif cov >= 50:
-                bar.set_color(self.theme_manager.get_color('warning'))
+                bar.set_color(self._c('warning'))
             else:
-                bar.set_color(self.theme_manager.get_color('error'))
+                bar.set_color(self._c('error'))
         
         # Customize
         ax.set_yticks(y_pos)
@@ -750,19 +757,17 @@ class VisualizationGenerator:
         ax.set_xlim(0, 100)
         
         # Add percentage labels
-        for i, (bar, cov) in enumerate(zip(bars, coverage)):
-            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2, 
-                   f'{cov:.1f}%', va='center')
+        ax.bar_label(bars, fmt='%.1f%%', padding=3)
         
         # Apply theme colors
-        ax.tick_params(colors=self.theme_manager.get_color('text_primary'))
-        ax.xaxis.label.set_color(self.theme_manager.get_color('text_primary'))
-        ax.title.set_color(self.theme_manager.get_color('text_primary'))
+        ax.tick_params(colors=self._c('text_primary'))
+        ax.xaxis.label.set_color(self._c('text_primary'))
+        ax.title.set_color(self._c('text_primary'))
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def create_severity_distribution(self, data: IDCAData) -> plt.Figure:
+    def create_severity_distribution(self, data: IDCAData) -> Figure:
         """Create severity distribution chart and return figure"""
         fig, ax = self._setup_figure()
         
@@ -776,10 +781,10 @@ class VisualizationGenerator:
         # Create bar chart
         severities = list(severity_counts.keys())
         counts = list(severity_counts.values())
-        colors = [self.theme_manager.get_color('error'),
-                 self.theme_manager.get_color('warning'),
-                 self.theme_manager.get_color('info'),
-                 self.theme_manager.get_color('success')]
+        colors = [self._c('error'),
+                 self._c('warning'),
+                 self._c('info'),
+                 self._c('success')]
         
         bars = ax.bar(severities, counts, color=colors)
         
@@ -794,13 +799,13 @@ class VisualizationGenerator:
         ax.set_title('Findings by Severity', fontsize=16, pad=20)
         
         # Apply theme colors
-        ax.tick_params(colors=self.theme_manager.get_color('text_primary'))
-        ax.yaxis.label.set_color(self.theme_manager.get_color('text_primary'))
-        ax.title.set_color(self.theme_manager.get_color('text_primary'))
+        ax.tick_params(colors=self._c('text_primary'))
+        ax.yaxis.label.set_color(self._c('text_primary'))
+        ax.title.set_color(self._c('text_primary'))
         
         return fig
     
-    def create_top_gaps_chart(self, data: IDCAData) -> plt.Figure:
+    def create_top_gaps_chart(self, data: IDCAData) -> Figure:
         """Create top security gaps chart and return figure"""
         fig, ax = self._setup_figure(figsize=(10, 6))
         
@@ -815,18 +820,17 @@ class VisualizationGenerator:
         if not top_gaps:
             ax.text(0.5, 0.5, 'No security gaps identified', 
                    transform=ax.transAxes, ha='center', va='center',
-                   fontsize=16, color=self.theme_manager.get_color('text_primary'))
+                   fontsize=16, color=self._c('text_primary'))
             ax.axis('off')
             return fig
         
         # Create horizontal bar chart
-        test_names = [test.test_id[:50] + '...' if len(test.test_id) > 50 
-                     else test.test_id for test in top_gaps]
+        test_names = [_truncate(test.test_id, 50) for test in top_gaps]
         y_pos = np.arange(len(test_names))
         
         # Use status to determine color
-        colors = [self.theme_manager.get_color('error') if test.status == 'Failed'
-                 else self.theme_manager.get_color('warning') 
+        colors = [self._c('error') if test.status == 'Failed'
+                 else self._c('warning') 
                  for test in top_gaps]
         
         ax.barh(y_pos, [1] * len(test_names), color=colors)
@@ -844,20 +848,21 @@ class VisualizationGenerator:
         # Add status labels
         for i, test in enumerate(top_gaps):
             ax.text(1.05, i, test.status, va='center', fontsize=10,
-                   color=self.theme_manager.get_color('text_secondary'))
+                   color=self._c('text_secondary'))
         
         # Apply theme colors
-        ax.tick_params(colors=self.theme_manager.get_color('text_primary'))
-        ax.xaxis.label.set_color(self.theme_manager.get_color('text_primary'))
-        ax.title.set_color(self.theme_manager.get_color('text_primary'))
+        ax.tick_params(colors=self._c('text_primary'))
+        ax.xaxis.label.set_color(self._c('text_primary'))
+        ax.title.set_color(self._c('text_primary'))
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def create_summary_dashboard(self, data: IDCAData) -> plt.Figure:
+    def create_summary_dashboard(self, data: IDCAData) -> Figure:
         """Create summary dashboard and return figure"""
-        fig = plt.figure(figsize=(12, 8))
-        fig.patch.set_facecolor(self.theme_manager.get_color('background'))
+        self._refresh_colors()
+        fig = Figure(figsize=(12, 8))
+        fig.patch.set_facecolor(self._c('background'))
         
         # Create grid
         gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
@@ -882,15 +887,15 @@ class VisualizationGenerator:
         ax1.text(0.5, 0.5, metrics_text, transform=ax1.transAxes,
                 ha='center', va='center', fontsize=14,
                 bbox=dict(boxstyle="round,pad=0.3", 
-                         facecolor=self.theme_manager.get_color('surface'),
-                         edgecolor=self.theme_manager.get_color('border')))
+                         facecolor=self._c('surface'),
+                         edgecolor=self._c('border')))
         
         # Test coverage pie
         ax2 = fig.add_subplot(gs[1, 0])
         if total_tests > 0:
             sizes = [passed_tests, total_tests - passed_tests]
-            colors = [self.theme_manager.get_color('success'), 
-                     self.theme_manager.get_color('error')]
+            colors = [self._c('success'), 
+                     self._c('error')]
             ax2.pie(sizes, labels=['Passed', 'Failed'], colors=colors,
                    autopct='%1.1f%%', startangle=90)
             ax2.set_title('Test Results', fontsize=12)
@@ -908,10 +913,10 @@ class VisualizationGenerator:
         
         if sum(severity_counts.values()) > 0:
             ax3.bar(severity_counts.keys(), severity_counts.values(),
-                   color=[self.theme_manager.get_color('error'),
-                         self.theme_manager.get_color('warning'),
-                         self.theme_manager.get_color('info'),
-                         self.theme_manager.get_color('success')])
+                   color=[self._c('error'),
+                         self._c('warning'),
+                         self._c('info'),
+                         self._c('success')])
             ax3.set_title('Findings by Severity', fontsize=12)
             ax3.set_ylabel('Count')
         else:
@@ -922,8 +927,7 @@ class VisualizationGenerator:
         # MITRE coverage summary
         ax4 = fig.add_subplot(gs[1:, 2])
         if data.mitre_tactics:
-            tactics = [t.name[:15] + '...' if len(t.name) > 15 else t.name 
-                      for t in data.mitre_tactics[:5]]
+            tactics = [_truncate(t.name, 15) for t in data.mitre_tactics[:5]]
             coverage = [t.tested_techniques / t.total_techniques * 100 
                        if t.total_techniques > 0 else 0 
                        for t in data.mitre_tactics[:5]]
@@ -939,17 +943,17 @@ class VisualizationGenerator:
         
         # Overall title
         fig.suptitle('Security Assessment Summary Dashboard', 
-                    fontsize=18, color=self.theme_manager.get_color('text_primary'))
+                    fontsize=18, color=self._c('text_primary'))
         
         # Apply theme to all axes
         for ax in [ax2, ax3, ax4]:
             if ax.get_visible():
-                ax.set_facecolor(self.theme_manager.get_color('surface'))
-                ax.tick_params(colors=self.theme_manager.get_color('text_primary'))
-                ax.title.set_color(self.theme_manager.get_color('text_primary'))
+                ax.set_facecolor(self._c('surface'))
+                ax.tick_params(colors=self._c('text_primary'))
+                ax.title.set_color(self._c('text_primary'))
                 if hasattr(ax, 'xaxis') and ax.xaxis.label:
-                    ax.xaxis.label.set_color(self.theme_manager.get_color('text_primary'))
+                    ax.xaxis.label.set_color(self._c('text_primary'))
                 if hasattr(ax, 'yaxis') and ax.yaxis.label:
-                    ax.yaxis.label.set_color(self.theme_manager.get_color('text_primary'))
+                    ax.yaxis.label.set_color(self._c('text_primary'))
         
         return fig
\ No newline at end of file
@@ -5,10 +5,16 @@ Data models for IDCA Visualizer
 """
 
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 @dataclass
 class GeneralInfo:
@@ -149,6 +155,10 @@ class MitreTactic:
 @dataclass
 class TriggeredRule:
     """Triggered rule data"""
+    # Row records are created per table row; slots keep them small.
+    # (dataclass(slots=True) needs Python 3.10, so they are listed by hand)
+    __slots__ = ('name', 'mitre_id', 'tactic', 'confidence')
+    
     name: str
     mitre_id: str
     tactic: str
@@ -178,6 +188,8 @@ class TriggeredRule:
 @dataclass
 class UndetectedTechnique:
     """Undetected technique data"""
+    __slots__ = ('mitre_id', 'name', 'tactic', 'criticality')
+    
     mitre_id: str
     name: str
     tactic: str
@@ -208,6 +220,8 @@ class UndetectedTechnique:
 @dataclass
 class Recommendation:
     """Recommendation data"""
+    __slots__ = ('priority', 'category', 'text')
+    
     priority: str
     category: str
     text: str
@@ -238,25 +252,25 @@ class IDCAData:
     undetected_techniques: List[UndetectedTechnique] = field(default_factory=list)
     recommendations: List[Recommendation] = field(default_factory=list)
     
-    def validate(self) -> List[str]:
-        """Validate all data"""
+    def validate(self, limit: Optional[int] = None) -> List[str]:
+        """Validate all data
+        
+        With a limit, validation stops as soon as that many errors are found.
+        """
         errors = []
         
         # Validate each component
-        errors.extend(self.general.validate())
-        errors.extend(self.test_results.validate())
-        
-        for tactic in self.mitre_tactics.values():
-            errors.extend(tactic.validate())
-        
-        for rule in self.triggered_rules:
-            errors.extend(rule.validate())
-        
-        for technique in self.undetected_techniques:
-            errors.extend(technique.validate())
-        
-        for rec in self.recommendations:
-            errors.extend(rec.validate())
+        components = chain(
+            (self.general, self.test_results),
+            self.mitre_tactics.values(),
+            self.triggered_rules,
+            self.undetected_techniques,
+            self.recommendations
+        )
+        for component in components:
+            errors.extend(component.validate())
+            if limit is not None and len(errors) >= limit:
+                return errors[:limit]
         
         return errors
     
@@ -336,12 +350,23 @@ class IDCAData:
     
     def save_to_json(self, filepath: str):
         """Save data to JSON file"""
+        if orjson is not None:
+            # orjson always writes UTF-8 without escaping non-ASCII
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            return
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
     
     @classmethod
     def load_from_json(cls, filepath: str) -> 'IDCAData':
         """Load data from JSON file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            # orjson parses the raw UTF-8 bytes directly
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         return cls.from_dict(data)
\ No newline at end of file
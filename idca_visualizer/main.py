@@ -7,15 +7,15 @@ Version 6.0 - Modular and Improved
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import matplotlib
-matplotlib.use('TkAgg')
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 from pathlib import Path
 import os
 import sys
 import json
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Callable
 
 # Add project root to path
@@ -31,10 +31,129 @@ from data.models import (
 from ui.widgets import ValidatedEntry, EnhancedTable, CollapsibleFrame, StatusBar
 from ui.enhanced_widgets import MITRETable, AutoCompleteCombobox, NumericEntry
 from utils.validators import InputValidator, CrossFieldValidator
-from core.visualizations import VisualizationGenerator
 from utils.csv_handler import CSVHandler, CSVMappingDialog
 
 
+@lru_cache(maxsize=1)
+def _configure_matplotlib(backend: str = 'TkAgg'):
+    """Import matplotlib on first use and apply the app-wide settings"""
+    import matplotlib
+    matplotlib.use(backend)
+    matplotlib.rcParams.update(MATPLOTLIB_PARAMS)
+
+
+# Translation table that strips '%' from confidence values
+_PCT = str.maketrans('', '', '%')
+
+
+def _normalize_confidence(text: str) -> str:
+    """Store confidence cells as plain digits ('95%' -> '95'); other text is kept"""
+    value = text.strip().translate(_PCT)
+    return value if value.isdecimal() else text
+
+
+# strftime pattern for the file names offered by the save dialogs
+_SAVE_NAME_FORMAT = 'IDCA_%Y%m%d_%H%M%S'
+
+
+# Ordering used to pick the dialog for a batch of queued messages
+_MESSAGE_SEVERITY = {'info': 0, 'warning': 1, 'error': 2}
+
+
+def _format_dialog_errors(errors: List[str]) -> str:
+    """First MAX_DIALOG_ERRORS validation errors, one per line"""
+    text = "\n".join(errors[:MAX_DIALOG_ERRORS])
+    if len(errors) > MAX_DIALOG_ERRORS:
+        text += "\n..."
+    return text
+
+
+def _default_save_name(extension: str) -> str:
+    """Timestamped default file name such as 'IDCA_20240101_120000.json'"""
+    return datetime.now().strftime(_SAVE_NAME_FORMAT) + extension
+
+
+# Report visuals: file name, VisualizationGenerator method, the data
+# section it needs (None if always drawn) and the error when that is empty
+_VISUAL_SPECS = (
+    ('Figure_1_Test_Coverage', 'generate_figure1', None, None),
+    ('Figure_2_Test_Status', 'generate_figure2', None, None),
+    ('Table_1_Summary', 'generate_table1', None, None),
+    ('Table_2_MITRE_Coverage', 'generate_table2', 'mitre_tactics', "No MITRE data"),
+    ('Table_3_Triggered_Rules', 'generate_table3', 'triggered_rules', "No triggered rules data"),
+    ('Table_4_Undetected_Techniques', 'generate_table4', 'undetected_techniques',
+     "No undetected techniques data"),
+    ('Table_5_Recommendations', 'generate_table5', 'recommendations', "No recommendations data")
+)
+
+
+def _render_visual(generator, data: IDCAData, output_dir: Path, spec: tuple,
+                   ranking=None):
+    """Render one _VISUAL_SPECS entry into the output directory
+    
+    ranking is the TacticRanking shared by the visuals that sort tactics.
+    """
+    visual_name, method, section, missing_message = spec
+    if section is not None and not getattr(data, section):
+        raise Exception(missing_message)
+    
+    filepath = output_dir / f"{visual_name}.png"
+    if method in generator.TACTIC_RANKING_METHODS:
+        getattr(generator, method)(data, filepath, ranking=ranking)
+    else:
+        getattr(generator, method)(data, filepath)
+
+
+# Sample payload for 'Sample Data'; IDCAData.from_dict only reads it, so
+# one shared read-only mapping is reused instead of rebuilding it per click
+_SAMPLE_DATA = MappingProxyType({
+    'general': {
+        'company_name': 'Example Corporation',
+        'report_date': 'January 2025',
+        'prepared_by': 'Security Team',
+        'report_id': 'IDCA-2025-001',
+        'report_title': 'Security Assessment Report',
+        'classification': 'Confidential'
+    },
+    'test_results': {
+        'total_rules': 291,
+        'tested_rules': 114,
+        'triggered_rules': 65
+    },
+    'mitre_tactics': {
+        'Initial Access': {'test': 8, 'triggered': 3, 'rate': 37.5},
+        'Execution': {'test': 12, 'triggered': 5, 'rate': 41.7},
+        'Persistence': {'test': 16, 'triggered': 8, 'rate': 50.0},
+        'Privilege Escalation': {'test': 10, 'triggered': 3, 'rate': 30.0}
+    },
+    'triggered_rules': [
+        {'name': 'Suspicious PowerShell Command', 'mitre': 'T1059.001',
+         'tactic': 'Execution', 'confidence': '95'},
+        {'name': 'Brute Force Attack Detected', 'mitre': 'T1110',
+         'tactic': 'Credential Access', 'confidence': '88'}
+    ],
+    'undetected_techniques': [
+        {'id': 'T1566.001', 'name': 'Spearphishing Attachment',
+         'tactic': 'Initial Access', 'criticality': 'Critical'},
+        {'id': 'T1548.002', 'name': 'Bypass UAC',
+         'tactic': 'Privilege Escalation', 'criticality': 'High'}
+    ],
+    'recommendations': [
+        {'priority': 'P1', 'category': 'Log Sources',
+         'text': 'Enable Windows Security event logging on all critical servers'},
+        {'priority': 'P2', 'category': 'Rule Optimization',
+         'text': 'Adjust threshold values for failed authentication rules'}
+    ]
+})
+
+
+@lru_cache(maxsize=1)
+def _load_guide_text() -> str:
+    """Read the user guide on first use; later opens reuse the cached text"""
+    guide = (DATA_DIR / "guide.txt").read_text(encoding=ENCODING)
+    return guide.format(app_name=APP_NAME)
+
+
 class IDCAVisualizerApp:
     """Main application class"""
     
@@ -45,15 +164,24 @@ class IDCAVisualizerApp:
         # Initialize components
         self.theme_manager = ThemeManager()
         self.data = IDCAData()
-        self.visualization_generator = VisualizationGenerator(self.theme_manager)
+        # matplotlib is only imported once a preview or report is requested
+        self._visualization_generator = None
         
         # Settings
         self.transparent_bg = tk.BooleanVar(value=True)
         self.output_dir = OUTPUT_DIR
-        
-        # Apply matplotlib settings
-        for key, value in MATPLOTLIB_PARAMS.items():
-            plt.rcParams[key] = value
+        self._status_after_id = None
+        # Set whenever form contents may have changed since the last collect
+        self._data_dirty = True
+        # Bumped on every change; part of the key that skips identical previews
+        self._data_serial = 0
+        self._last_preview_key = None
+        # (data serial, data object, errors) from the last validation
+        self._validation_cache = None
+        # (kind, title, text) messages shown together by _flush_messages
+        self._pending_messages = []
+        # Text variables of the general/test entries; kept so Tk does not drop them
+        self._form_vars = []
         
         # Setup window
         self._setup_window()
@@ -65,7 +193,7 @@ class IDCAVisualizerApp:
         self._show_welcome()
         
         # Update status
-        self._update_data_status()
+        self._schedule_data_status_update()
     
     def _setup_window(self):
         """Configure main window"""
@@ -121,6 +249,13 @@ class IDCAVisualizerApp:
         # Status bar
         self.status_bar = StatusBar(main_frame)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, pady=(5, 0))
+        
+        # Any typing or dropdown selection may change form data; the general
+        # and test entries also mark it through their text variables
+        self.root.bind_all('<KeyRelease>', self._mark_data_dirty, add='+')
+        self.root.bind_all('<<ComboboxSelected>>', self._mark_data_dirty, add='+')
+        for table in (self.triggered_table, self.undetected_table, self.recommendations_table):
+            table.set_on_change_callback(self._schedule_data_status_update)
     
     def _configure_styles(self):
         """Configure ttk styles"""
@@ -228,6 +363,7 @@ class IDCAVisualizerApp:
             
             # Entry widget
             entry = ValidatedEntry(frame, validator=validator, error_var=error_var,
+                                 textvariable=self._create_form_var(),
                                  width=35, font=('Arial', 10))
             entry.grid(row=i, column=1, pady=5, sticky='ew')
             
@@ -292,6 +428,7 @@ class IDCAVisualizerApp:
             
             error_var = tk.StringVar()
             entry = ValidatedEntry(content, validator=validator, error_var=error_var,
+                                 textvariable=self._create_form_var(),
                                  width=15, font=('Arial', 11))
             entry.grid(row=i, column=1, pady=8, padx=10)
             entry.bind('<KeyRelease>', lambda e: self._calculate_test_stats())
@@ -355,7 +492,7 @@ class IDCAVisualizerApp:
         self.mitre_table.pack(fill=tk.BOTH, expand=True)
         
         # Set callback for automatic calculation
-        self.mitre_table.set_on_change_callback(self._update_data_status)
+        self.mitre_table.set_on_change_callback(self._schedule_data_status_update)
     
     def _create_rules_tab(self):
         """Create rules tab"""
@@ -375,7 +512,8 @@ class IDCAVisualizerApp:
         
         columns = ['Rule Name', 'MITRE ID', 'Tactic', 'Confidence %']
         self.triggered_table = EnhancedTable(triggered_tab, columns, rows=5,
-                                           column_widths=[30, 15, 20, 12])
+                                           column_widths=[30, 15, 20, 12],
+                                           column_formatters={3: _normalize_confidence})
         self.triggered_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # Undetected techniques tab
@@ -409,19 +547,13 @@ class IDCAVisualizerApp:
         ttk.Label(main_frame, text="Recommendation list for improving detection",
                  font=('Arial', 9), foreground='blue').pack(pady=5)
         
+        # Priorities are numbered automatically and cannot be edited
         columns = ['Priority', 'Category', 'Recommendation Text']
         self.recommendations_table = EnhancedTable(main_frame, columns, rows=5,
-                                                 column_widths=[10, 20, 50])
+                                                 column_widths=[10, 20, 50],
+                                                 readonly_columns=[0],
+                                                 new_row_values=lambda i: [f"P{i+1}", '', ''])
         self.recommendations_table.pack(fill=tk.BOTH, expand=True)
-        
-        # Set up priority numbering
-        self._setup_recommendation_priorities()
-    
-    def _setup_recommendation_priorities(self):
-        """Set up automatic priority numbering"""
-        for i, row in enumerate(self.recommendations_table.entries):
-            row[0].insert(0, f"P{i+1}")
-            row[0].config(state='readonly')
     
     def _create_settings_tab(self):
         """Create settings tab"""
@@ -538,6 +670,12 @@ class IDCAVisualizerApp:
         ], width=25)
         self.preview_combo.pack(side=tk.LEFT, padx=10)
         self.preview_combo.current(0)
+        
+        # Figure previews keyed by the combo prefix; everything else is a table
+        self._preview_dispatch = {
+            'Figure 1': self._preview_figure1,
+            'Figure 2': self._preview_figure2
+        }
         self.preview_combo.bind('<<ComboboxSelected>>', lambda e: self._update_preview())
         
         ttk.Button(header, text="🔄", command=self._update_preview, width=3).pack(side=tk.LEFT)
@@ -545,12 +683,39 @@ class IDCAVisualizerApp:
         # Preview area
         self.preview_frame = ttk.LabelFrame(parent, text="", padding=5)
         self.preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Figure and canvas are created on the first update and then redrawn
+        self.preview_fig = None
+        self.preview_canvas = None
+        self.preview_error_label = None
+    
+    def _ensure_preview_canvas(self):
+        """Create the preview figure and canvas the first time they are needed"""
+        if self.preview_canvas is not None:
+            return
+        
+        _configure_matplotlib()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        
+        self.preview_fig = Figure(figsize=(5, 4), dpi=80)
+        self.preview_canvas = FigureCanvasTkAgg(self.preview_fig, master=self.preview_frame)
+        self.preview_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    
+    @property
+    def visualization_generator(self):
+        """Report generator, created on first use"""
+        if self._visualization_generator is None:
+            _configure_matplotlib()
+            from core.visualizations import VisualizationGenerator
+            self._visualization_generator = VisualizationGenerator(self.theme_manager)
+        return self._visualization_generator
     
     # Event handlers and methods
     
     def _on_tab_changed(self, event):
         """Handle tab change event"""
-        self._update_data_status()
+        self._schedule_data_status_update()
     
     def _calculate_test_stats(self):
         """Calculate test statistics"""
@@ -613,16 +778,27 @@ class IDCAVisualizerApp:
     
     def _update_preview(self):
         """Update visualization preview"""
-        # Clear previous preview
-        for widget in self.preview_frame.winfo_children():
-            widget.destroy()
+        # Nothing to redraw if the selection, data, theme and background are unchanged
+        preview_key = (self.preview_combo.get(), self._data_serial,
+                       self.theme_manager.current_theme.name, self.transparent_bg.get())
+        if preview_key == self._last_preview_key:
+            return
+        
+        self._ensure_preview_canvas()
+        
+        # Restore the canvas if the last update failed
+        if self.preview_error_label is not None:
+            self.preview_error_label.destroy()
+            self.preview_error_label = None
+            self.preview_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         try:
             # Collect current data
             self._collect_data()
             
-            # Create figure
-            fig = plt.figure(figsize=(5, 4), dpi=80)
+            # Reuse the preview figure
+            fig = self.preview_fig
+            fig.clear()
             
             # Apply theme
             self.theme_manager.apply_to_matplotlib(self.transparent_bg.get())
@@ -633,27 +809,27 @@ class IDCAVisualizerApp:
                 fig.patch.set_alpha(0)
             else:
                 fig.patch.set_facecolor(self.theme_manager.get_color('background'))
+                fig.patch.set_alpha(1)
             
             # Generate preview based on selection
             selected = self.preview_combo.get()
             
-            if 'Figure 1' in selected:
-                self._preview_figure1(fig)
-            elif 'Figure 2' in selected:
-                self._preview_figure2(fig)
+            preview = self._preview_dispatch.get(selected.split(' - ', 1)[0])
+            if preview:
+                preview(fig)
             else:
                 self._preview_table(fig, selected)
             
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.preview_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.preview_canvas.draw_idle()
+            self._last_preview_key = preview_key
             
         except Exception as e:
-            error_label = ttk.Label(self.preview_frame,
-                                   text=f"Preview error:\n{str(e)}",
-                                   font=('Arial', 10))
-            error_label.pack(expand=True)
+            self._last_preview_key = None
+            self.preview_canvas.get_tk_widget().pack_forget()
+            self.preview_error_label = ttk.Label(self.preview_frame,
+                                                text=f"Preview error:\n{str(e)}",
+                                                font=('Arial', 10))
+            self.preview_error_label.pack(expand=True)
     
     def _preview_figure1(self, fig):
         """Preview Figure 1"""
@@ -710,7 +886,6 @@ class IDCAVisualizerApp:
     def _preview_table(self, fig, selected):
         """Preview table visualization"""
         ax = fig.add_subplot(111)
-        ax.axis('tight')
         ax.axis('off')
         
         # Sample table
@@ -737,6 +912,9 @@ class IDCAVisualizerApp:
     
     def _collect_data(self):
         """Collect all data from forms"""
+        if not self._data_dirty:
+            return
+        
         # General info
         for key, widget in self.general_widgets.items():
             setattr(self.data.general, key, widget.get())
@@ -765,52 +943,69 @@ class IDCAVisualizerApp:
                 except:
                     pass
         
-        # Triggered rules
-        self.data.triggered_rules.clear()
-        for row in self.triggered_table.get_data():
-            if len(row) >= 4 and row[0]:
-                try:
-                    rule = TriggeredRule(
-                        name=row[0],
-                        mitre_id=row[1],
-                        tactic=row[2],
-                        confidence=int(row[3].replace('%', '') or 0)
-                    )
-                    self.data.triggered_rules.append(rule)
-                except:
-                    pass
+        data = self.data
+        
+        # Triggered rules - confidences are normalized to digits when entered,
+        # so rows with any other confidence text are skipped
+        data.triggered_rules[:] = [
+            TriggeredRule(name=row[0], mitre_id=row[1], tactic=row[2],
+                          confidence=int(row[3] or 0))
+            for row in self.triggered_table.get_data()
+            if len(row) >= 4 and row[0] and (not row[3] or row[3].isdecimal())
+        ]
         
         # Undetected techniques
-        self.data.undetected_techniques.clear()
-        for row in self.undetected_table.get_data():
-            if len(row) >= 4 and row[0]:
-                try:
-                    tech = UndetectedTechnique(
-                        mitre_id=row[0],
-                        name=row[1],
-                        tactic=row[2],
-                        criticality=row[3]
-                    )
-                    self.data.undetected_techniques.append(tech)
-                except:
-                    pass
+        data.undetected_techniques[:] = [
+            UndetectedTechnique(mitre_id=row[0], name=row[1], tactic=row[2], criticality=row[3])
+            for row in self.undetected_table.get_data()
+            if len(row) >= 4 and row[0]
+        ]
         
         # Recommendations
-        self.data.recommendations.clear()
-        for row in self.recommendations_table.get_data():
-            if len(row) >= 3 and row[2]:
-                try:
-                    rec = Recommendation(
-                        priority=row[0],
-                        category=row[1],
-                        text=row[2]
-                    )
-                    self.data.recommendations.append(rec)
-                except:
-                    pass
+        data.recommendations[:] = [
+            Recommendation(priority=row[0], category=row[1], text=row[2])
+            for row in self.recommendations_table.get_data()
+            if len(row) >= 3 and row[2]
+        ]
+        
+        self._data_dirty = False
+    
+    def _validate_data(self) -> List[str]:
+        """Validate the collected data, reusing the last result while nothing changed"""
+        cache = self._validation_cache
+        if cache is not None and cache[0] == self._data_serial and cache[1] is self.data:
+            return cache[2]
+        
+        # Dialogs list at most MAX_DIALOG_ERRORS; one extra error is enough
+        # to tell that the list was cut short
+        errors = self.data.validate(limit=MAX_DIALOG_ERRORS + 1)
+        self._validation_cache = (self._data_serial, self.data, errors)
+        return errors
+    
+    def _mark_data_dirty(self, event=None):
+        """Flag form data as changed since the last collect"""
+        self._data_dirty = True
+        self._data_serial += 1
+    
+    def _create_form_var(self) -> tk.StringVar:
+        """Create an entry variable that flags the form dirty on every write"""
+        # Unlike <KeyRelease>, the trace also sees mouse pastes and
+        # programmatic insert/delete calls
+        var = tk.StringVar()
+        var.trace_add('write', lambda *args: self._mark_data_dirty())
+        self._form_vars.append(var)
+        return var
+    
+    def _schedule_data_status_update(self):
+        """Debounce data status updates so bursts of edits trigger one scan"""
+        self._mark_data_dirty()
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(STATUS_UPDATE_DELAY_MS, self._update_data_status)
     
     def _update_data_status(self):
         """Update data status in status bar"""
+        self._status_after_id = None
         self._collect_data()
         
         # Count filled sections
@@ -851,157 +1046,38 @@ Get started by entering your data in the tabs!"""
     def _show_guide(self):
         """Show user guide"""
         guide_window = tk.Toplevel(self.root)
+        # Build the window hidden so the guide is laid out once, when shown
+        guide_window.withdraw()
         guide_window.title("📖 User Guide")
         guide_window.geometry("800x600")
-        
-        # Make it modal
         guide_window.transient(self.root)
-        guide_window.grab_set()
-        
-        # Create scrolled text
-        text = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font=('Arial', 10))
-        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        guide_text = f"""
-{APP_NAME} USER GUIDE
-{'='*50}
-
-🎯 PURPOSE
-This tool converts IDCA test results into professional visualizations for Word reports.
-
-📊 GENERATED VISUALIZATIONS
-• Figure 1: Test Coverage Analysis
-• Figure 2: Test Status Overview
-• Table 1: Assessment Summary
-• Table 2: MITRE ATT&CK Coverage
-• Table 3: Triggered Rules List
-• Table 4: Undetected Techniques
-• Table 5: Recommendations
-
-📝 DATA ENTRY
-
-1. GENERAL INFORMATION
-   - Company name and report date are required
-   - All fields support Turkish characters (ç, ğ, ı, ö, ş, ü)
-   - Fields with * are mandatory
-
-2. TEST RESULTS
-   - Enter total, tested, and triggered rule counts
-   - Other values are calculated automatically
-   - Real-time validation ensures data integrity
-
-3. MITRE ATT&CK
-   - Enter test and triggered counts for each tactic
-   - Success rates are calculated automatically
-   - Color coding: Green (≥70%), Orange (40-69%), Red (<40%)
-
-4. RULES
-   - List triggered rules with confidence scores
-   - List undetected techniques with criticality levels
-   - Use the table controls to add/remove rows
-
-5. RECOMMENDATIONS
-   - Priorities are auto-numbered
-   - Select categories from dropdowns
-   - Enter clear, actionable recommendation text
-
-💡 TIPS
-
-• VALIDATION: Red borders indicate validation errors
-• TABLES: Use "Add Row" to add more entries
-• PREVIEW: Select different visualizations to preview
-• THEMES: Try different themes for various report styles
-• SAVE: Use JSON format to save and resume work
-
-📁 GENERATING VISUALS
-
-1. Complete all required data fields
-2. Click "GENERATE VISUALS" button
-3. Select output directory if needed
-4. All images are saved as high-quality PNG files
-
-📋 ADDING TO WORD
-
-1. Insert PNG files into Word document
-2. Use "In Line with Text" layout option
-3. Disable compression for best quality (300 DPI)
-
-⚙️ SETTINGS
-
-• Figure dimensions: Adjust for your document layout
-• DPI: Higher values = better quality but larger files
-• Transparent background: Recommended for Word
-• Themes: Choose based on your report style
-
-⚠️ IMPORTANT NOTES
-
-• Numeric fields accept only numbers
-• Test rules ≤ Total rules
-• Triggered rules ≤ Test rules
-• Confidence scores: 0-100
-• Save frequently to avoid data loss
-
-For support or bug reports, contact your IT administrator.
-
-Happy reporting! 🚀
-"""
         
-        text.insert(tk.END, guide_text)
+        # Create scrolled text; the guide is read-only, so keep no undo history
+        text = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font=('Arial', 10),
+                                         undo=False)
+        text.insert(tk.END, _load_guide_text())
         text.config(state=tk.DISABLED)
         
         # Close button
-        ttk.Button(guide_window, text="Close", 
-                  command=guide_window.destroy).pack(pady=10)
+        close_button = ttk.Button(guide_window, text="Close",
+                                  command=guide_window.destroy)
+        close_button.pack(side=tk.BOTTOM, pady=10)
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Make it modal once it is visible
+        guide_window.deiconify()
+        guide_window.wait_visibility()
+        guide_window.grab_set()
     
     def _load_sample_data(self):
         """Load sample data for testing"""
-        sample = {
-            'general': {
-                'company_name': 'Example Corporation',
-                'report_date': 'January 2025',
-                'prepared_by': 'Security Team',
-                'report_id': 'IDCA-2025-001',
-                'report_title': 'Security Assessment Report',
-                'classification': 'Confidential'
-            },
-            'test_results': {
-                'total_rules': 291,
-                'tested_rules': 114,
-                'triggered_rules': 65
-            },
-            'mitre_tactics': {
-                'Initial Access': {'test': 8, 'triggered': 3, 'rate': 37.5},
-                'Execution': {'test': 12, 'triggered': 5, 'rate': 41.7},
-                'Persistence': {'test': 16, 'triggered': 8, 'rate': 50.0},
-                'Privilege Escalation': {'test': 10, 'triggered': 3, 'rate': 30.0}
-            },
-            'triggered_rules': [
-                {'name': 'Suspicious PowerShell Command', 'mitre': 'T1059.001',
-                 'tactic': 'Execution', 'confidence': '95'},
-                {'name': 'Brute Force Attack Detected', 'mitre': 'T1110',
-                 'tactic': 'Credential Access', 'confidence': '88'}
-            ],
-            'undetected_techniques': [
-                {'id': 'T1566.001', 'name': 'Spearphishing Attachment',
-                 'tactic': 'Initial Access', 'criticality': 'Critical'},
-                {'id': 'T1548.002', 'name': 'Bypass UAC',
-                 'tactic': 'Privilege Escalation', 'criticality': 'High'}
-            ],
-            'recommendations': [
-                {'priority': 'P1', 'category': 'Log Sources',
-                 'text': 'Enable Windows Security event logging on all critical servers'},
-                {'priority': 'P2', 'category': 'Rule Optimization',
-                 'text': 'Adjust threshold values for failed authentication rules'}
-            ]
-        }
-        
         try:
-            self.data = IDCAData.from_dict(sample)
+            self.data = IDCAData.from_dict(_SAMPLE_DATA)
             self._populate_forms()
             
             messagebox.showinfo("Success", "Sample data loaded successfully!")
             self.status_bar.set_status("Sample data loaded", 'success')
-            self._update_data_status()
+            self._schedule_data_status_update()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load sample data: {str(e)}")
@@ -1009,27 +1085,29 @@ Happy reporting! 🚀
     
     def _populate_forms(self):
         """Populate forms with current data"""
+        end = tk.END
+        
         # General info
+        general = self.data.general
         for key, widget in self.general_widgets.items():
-            value = getattr(self.data.general, key, '')
-            widget.delete(0, tk.END)
-            widget.insert(0, value)
+            widget.delete(0, end)
+            widget.insert(0, getattr(general, key, ''))
         
         # Test results
-        self.test_widgets['total_rules'].delete(0, tk.END)
-        self.test_widgets['total_rules'].insert(0, str(self.data.test_results.total_rules))
-        self.test_widgets['tested_rules'].delete(0, tk.END)
-        self.test_widgets['tested_rules'].insert(0, str(self.data.test_results.tested_rules))
-        self.test_widgets['triggered_rules'].delete(0, tk.END)
-        self.test_widgets['triggered_rules'].insert(0, str(self.data.test_results.triggered_rules))
+        test_results = self.data.test_results
+        for key in ('total_rules', 'tested_rules', 'triggered_rules'):
+            widget = self.test_widgets[key]
+            widget.delete(0, end)
+            widget.insert(0, str(getattr(test_results, key)))
         
         self._calculate_test_stats()
         
         # MITRE tactics
+        mitre_tactics = self.data.mitre_tactics
         mitre_data = {}
         for tactic in MITRE_TACTICS:
-            if tactic in self.data.mitre_tactics:
-                t = self.data.mitre_tactics[tactic]
+            t = mitre_tactics.get(tactic)
+            if t is not None:
                 mitre_data[tactic] = {
                     'test_count': t.test_count,
                     'triggered_count': t.triggered_count
@@ -1049,44 +1127,55 @@ Happy reporting! 🚀
             undetected_data.append([tech.mitre_id, tech.name, tech.tactic, tech.criticality])
         self.undetected_table.set_data(undetected_data)
         
-        # Recommendations
-        rec_data = []
-        for rec in self.data.recommendations:
-            rec_data.append([rec.priority, rec.category, rec.text])
+        # Recommendations - priorities are numbered by position
+        rec_data = [
+            [f"P{i}", rec.category, rec.text]
+            for i, rec in enumerate(self.data.recommendations, 1)
+        ]
         self.recommendations_table.set_data(rec_data)
-        
-        # Re-apply priority numbering
-        for i, row in enumerate(self.recommendations_table.entries):
-            if row and row[0].winfo_exists():
-                row[0].config(state='normal')
-                row[0].delete(0, tk.END)
-                row[0].insert(0, f"P{i+1}")
-                row[0].config(state='readonly')
     
     def _save_data(self):
         """Save data to JSON file"""
         self._collect_data()
         
-        # Validate
-        errors = self.data.validate()
+        # Validate; issues are reported together with the save result
+        errors = self._validate_data()
         if errors:
-            messagebox.showwarning("Validation Errors", 
-                                 "The following issues were found:\n\n" + "\n".join(errors[:5]))
+            self._queue_message('warning', "Validation Errors",
+                                "The following issues were found:\n\n" + _format_dialog_errors(errors))
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-            initialfile=f"IDCA_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            initialfile=_default_save_name('.json')
         )
         
         if filename:
             try:
                 self.data.save_to_json(filename)
-                messagebox.showinfo("Success", "Data saved successfully!")
+                self._queue_message('info', "Success", "Data saved successfully!")
                 self.status_bar.set_status(f"Saved to {Path(filename).name}", 'success')
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+                self._queue_message('error', "Error", f"Failed to save data: {str(e)}")
                 self.status_bar.set_status("Save failed", 'error')
+        
+        self._flush_messages()
+    
+    def _queue_message(self, kind: str, title: str, text: str):
+        """Queue a message for the next _flush_messages ('info', 'warning' or 'error')"""
+        self._pending_messages.append((kind, title, text))
+    
+    def _flush_messages(self):
+        """Show all queued messages in a single dialog"""
+        if not self._pending_messages:
+            return
+        
+        messages, self._pending_messages = self._pending_messages, []
+        # The most severe message decides the dialog type and title
+        kind, title, _ = max(messages, key=lambda m: _MESSAGE_SEVERITY[m[0]])
+        show = {'info': messagebox.showinfo, 'warning': messagebox.showwarning,
+                'error': messagebox.showerror}[kind]
+        show(title, "\n\n".join(text for _, _, text in messages))
     
     def _load_data(self):
         """Load data from JSON file"""
@@ -1100,7 +1189,7 @@ Happy reporting! 🚀
                 self._populate_forms()
                 messagebox.showinfo("Success", "Data loaded successfully!")
                 self.status_bar.set_status(f"Loaded {Path(filename).name}", 'success')
-                self._update_data_status()
+                self._schedule_data_status_update()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load data: {str(e)}")
                 self.status_bar.set_status("Load failed", 'error')
@@ -1144,35 +1233,27 @@ Happy reporting! 🚀
                     # Import triggered rules
                     triggered_rules = CSVHandler.import_triggered_rules(csv_data, dialog.result)
                     if triggered_rules:
-                        self.triggered_table.clear()
-                        for rule in triggered_rules:
-                            self.triggered_table.add_row([
-                                rule['name'],
-                                rule['mitre_id'],
-                                rule['tactic'],
-                                str(rule['confidence'])
-                            ])
-                            imported_count += 1
+                        self.triggered_table.set_data([
+                            [rule['name'], rule['mitre_id'], rule['tactic'], str(rule['confidence'])]
+                            for rule in triggered_rules
+                        ])
+                        imported_count += len(triggered_rules)
                     
                     # Import undetected techniques
                     undetected_techniques = CSVHandler.import_undetected_techniques(csv_data, dialog.result)
                     if undetected_techniques:
-                        self.undetected_table.clear()
-                        for tech in undetected_techniques:
-                            self.undetected_table.add_row([
-                                tech['mitre_id'],
-                                tech['name'],
-                                tech['tactic'],
-                                tech['criticality']
-                            ])
-                            imported_count += 1
+                        self.undetected_table.set_data([
+                            [tech['mitre_id'], tech['name'], tech['tactic'], tech['criticality']]
+                            for tech in undetected_techniques
+                        ])
+                        imported_count += len(undetected_techniques)
                     
                     # Calculate rates after import
                     self._calculate_mitre_rates()
                     
                     messagebox.showinfo("Success", f"Imported {imported_count} items from CSV")
                     self.status_bar.set_status(f"CSV import successful", 'success')
-                    self._update_data_status()
+                    self._schedule_data_status_update()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import CSV: {str(e)}")
@@ -1182,7 +1263,8 @@ Happy reporting! 🚀
         """Export data to CSV file(s)"""
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile=_default_save_name('.csv')
         )
         
         if filename:
@@ -1211,11 +1293,12 @@ Happy reporting! 🚀
         if messagebox.askyesno("Confirm Clear", 
                               "Are you sure you want to clear all data?\nThis cannot be undone."):
             # Clear forms
+            end = tk.END
             for widget in self.general_widgets.values():
-                widget.delete(0, tk.END)
+                widget.delete(0, end)
             
             for widget in self.test_widgets.values():
-                widget.delete(0, tk.END)
+                widget.delete(0, end)
             
             for label in self.calc_labels.values():
                 label.config(text="0")
@@ -1230,7 +1313,7 @@ Happy reporting! 🚀
             self.data = IDCAData()
             
             self.status_bar.set_status("All data cleared", 'warning')
-            self._update_data_status()
+            self._schedule_data_status_update()
     
     def _refresh_preview(self):
         """Refresh the preview"""
@@ -1247,17 +1330,18 @@ Happy reporting! 🚀
     
     def _generate_all_visuals(self):
         """Generate all visualizations"""
-        # Collect and validate data
+        # Collect and validate data; _collect_data is a no-op while the forms
+        # are clean and recomputes the derived values whenever it does run
         self._collect_data()
-        self.data.calculate_all_derived_values()
         
-        errors = self.data.validate()
+        errors = self._validate_data()
         if errors:
+            count = (str(len(errors)) if len(errors) <= MAX_DIALOG_ERRORS
+                     else f"more than {MAX_DIALOG_ERRORS}")
             response = messagebox.askyesnocancel(
                 "Validation Issues",
-                f"Found {len(errors)} validation issues:\n\n" + 
-                "\n".join(errors[:5]) + 
-                ("\n..." if len(errors) > 5 else "") +
+                f"Found {count} validation issues:\n\n" +
+                _format_dialog_errors(errors) +
                 "\n\nContinue anyway?"
             )
             if response != True:
@@ -1315,6 +1399,12 @@ Happy reporting! 🚀
                                                 font=('Courier', 9))
         results_text.pack(fill=tk.BOTH, expand=True)
         
+        # Modal while rendering: theme and background changes update the
+        # process-wide rcParams that the workers read, so they wait until
+        # the batch is done
+        progress.wait_visibility()
+        progress.grab_set()
+        
         # Update visualization settings
         try:
             width = float(self.visual_settings['fig_width'].get())
@@ -1326,73 +1416,61 @@ Happy reporting! 🚀
         except:
             pass
         
-        # Generate visualizations
-        visualizations = [
-            'Figure_1_Test_Coverage',
-            'Figure_2_Test_Status',
-            'Table_1_Summary',
-            'Table_2_MITRE_Coverage',
-            'Table_3_Triggered_Rules',
-            'Table_4_Undetected_Techniques',
-            'Table_5_Recommendations'
-        ]
-        
-        pbar['maximum'] = len(visualizations)
+        pbar['maximum'] = len(_VISUAL_SPECS)
+        label.config(text=f"Generating {len(_VISUAL_SPECS)} visuals...")
+        
+        # Charts are independent, so render them in a worker pool and
+        # collect the results on the Tk thread via after() polling. The
+        # workers get their own copy of the data and generator, so edits or
+        # theme changes made during the batch cannot reach a running render
+        data = copy.deepcopy(self.data)
+        executor = ThreadPoolExecutor(max_workers=min(len(_VISUAL_SPECS), os.cpu_count() or 1),
+                                      thread_name_prefix='idca-visual')
+        generator = self.visualization_generator.snapshot()
+        ranking = generator.rank_tactics(data)
+        futures = {executor.submit(_render_visual, generator, data, self.output_dir, spec, ranking): spec[0]
+                   for spec in _VISUAL_SPECS}
+        executor.shutdown(wait=False)
         
-        # Process
         success_count = 0
-        for i, visual_name in enumerate(visualizations):
-            label.config(text=f"Generating: {visual_name}")
-            details.config(text=f"({i+1}/{len(visualizations)}) {visual_name}.png")
-            pbar['value'] = i
-            progress.update()
+        
+        def poll():
+            nonlocal success_count
+            if not progress.winfo_exists():
+                return
             
-            try:
-                # Generate individual visualization
-                if visual_name == 'Figure_1_Test_Coverage':
-                    filepath = self.output_dir / f"{visual_name}.png"
-                    self.visualization_generator.generate_figure1(self.data, filepath)
-                elif visual_name == 'Figure_2_Test_Status':
-                    filepath = self.output_dir / f"{visual_name}.png"
-                    self.visualization_generator.generate_figure2(self.data, filepath)
-                elif visual_name == 'Table_1_Summary':
-                    filepath = self.output_dir / f"{visual_name}.png"
-                    self.visualization_generator.generate_table1(self.data, filepath)
-                elif visual_name == 'Table_2_MITRE_Coverage':
-                    if self.data.mitre_tactics:
-                        filepath = self.output_dir / f"{visual_name}.png"
-                        self.visualization_generator.generate_table2(self.data, filepath)
-                    else:
-                        raise Exception("No MITRE data")
-                elif visual_name == 'Table_3_Triggered_Rules':
-                    if self.data.triggered_rules:
-                        filepath = self.output_dir / f"{visual_name}.png"
-                        self.visualization_generator.generate_table3(self.data, filepath)
-                    else:
-                        raise Exception("No triggered rules data")
-                elif visual_name == 'Table_4_Undetected_Techniques':
-                    if self.data.undetected_techniques:
-                        filepath = self.output_dir / f"{visual_name}.png"
-                        self.visualization_generator.generate_table4(self.data, filepath)
-                    else:
-                        raise Exception("No undetected techniques data")
-                elif visual_name == 'Table_5_Recommendations':
-                    if self.data.recommendations:
-                        filepath = self.output_dir / f"{visual_name}.png"
-                        self.visualization_generator.generate_table5(self.data, filepath)
-                    else:
-                        raise Exception("No recommendations data")
-                
-                results_text.insert(tk.END, f"✅ {visual_name}.png\n")
-                success_count += 1
-                
-            except Exception as e:
-                results_text.insert(tk.END, f"❌ {visual_name}.png - {str(e)}\n")
+            # Everything that finished since the last poll is shown with one
+            # insert and one progress/details update
+            lines = []
+            for future in [f for f in futures if f.done()]:
+                visual_name = futures.pop(future)
+                error = future.exception()
+                if error is None:
+                    lines.append(f"✅ {visual_name}.png\n")
+                    success_count += 1
+                else:
+                    lines.append(f"❌ {visual_name}.png - {str(error)}\n")
             
-            results_text.see(tk.END)
+            if lines:
+                done = len(_VISUAL_SPECS) - len(futures)
+                pbar['value'] = done
+                details.config(text=f"({done}/{len(_VISUAL_SPECS)}) {visual_name}.png")
+                results_text.insert(tk.END, ''.join(lines))
+                results_text.see(tk.END)
+            
+            if futures:
+                self.root.after(VISUAL_POLL_INTERVAL_MS, poll)
+            else:
+                self._finish_visual_generation(progress, label, details,
+                                               success_count, len(_VISUAL_SPECS))
         
-        pbar['value'] = len(visualizations)
-        label.config(text=f"✅ Completed! {success_count}/{len(visualizations)} visuals generated")
+        poll()
+    
+    def _finish_visual_generation(self, progress: tk.Toplevel, label: ttk.Label,
+                                  details: ttk.Label, success_count: int, total: int):
+        """Show the final summary and actions in the progress window"""
+        progress.grab_release()
+        label.config(text=f"✅ Completed! {success_count}/{total} visuals generated")
         details.config(text=f"Output directory: {self.output_dir}")
         
         # Add background info
@@ -1426,8 +1504,41 @@ Happy reporting! 🚀
             messagebox.showerror("Error", f"Failed to open folder: {str(e)}")
 
 
+def _run_cli(args: List[str]) -> int:
+    """Render all visuals from a saved JSON file without creating a Tk window"""
+    if len(args) != 2:
+        print("Usage: main.py generate <input.json> <output_dir>", file=sys.stderr)
+        return 2
+    
+    _configure_matplotlib('Agg')
+    from core.visualizations import VisualizationGenerator
+    
+    data = IDCAData.load_from_json(args[0])
+    data.calculate_all_derived_values()
+    
+    output_dir = Path(args[1])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    generator = VisualizationGenerator(ThemeManager())
+    ranking = generator.rank_tactics(data)
+    
+    failures = 0
+    for spec in _VISUAL_SPECS:
+        try:
+            _render_visual(generator, data, output_dir, spec, ranking)
+            print(f"OK      {spec[0]}.png")
+        except Exception as e:
+            failures += 1
+            print(f"FAILED  {spec[0]}.png - {str(e)}")
+    
+    return 1 if failures else 0
+
+
 def main():
     """Main entry point"""
+    # Batch mode: 'generate <input.json> <output_dir>' (or --no-gui) skips Tk
+    if len(sys.argv) > 1 and sys.argv[1] in ('generate', '--no-gui'):
+        sys.exit(_run_cli(sys.argv[2:]))
+    
     root = tk.Tk()
     
     # Set encoding for Turkish characters
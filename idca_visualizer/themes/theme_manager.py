@@ -275,13 +275,18 @@ class ThemeManager:
         }
     
     def apply_to_matplotlib(self, transparent: bool = True):
-        """Apply current theme to matplotlib"""
-        import matplotlib.pyplot as plt
+        """Apply current theme to matplotlib
+        
+        Report generation calls this once per figure, so the validating
+        rcParams update is skipped when the values are already in place.
+        """
+        import matplotlib
         
         colors = self.get_matplotlib_colors()
         if not transparent:
             colors['figure.facecolor'] = self.get_color('background')
             colors['axes.facecolor'] = self.get_color('surface')
         
-        for key, value in colors.items():
-            plt.rcParams[key] = value
\ No newline at end of file
+        rc_params = matplotlib.rcParams
+        if any(rc_params[key] != value for key, value in colors.items()):
+            rc_params.update(colors)
\ No newline at end of file
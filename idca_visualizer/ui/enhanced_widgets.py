@@ -9,6 +9,8 @@ from tkinter import ttk
 from typing import List, Dict, Callable, Optional, Tuple
 import re
 
+from core.config import collation_key
+
 
 class MITRETable(ttk.Frame):
     """Enhanced table specifically for MITRE ATT&CK tactics with proper validation and symmetry"""
@@ -18,6 +20,9 @@ class MITRETable(ttk.Frame):
         
         self.tactics = tactics
         self.entries = []
+        # Parsed values per tactic, kept in sync by _validate_and_calculate
+        self._values: Dict[str, Dict] = {}
+        self._bulk_update = False
         self.on_change_callback = None
         
         self._create_ui()
@@ -122,9 +127,13 @@ class MITRETable(ttk.Frame):
             'rate_entry': rate_entry
         }
         self.entries.append(row_data)
+        self._values[tactic_name] = {'test_count': 0, 'triggered_count': 0, 'success_rate': 0.0}
     
     def _validate_and_calculate(self, row_frame):
         """Validate inputs and calculate success rate"""
+        if self._bulk_update:
+            return
+        
         # Find the row data
         row_data = None
         for entry in self.entries:
@@ -132,9 +141,11 @@ class MITRETable(ttk.Frame):
                 row_data = entry
                 break
         
-        if not row_data:
-            return
-        
+        if row_data:
+            self._calculate_row(row_data)
+    
+    def _calculate_row(self, row_data: Dict, notify: bool = True):
+        """Validate one row's inputs and update its success rate"""
         try:
             # Get values
             test_str = row_data['test_var'].get().strip()
@@ -144,6 +155,11 @@ class MITRETable(ttk.Frame):
             test_count = int(test_str) if test_str else 0
             triggered_count = int(triggered_str) if triggered_str else 0
             
+            values = self._values[row_data['tactic']]
+            values['test_count'] = test_count
+            values['triggered_count'] = triggered_count
+            values['success_rate'] = 0.0
+            
             # Validate logic
             if test_count < 0 or triggered_count < 0:
                 row_data['rate_var'].set("Error")
@@ -162,6 +178,7 @@ class MITRETable(ttk.Frame):
             if test_count > 0:
                 rate = (triggered_count / test_count) * 100
                 row_data['rate_var'].set(f"{rate:.1f}")
+                values['success_rate'] = float(f"{rate:.1f}")
                 
                 # Color coding
                 if rate >= 70:
@@ -175,53 +192,57 @@ class MITRETable(ttk.Frame):
                 row_data['rate_entry'].configure(foreground='gray')
             
             # Trigger callback if set
-            if self.on_change_callback:
+            if notify and self.on_change_callback:
                 self.on_change_callback()
                 
         except ValueError:
             # Non-numeric input
+            self._values[row_data['tactic']] = {'test_count': 0, 'triggered_count': 0, 'success_rate': 0.0}
             if row_data['test_var'].get() or row_data['triggered_var'].get():
                 row_data['rate_var'].set("---")
                 row_data['rate_entry'].configure(foreground='gray')
     
     def get_data(self) -> List[Dict[str, any]]:
         """Get all table data"""
-        data = []
-        for entry in self.entries:
-            try:
-                test_count = int(entry['test_var'].get() or 0)
-                triggered_count = int(entry['triggered_var'].get() or 0)
-                success_rate = float(entry['rate_var'].get()) if entry['rate_var'].get() not in ['Error', '---', ''] else 0.0
-            except:
-                test_count = 0
-                triggered_count = 0
-                success_rate = 0.0
-            
-            data.append({
-                'tactic': entry['tactic'],
-                'test_count': test_count,
-                'triggered_count': triggered_count,
-                'success_rate': success_rate
-            })
-        
-        return data
+        return [
+            {'tactic': tactic, **values}
+            for tactic, values in self._values.items()
+        ]
     
     def set_data(self, data: Dict[str, Dict]):
-        """Set table data from dictionary"""
-        for entry in self.entries:
-            tactic_name = entry['tactic']
-            if tactic_name in data:
-                tactic_data = data[tactic_name]
-                entry['test_var'].set(str(tactic_data.get('test_count', '')))
-                entry['triggered_var'].set(str(tactic_data.get('triggered_count', '')))
+        """Set table data from dictionary
+        
+        Tactics missing from data are emptied, so the table always shows
+        exactly the given data.
+        """
+        # Fill both cells of every row first so each row is validated once
+        # with final values rather than once per variable write
+        changed_rows = []
+        self._bulk_update = True
+        try:
+            for entry in self.entries:
+                tactic_data = data.get(entry['tactic'], {})
+                test = str(tactic_data.get('test_count', ''))
+                triggered = str(tactic_data.get('triggered_count', ''))
+                # Unchanged rows need no variable writes or recalculation
+                if entry['test_var'].get() == test and entry['triggered_var'].get() == triggered:
+                    continue
+                entry['test_var'].set(test)
+                entry['triggered_var'].set(triggered)
+                changed_rows.append(entry)
+        finally:
+            self._bulk_update = False
+        
+        for entry in changed_rows:
+            self._calculate_row(entry, notify=False)
+        
+        # One change notification for the whole update
+        if changed_rows and self.on_change_callback:
+            self.on_change_callback()
     
     def clear(self):
         """Clear all data"""
-        for entry in self.entries:
-            entry['test_var'].set('')
-            entry['triggered_var'].set('')
-            entry['rate_var'].set('0.0')
-            entry['rate_entry'].configure(foreground='gray')
+        self.set_data({})
     
     def set_on_change_callback(self, callback: Callable):
         """Set callback to be triggered on data change"""
@@ -241,7 +262,7 @@ class AutoCompleteCombobox(ttk.Combobox):
     
     def set_completion_list(self, completion_list):
         """Set the list of possible completions"""
-        self._completion_list = sorted(completion_list, key=str.lower)
+        self._completion_list = sorted(completion_list, key=collation_key)
         self['values'] = self._completion_list
     
     def _handle_keyrelease(self, event):
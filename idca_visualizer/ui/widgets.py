@@ -68,63 +68,60 @@ class ValidatedEntry(ttk.Entry):
 
 
 class EnhancedTable(ttk.Frame):
-    """Enhanced table widget with better UX"""
+    """Enhanced table widget with better UX
+    
+    Rows live in a single ttk.Treeview backed by a Python-side row model,
+    so loading and reading data costs one Tk call per row (or none, for
+    reads) instead of one per cell. Cells are edited through a single
+    Entry overlaid on the double-clicked cell.
+    """
     
     def __init__(self, parent, columns: List[str], rows: int = 10, 
-                 column_widths: List[int] = None, **kwargs):
+                 column_widths: List[int] = None, readonly_columns: List[int] = None,
+                 new_row_values: Callable[[int], List[str]] = None,
+                 column_formatters: Dict[int, Callable[[str], str]] = None, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.columns = columns
         self.initial_rows = rows
-        self.entries = []
         self.column_widths = column_widths or [15] * len(columns)
+        self.readonly_columns = set(readonly_columns or ())
+        self.new_row_values = new_row_values
+        # Normalize cell text once, when it enters the table
+        self.column_formatters = column_formatters or {}
+        self.on_change_callback = None
+        
+        # Row values keyed by Treeview item id, in display order
+        self._rows: Dict[str, List[str]] = {}
+        self._editor = None
         
         # Create UI
-        self._create_header()
-        self._create_scrollable_area()
+        self._create_tree()
         self._create_initial_rows()
         self._create_controls()
         
         # Configure grid weights
-        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
     
-    def _create_header(self):
-        """Create table header"""
-        header_frame = ttk.Frame(self)
-        header_frame.grid(row=0, column=0, sticky='ew', padx=1)
-        
-        for j, (col, width) in enumerate(zip(self.columns, self.column_widths)):
-            label = ttk.Label(header_frame, text=col, font=('Arial', 10, 'bold'))
-            label.grid(row=0, column=j, sticky='ew', padx=2, pady=5)
-            header_frame.grid_columnconfigure(j, weight=1, minsize=width*8)
-    
-    def _create_scrollable_area(self):
-        """Create scrollable area for table rows"""
-        # Create canvas and scrollbar
-        canvas = tk.Canvas(self, bg='white', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+    def _create_tree(self):
+        """Create the Treeview holding the table rows"""
+        column_ids = [f"c{j}" for j in range(len(self.columns))]
+        self.tree = ttk.Treeview(self, columns=column_ids, show='headings',
+                                 height=max(self.initial_rows, 5), selectmode='extended')
         
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        for column_id, col, width in zip(column_ids, self.columns, self.column_widths):
+            self.tree.heading(column_id, text=col)
+            self.tree.column(column_id, width=width * 8, minwidth=40, stretch=True)
         
-        # Grid layout
-        canvas.grid(row=1, column=0, sticky='nsew')
-        scrollbar.grid(row=1, column=1, sticky='ns')
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
         
-        # Mouse wheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar.grid(row=0, column=1, sticky='ns')
         
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        
-        self.canvas = canvas
+        self.tree.bind('<Double-1>', self._begin_edit)
+        self.tree.bind('<Delete>', lambda e: self.remove_selected_rows())
     
     def _create_initial_rows(self):
         """Create initial empty rows"""
@@ -134,10 +131,12 @@ class EnhancedTable(ttk.Frame):
     def _create_controls(self):
         """Create control buttons"""
         control_frame = ttk.Frame(self)
-        control_frame.grid(row=2, column=0, sticky='ew', pady=5)
+        control_frame.grid(row=1, column=0, sticky='ew', pady=5)
         
         ttk.Button(control_frame, text="➕ Add Row", 
                   command=self.add_row).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="❌ Remove Selected", 
+                  command=self.remove_selected_rows).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="🗑️ Clear All", 
                   command=self.clear).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="🧹 Remove Empty", 
@@ -145,68 +144,70 @@ class EnhancedTable(ttk.Frame):
     
     def add_row(self, data: List[str] = None):
         """Add a new row to the table"""
-        row_frame = ttk.Frame(self.scrollable_frame)
-        row_frame.pack(fill='x', padx=1, pady=1)
-        
-        row_entries = []
-        for j, width in enumerate(self.column_widths):
-            entry = ttk.Entry(row_frame, width=width)
-            entry.grid(row=0, column=j, sticky='ew', padx=2)
-            
-            if data and j < len(data):
-                entry.insert(0, str(data[j]))
-            
-            row_entries.append(entry)
-            row_frame.grid_columnconfigure(j, weight=1)
-        
-        # Add remove button
-        remove_btn = ttk.Button(row_frame, text="❌", width=3,
-                               command=lambda: self.remove_row(row_frame, row_entries))
-        remove_btn.grid(row=0, column=len(self.columns), padx=2)
-        
-        self.entries.append(row_entries)
-        
-        # Update scroll region
-        self.canvas.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        if data is None and self.new_row_values:
+            data = self.new_row_values(len(self._rows))
+        
+        values = [''] * len(self.columns)
+        for j, value in enumerate((data or [])[:len(self.columns)]):
+            values[j] = str(value)
+        for j, formatter in self.column_formatters.items():
+            values[j] = formatter(values[j])
+        
+        iid = self.tree.insert('', 'end', values=values)
+        self._rows[iid] = values
     
-    def remove_row(self, row_frame: ttk.Frame, row_entries: List[ttk.Entry]):
-        """Remove a specific row"""
-        row_frame.destroy()
-        if row_entries in self.entries:
-            self.entries.remove(row_entries)
-        
-        # Update scroll region
-        self.canvas.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def remove_selected_rows(self):
+        """Remove the selected rows"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        
+        self._cancel_edit()
+        self.tree.delete(*selection)
+        for iid in selection:
+            self._rows.pop(iid, None)
+        self._renumber_rows()
+        
+        self._notify_change()
     
     def remove_empty_rows(self):
         """Remove all empty rows"""
-        rows_to_remove = []
+        rows_to_remove = [iid for iid, values in self._rows.items()
+                          if all(not value.strip() for value in values)]
         
-        for row_entries in self.entries:
-            if all(not entry.get().strip() for entry in row_entries):
-                rows_to_remove.append(row_entries)
+        if rows_to_remove:
+            self._cancel_edit()
+            self.tree.delete(*rows_to_remove)
+            for iid in rows_to_remove:
+                del self._rows[iid]
+            self._renumber_rows()
         
-        for row in rows_to_remove:
-            # Find and destroy the parent frame
-            if row and row[0].winfo_exists():
-                row[0].master.destroy()
-            self.entries.remove(row)
-        
-        # Update scroll region
-        self.canvas.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._notify_change()
+    
+    def _renumber_rows(self):
+        """Regenerate the read-only new_row_values cells after rows are removed
+        
+        Keeps generated values such as priorities contiguous, so the next
+        added row does not repeat one the user cannot edit.
+        """
+        if not self.new_row_values or not self.readonly_columns:
+            return
+        
+        for index, (iid, values) in enumerate(self._rows.items()):
+            generated = self.new_row_values(index)
+            for j in self.readonly_columns:
+                if values[j] != generated[j]:
+                    values[j] = generated[j]
+                    self.tree.set(iid, f"c{j}", generated[j])
     
     def get_data(self) -> List[List[str]]:
         """Get all non-empty table data"""
+        # Values are read from the row model, not from Tk
         data = []
-        for row in self.entries:
-            if any(entry.winfo_exists() for entry in row):
-                row_data = [entry.get().strip() if entry.winfo_exists() else "" 
-                           for entry in row]
-                if any(row_data):  # Only include non-empty rows
-                    data.append(row_data)
+        for values in self._rows.values():
+            row_data = [value.strip() for value in values]
+            if any(row_data):  # Only include non-empty rows
+                data.append(row_data)
         return data
     
     def set_data(self, data: List[List[str]]):
@@ -217,13 +218,74 @@ class EnhancedTable(ttk.Frame):
     
     def clear(self):
         """Clear all rows"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.entries.clear()
+        self._cancel_edit()
+        if self._rows:
+            self.tree.delete(*self._rows)
+            self._rows.clear()
         
-        # Update scroll region
-        self.canvas.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._notify_change()
+    
+    def _begin_edit(self, event):
+        """Overlay an Entry on the double-clicked cell"""
+        self._cancel_edit()
+        
+        iid = self.tree.identify_row(event.y)
+        column_id = self.tree.identify_column(event.x)
+        if not iid or not column_id:
+            return
+        
+        col = int(column_id[1:]) - 1
+        if col in self.readonly_columns:
+            return
+        
+        bbox = self.tree.bbox(iid, column_id)
+        if not bbox:
+            return
+        
+        x, y, width, height = bbox
+        editor = ttk.Entry(self.tree)
+        editor.insert(0, self._rows[iid][col])
+        editor.select_range(0, tk.END)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        
+        editor.bind('<Return>', lambda e: self._commit_edit())
+        editor.bind('<FocusOut>', lambda e: self._commit_edit())
+        editor.bind('<Escape>', lambda e: self._cancel_edit())
+        self._editor = (editor, iid, col)
+    
+    def _commit_edit(self):
+        """Write the editor value back to its cell"""
+        if self._editor is None:
+            return
+        
+        editor, iid, col = self._editor
+        value = editor.get()
+        formatter = self.column_formatters.get(col)
+        if formatter is not None:
+            value = formatter(value)
+        self._cancel_edit()
+        
+        if iid in self._rows and self._rows[iid][col] != value:
+            self._rows[iid][col] = value
+            self.tree.set(iid, f"c{col}", value)
+            self._notify_change()
+    
+    def _cancel_edit(self):
+        """Discard the cell editor, if any"""
+        if self._editor is not None:
+            editor = self._editor[0]
+            self._editor = None
+            editor.destroy()
+    
+    def _notify_change(self):
+        """Trigger change callback after rows are edited or removed"""
+        if self.on_change_callback:
+            self.on_change_callback()
+    
+    def set_on_change_callback(self, callback: Callable):
+        """Set callback to be triggered when rows are edited or removed"""
+        self.on_change_callback = callback
 
 
 class CollapsibleFrame(ttk.Frame):
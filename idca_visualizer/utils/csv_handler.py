@@ -11,7 +11,11 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import tkinter as tk
 from tkinter import ttk, messagebox
-# pandas import removed for testing environment
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; fall back to the csv module
+    pd = None
 
 
 @dataclass
@@ -163,26 +167,78 @@ class CSVHandler:
     @staticmethod
     def import_mitre_tactics(csv_data: List[Dict[str, str]], mappings: Dict[str, str]) -> Dict[str, Dict]:
         """Import MITRE tactics from CSV data"""
-        tactics = {}
-        
         tactic_name_col = mappings.get('MITRE.Tactic Name')
         test_count_col = mappings.get('MITRE.Test Count')
         triggered_count_col = mappings.get('MITRE.Triggered Count')
         
         if not tactic_name_col:
-            return tactics
+            return {}
         
+        if pd is not None:
+            return CSVHandler._import_mitre_tactics_vectorized(
+                csv_data, tactic_name_col, test_count_col, triggered_count_col
+            )
+        
+        # Without pandas apply the same row filter as the vectorized path
+        tactics = {}
         for row in csv_data:
-            tactic_name = row.get(tactic_name_col, '').strip()
-            if tactic_name:
+            tactic_name = (row.get(tactic_name_col) or '').strip()
+            test_str = (row.get(test_count_col) or '0').strip() if test_count_col else '0'
+            triggered_str = (row.get(triggered_count_col) or '0').strip() if triggered_count_col else '0'
+            if tactic_name and test_str.isdecimal() and triggered_str.isdecimal():
+                test_count = int(test_str)
+                triggered_count = int(triggered_str)
+                if triggered_count > test_count:
+                    continue
                 tactics[tactic_name] = {
                     'name': tactic_name,
-                    'test_count': int(row.get(test_count_col, 0)) if test_count_col else 0,
-                    'triggered_count': int(row.get(triggered_count_col, 0)) if triggered_count_col else 0
+                    'test_count': test_count,
+                    'triggered_count': triggered_count,
+                    'success_rate': (triggered_count / test_count * 100) if test_count > 0 else 0.0
                 }
         
         return tactics
     
+    @staticmethod
+    def _import_mitre_tactics_vectorized(csv_data: List[Dict[str, str]], tactic_name_col: str,
+                                         test_count_col: Optional[str],
+                                         triggered_count_col: Optional[str]) -> Dict[str, Dict]:
+        """Parse MITRE tactic rows in a single pandas pass"""
+        df = pd.DataFrame.from_records(csv_data)
+        if df.empty or tactic_name_col not in df:
+            return {}
+        
+        frame = pd.DataFrame({
+            'name': df[tactic_name_col].fillna('').astype(str).str.strip(),
+            'test_count': df[test_count_col] if test_count_col in df else 0,
+            'triggered_count': df[triggered_count_col] if triggered_count_col in df else 0
+        })
+        frame = frame[frame['name'] != '']
+        
+        # Drop rows with non-numeric or inconsistent counts in one pass. Only
+        # decimal strings are kept, like str.isdecimal() in the stdlib path,
+        # and they are parsed with Python int so large counts stay exact
+        counts = {
+            col: frame[col].fillna('').astype(str).replace('', '0').str.strip()
+            for col in ('test_count', 'triggered_count')
+        }
+        valid = counts['test_count'].str.isdecimal() & counts['triggered_count'].str.isdecimal()
+        test = counts['test_count'][valid].map(int)
+        triggered = counts['triggered_count'][valid].map(int)
+        consistent = triggered <= test
+        frame = frame[valid][consistent]
+        
+        # Later rows win for duplicate tactic names, same as the dict loop
+        return {
+            name: {
+                'name': name,
+                'test_count': int(tc),
+                'triggered_count': int(trc),
+                'success_rate': (int(trc) / int(tc) * 100) if tc > 0 else 0.0
+            }
+            for name, tc, trc in zip(frame['name'], test[consistent], triggered[consistent])
+        }
+    
     @staticmethod
     def import_triggered_rules(csv_data: List[Dict[str, str]], mappings: Dict[str, str]) -> List[Dict]:
         """Import triggered rules from CSV data"""